@@ -0,0 +1,124 @@
+"""
+CIPHER Sniper Bot - Event Decoding Benchmark
+Decode throughput per PumpPortal message type (new token, trade,
+subscription ack): the old json.loads + dict probing path against
+events.decode() on the stdlib and orjson backends, from str and bytes.
+
+Usage:
+    python benchmarks/bench_decode.py [--messages 20000]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="cipher_decode_"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from events import JSON_BACKEND, NewToken, decode
+
+B58 = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+REPEATS = 5
+
+
+def fake_key(rng: random.Random) -> str:
+    return "".join(rng.choice(B58) for _ in range(44))
+
+
+def frames(n: int) -> dict:
+    """PumpPortal-shaped frames with every field the feed sends"""
+    rng = random.Random(42)
+    new_tokens, trades = [], []
+    for i in range(n):
+        new_tokens.append(json.dumps({
+            "signature": fake_key(rng) + fake_key(rng), "mint": fake_key(rng),
+            "traderPublicKey": fake_key(rng), "txType": "create",
+            "initialBuy": 51_234_567.123456, "solAmount": 1.5,
+            "bondingCurveKey": fake_key(rng), "vTokensInBondingCurve": 1_021_765_432.876543,
+            "vSolInBondingCurve": 31.5, "marketCapSol": 30.82907,
+            "name": f"Bench Token {i}", "symbol": "BNCH",
+            "uri": "https://ipfs.io/ipfs/Qm" + fake_key(rng), "pool": "pump",
+        }))
+        trades.append(json.dumps({
+            "signature": fake_key(rng) + fake_key(rng), "mint": fake_key(rng),
+            "traderPublicKey": fake_key(rng), "txType": "buy" if i % 3 else "sell",
+            "tokenAmount": 12_345_678.901234, "solAmount": 0.35 + i * 1e-6,
+            "newTokenBalance": 12_345_678.901234, "bondingCurveKey": fake_key(rng),
+            "vTokensInBondingCurve": 998_765_432.1, "vSolInBondingCurve": 32.2,
+            "marketCapSol": 32.27, "pool": "pump",
+        }))
+    acks = [json.dumps({"message": "Successfully subscribed to keys."})] * n
+    return {"new_token": new_tokens, "trade": trades, "ack": acks}
+
+
+def dict_path(message):
+    """What _handle_message did before: loads into a dict, probe, .get() fields"""
+    data = json.loads(message)
+    tx_type = data.get("txType")
+    if tx_type == "buy" or tx_type == "sell":
+        sol_amount = data.get("solAmount", 0)
+        token_amount = data.get("tokenAmount", 0)
+        return (data.get("mint"), data.get("traderPublicKey") or "", tx_type == "buy",
+                sol_amount, token_amount, data.get("marketCapSol", 0))
+    if "mint" in data:
+        return (data.get("mint"), data.get("traderPublicKey") or data.get("creator"),
+                data.get("name", "Unknown"), data.get("symbol", "???"), data.get("uri"),
+                data.get("bondingCurveKey"), data.get("solAmount", 0), data.get("initialBuy", 0))
+    return None
+
+
+def rate(fn, messages) -> float:
+    """Best of REPEATS, messages per second"""
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for m in messages:
+            fn(m)
+        best = min(best, time.perf_counter() - start)
+    return len(messages) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event decode throughput per message type")
+    parser.add_argument("--messages", type=int, default=20000)
+    args = parser.parse_args()
+
+    variants = [
+        ("json.loads + dict", dict_path, False),
+        ("decode (json)", lambda m: decode(m, json.loads), False),
+    ]
+    if JSON_BACKEND == "orjson":
+        variants += [
+            ("decode (orjson, str)", decode, False),
+            ("decode (orjson, bytes)", decode, True),
+        ]
+    else:
+        print("orjson not installed: stdlib backend only")
+
+    print(f"{args.messages} messages per type, best of {REPEATS} (k msg/s)")
+    by_type = frames(args.messages)
+    print(f"  {'':<24}" + "".join(f"{kind:>12}" for kind in by_type))
+    for label, fn, as_bytes in variants:
+        row = []
+        for messages in by_type.values():
+            if as_bytes:
+                messages = [m.encode() for m in messages]
+            row.append(rate(fn, messages) / 1000)
+        print(f"  {label:<24}" + "".join(f"{r:>12.0f}" for r in row))
+
+    sample = by_type["new_token"][0]
+    event = decode(sample)
+    assert type(event) is NewToken and event.initial_buy == 51_234_567.123456
+    parsed = json.loads(sample)
+    dict_bytes = sys.getsizeof(parsed) + sum(sys.getsizeof(v) for v in parsed.values())
+    event_bytes = sys.getsizeof(event) + sum(sys.getsizeof(getattr(event, f)) for f in NewToken.__slots__)
+    print(f"  retained per new token: dict {dict_bytes} B ({len(parsed)} fields) | "
+          f"NewToken {event_bytes} B ({len(NewToken.__slots__)} fields)")
+
+
+if __name__ == "__main__":
+    main()
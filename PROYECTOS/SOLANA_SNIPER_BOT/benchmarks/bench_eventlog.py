@@ -0,0 +1,98 @@
+"""
+CIPHER Sniper Bot - Event Log Benchmark
+Per-call cost of the four-line new token print() versus event_log.info()
+while stdout is a pipe drained slowly (a log collector falling behind),
+plus how fast the writer thread gets the records to disk.
+
+Usage:
+    python benchmarks/bench_eventlog.py [--records 20000] [--drain-kbps 512]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="cipher_log_"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from collector import NEW_TOKEN_CONSOLE
+from eventlog import EventLog
+
+B58 = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+CHUNK = 4096
+
+
+def fake_key(rng: random.Random) -> str:
+    return "".join(rng.choice(B58) for _ in range(44))
+
+
+def slow_stdout(kbps: int):
+    """Replace stdout with a pipe whose reader only drains `kbps` KB/s"""
+    r, w = os.pipe()
+
+    def drain():
+        while os.read(r, CHUNK):
+            time.sleep(CHUNK / (kbps * 1024))
+
+    threading.Thread(target=drain, daemon=True).start()
+    real = sys.stdout
+    sys.stdout = os.fdopen(w, "w", buffering=1)
+    return real
+
+
+def summarize(name: str, samples: list, total: float, out):
+    samples.sort()
+    p99 = samples[int(len(samples) * 0.99)]
+    print(f"  {name:<16} {len(samples) / total:>10.0f} calls/s | mean {statistics.mean(samples):>8.1f} us | "
+          f"p99 {p99:>8.1f} us | max {samples[-1] / 1000:>7.1f} ms", file=out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event log vs print() under a slow stdout")
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--drain-kbps", type=int, default=512, help="stdout pipe drain rate")
+    args = parser.parse_args()
+
+    rng = random.Random(41)
+    tokens = [dict(mint=fake_key(rng), symbol="BN", name=f"Bench {i}", creator=fake_key(rng),
+                   creator_tokens=i % 9 + 1, creator_score=50.0, collected=i)
+              for i in range(args.records)]
+    real = slow_stdout(args.drain_kbps)
+    print(f"{args.records} new tokens, stdout drained at {args.drain_kbps} KB/s", file=real)
+
+    samples = []
+    start = time.perf_counter()
+    for t in tokens:
+        t0 = time.perf_counter()
+        print(f"\n[NEW TOKEN] {t['symbol']} ({t['name']})")
+        print(f"  Mint: {t['mint'][:20]}...")
+        print(f"  Creator: {t['creator'][:20]}... (tokens: {t['creator_tokens']}, score: {t['creator_score']})")
+        print(f"  Total collected: {t['collected']}")
+        samples.append((time.perf_counter() - t0) * 1e6)
+    summarize("print()", samples, time.perf_counter() - start, real)
+
+    log = EventLog("bench", Path(tempfile.mkdtemp(prefix="cipher_log_")))
+    log.start()
+    samples = []
+    start = time.perf_counter()
+    for t in tokens:
+        t0 = time.perf_counter()
+        log.info("new_token", NEW_TOKEN_CONSOLE, **t)
+        samples.append((time.perf_counter() - t0) * 1e6)
+    summarize("event_log.info()", samples, time.perf_counter() - start, real)
+
+    start = time.perf_counter()
+    log.close(timeout=60)
+    drained = time.perf_counter() - start
+    lines = sum(1 for _ in open(log.path, "rb"))
+    print(f"  writer thread: {lines} JSON lines on disk, {drained * 1000:.0f} ms to drain "
+          f"after the last call, {log.dropped} dropped", file=real)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+CIPHER Sniper Bot - Event Ring Benchmark
+Cross-process throughput and latency of the shared memory ring used by
+`main.py --split`, with a consumer process that only decodes records.
+
+Usage:
+    python benchmarks/bench_ipc.py [--events 200000] [--rate 0]
+"""
+import argparse
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ipc import EVENT_TRADE, RECORD, EventRing, LatencyStats
+
+CAPACITY = 16384
+MINT = "7GCihgDB8fe6KNjn2MYtkzZcRjQy3t9GHdC8uHYmW2hr"
+TRADER = "5tzFkiKscXHK5ZXCGbXZxdw7gTjjD1mBwuoFbhUvuAi9"
+
+
+def consumer(name: str, events: int, result):
+    ring = EventRing.attach(name, CAPACITY)
+    stats = LatencyStats(window=65536)
+    received = 0
+    start = None
+    while received < events:
+        batch = ring.pop_batch()
+        if not batch:
+            continue  # busy-poll: measures the ring, not the sleep granularity
+        if start is None:
+            start = time.perf_counter()
+        now_ns = time.monotonic_ns()
+        for rec in batch:
+            stats.observe(rec, now_ns)
+        received += len(batch)
+    elapsed = time.perf_counter() - start
+    summary = stats.summary()
+    summary["events_per_sec"] = received / elapsed
+    result.update(summary)
+    ring.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shared memory ring benchmark")
+    parser.add_argument("--events", type=int, default=200000)
+    parser.add_argument("--rate", type=int, default=0,
+                        help="Producer rate limit in events/s (0 = as fast as possible)")
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    manager = ctx.Manager()
+    result = manager.dict()
+    ring = EventRing.create(CAPACITY)
+
+    proc = ctx.Process(target=consumer, args=(ring.name, args.events, result))
+    proc.start()
+    time.sleep(0.5)  # let the consumer attach
+
+    interval = 1.0 / args.rate if args.rate else 0
+    sent = 0
+    start = time.perf_counter()
+    while sent < args.events:
+        if ring.push(EVENT_TRADE, MINT, TRADER, sol_amount=0.5,
+                     token_amount=1.5e7, mcap=31.2, is_buy=True):
+            sent += 1
+            if interval:
+                time.sleep(interval)
+    produce_s = time.perf_counter() - start
+    proc.join()
+
+    print(f"Record size:      {RECORD.size} bytes")
+    print(f"Producer:         {sent / produce_s:,.0f} ev/s (full ring retries: {ring.dropped})")
+    print(f"Consumer:         {result['events_per_sec']:,.0f} ev/s")
+    print(f"Latency:          p50 {result['p50_us']:.1f}us | p99 {result['p99_us']:.1f}us "
+          f"| max {result['max_us']:.1f}us")
+    ring.close()
+    manager.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+CIPHER Sniper Bot - Token Metadata Fetcher Benchmark
+Runs the fetcher against a local aiohttp server standing in for IPFS
+gateways and metadata hosts. Checks each failure path (retry on 5xx,
+timeout, oversized body, invalid JSON), the content-hash cache and the
+get() budget, then measures concurrent fetch throughput.
+
+Usage:
+    python benchmarks/bench_metadata.py [--tokens 2000] [--latency-ms 20]
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="cipher_metadata_"))
+os.environ.setdefault("METRICS_PORT", "0")
+os.environ.setdefault("METADATA_TIMEOUT", "0.5")
+os.environ.setdefault("METADATA_RETRIES", "2")
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from aiohttp import web
+
+import metadata as metadata_module
+from config import METADATA_MAX_BYTES, METADATA_PER_HOST, METADATA_RETRIES, METADATA_TIMEOUT
+from database import db
+from metadata import MetadataFetcher
+
+metadata_module.RETRY_BACKOFF = 0.01  # keep retry checks fast
+
+
+def document(i: int) -> bytes:
+    return json.dumps({
+        "name": f"Bench {i}", "symbol": "BNCH", "description": "x" * 200,
+        "image": f"https://ipfs.io/ipfs/Qm{i:044d}",
+        "twitter": "https://x.com/bench", "telegram": "https://t.me/bench",
+    }).encode()
+
+
+class MockHost:
+    """Metadata host with one route per behaviour, counting requests"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.requests = 0
+        self.flaky_hits = {}
+
+    async def ok(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+        return web.Response(body=document(int(request.match_info["i"])), content_type="application/json")
+
+    async def copy(self, request: web.Request) -> web.Response:
+        # Same document behind every URI, as copy-paste launches do
+        self.requests += 1
+        return web.Response(body=document(0), content_type="application/json")
+
+    async def flaky(self, request: web.Request) -> web.Response:
+        # 503 on the first `fails` attempts for each key, then the document
+        self.requests += 1
+        key = request.match_info["key"]
+        fails = int(request.match_info["fails"])
+        self.flaky_hits[key] = self.flaky_hits.get(key, 0) + 1
+        if self.flaky_hits[key] <= fails:
+            return web.Response(status=503)
+        return web.Response(body=document(1), content_type="application/json")
+
+    async def missing(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        return web.Response(status=404)
+
+    async def slow(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        await asyncio.sleep(float(request.match_info["seconds"]))
+        return web.Response(body=document(2), content_type="application/json")
+
+    async def big(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        return web.Response(body=b"{" + b" " * (METADATA_MAX_BYTES + 1) + b"}",
+                            content_type="application/json")
+
+    async def bad(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        return web.Response(body=b"<html>gateway error</html>", content_type="text/html")
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/ok/{i}", self.ok)
+        app.router.add_get("/copy/{i}", self.copy)
+        app.router.add_get("/flaky/{key}/{fails}", self.flaky)
+        app.router.add_get("/missing", self.missing)
+        app.router.add_get("/slow/{seconds}", self.slow)
+        app.router.add_get("/big", self.big)
+        app.router.add_get("/bad", self.bad)
+        return app
+
+
+async def saved_error(mint: str):
+    rows = await (await db.conn.execute(
+        "SELECT error FROM token_metadata WHERE mint = ?", (mint,))).fetchall()
+    return rows[0][0] if rows else "<not saved>"
+
+
+def check(name: str, ok: bool, detail: str = ""):
+    print(f"  {'ok  ' if ok else 'FAIL'} {name}{': ' + detail if detail else ''}")
+    if not ok:
+        raise SystemExit(1)
+
+
+async def run_checks(base: str, host: MockHost):
+    print(f"Failure paths (timeout {METADATA_TIMEOUT}s, {METADATA_RETRIES} retries)")
+    fetcher = MetadataFetcher()
+
+    # Retry on 5xx: two 503s, then the document
+    before = host.requests
+    meta = await fetcher._fetch("flaky-ok", f"{base}/flaky/a/{METADATA_RETRIES}")
+    check("5xx retried until success", meta is not None and meta["name"] == "Bench 1",
+                f"{host.requests - before} requests")
+
+    # 5xx on every attempt: gives up after the retries
+    before = host.requests
+    meta = await fetcher._fetch("flaky-fail", f"{base}/flaky/b/99")
+    error = await saved_error("flaky-fail")
+    check("5xx gives up after retries",
+                meta is None and host.requests - before == METADATA_RETRIES + 1 and "503" in error,
+                error)
+
+    # 404 is not retried
+    before = host.requests
+    meta = await fetcher._fetch("missing", f"{base}/missing")
+    check("4xx not retried", meta is None and host.requests - before == 1,
+                await saved_error("missing"))
+
+    # Timeout on every attempt
+    start = time.perf_counter()
+    meta = await fetcher._fetch("slow", f"{base}/slow/{METADATA_TIMEOUT * 4}")
+    elapsed = time.perf_counter() - start
+    check("timeout", meta is None and "Timeout" in await saved_error("slow"),
+                f"{elapsed:.2f}s for {METADATA_RETRIES + 1} attempts")
+
+    # Oversized body is cut off, not buffered
+    meta = await fetcher._fetch("big", f"{base}/big")
+    error = await saved_error("big")
+    check("body over METADATA_MAX_BYTES", meta is None and "larger than" in error, error)
+
+    # Invalid JSON
+    meta = await fetcher._fetch("bad", f"{base}/bad")
+    error = await saved_error("bad")
+    check("invalid JSON", meta is None and "JSONDecodeError" in error, error)
+
+    # Content-hash cache: same body from different URIs is parsed once
+    hits = fetcher.cache_hits
+    for i in range(5):
+        await fetcher._fetch(f"copy-{i}", f"{base}/copy/{i}")
+    check("content-hash cache hit", fetcher.cache_hits - hits == 4
+                and fetcher.results["copy-4"] is fetcher.results["copy-0"],
+                f"{fetcher.cache_hits - hits} hits for 5 identical documents")
+
+    # get() budget: gives up at the budget, the fetch keeps running and lands later
+    fetcher.submit("budget", f"{base}/slow/{METADATA_TIMEOUT / 2}")
+    start = time.perf_counter()
+    meta = await fetcher.get("budget", 0.05)
+    waited = time.perf_counter() - start
+    check("get() budget expires", meta is None and waited < 0.1 and "budget" in fetcher.inflight,
+                f"returned after {waited * 1000:.0f} ms")
+    await asyncio.sleep(METADATA_TIMEOUT)
+    check("fetch completes past the budget", await fetcher.get("budget", 0.05) is not None)
+
+    await fetcher.close()
+
+
+async def run_throughput(base: str, host: MockHost, tokens: int):
+    # One host is capped at METADATA_PER_HOST connections, and waiting for one
+    # counts against METADATA_TIMEOUT: keep a few rounds of requests in flight
+    window = METADATA_PER_HOST * 4
+    fetcher = MetadataFetcher()
+    start = time.perf_counter()
+    for i in range(tokens):
+        while len(fetcher.inflight) >= window:
+            await asyncio.sleep(0.001)
+        fetcher.submit(f"mint-{i}", f"{base}/ok/{i}")
+    while fetcher.inflight:
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - start
+    print(f"{tokens} fetches from one host, latency {host.latency * 1000:.0f} ms, "
+          f"{METADATA_PER_HOST} connections: {elapsed * 1000:.0f} ms ({tokens / elapsed:.0f}/s), "
+          f"{fetcher.fetched} fetched, {fetcher.errors} errors")
+    await fetcher.close()
+
+
+async def run(tokens: int, latency: float):
+    host = MockHost(latency)
+    runner = web.AppRunner(host.app(), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    base = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+    await db.connect()
+    try:
+        await run_checks(base, host)
+        await run_throughput(base, host, tokens)
+    finally:
+        await db.close()
+        await runner.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Metadata fetcher against a local mock host")
+    parser.add_argument("--tokens", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.tokens, args.latency_ms / 1000))
+
+
+if __name__ == "__main__":
+    main()
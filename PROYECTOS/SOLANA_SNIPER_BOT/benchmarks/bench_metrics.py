@@ -0,0 +1,39 @@
+"""
+CIPHER Sniper Bot - Metrics Recording Benchmark
+Per-call cost of counter/gauge/histogram updates on the hot path.
+Target: sub-microsecond.
+
+Usage:
+    python benchmarks/bench_metrics.py
+"""
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from metrics import Registry
+
+TARGET_NS = 1000
+
+
+def main():
+    registry = Registry()
+    counter = registry.counter("bench_counter", "bench").labels("new_token")
+    gauge = registry.gauge("bench_gauge", "bench")
+    histogram = registry.histogram("bench_histogram", "bench")
+
+    cases = {
+        "counter.inc()": counter.inc,
+        "gauge.set(n)": lambda: gauge.set(3),
+        "histogram.observe(t)": lambda: histogram.observe(0.0007),
+    }
+    for name, fn in cases.items():
+        runs = 1_000_000
+        best = min(timeit.repeat(fn, number=runs, repeat=5)) / runs * 1e9
+        verdict = "OK" if best < TARGET_NS else "SLOW"
+        print(f"{name:<22} {best:6.0f} ns/call [{verdict}]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+CIPHER Sniper Bot - Momentum Entry Benchmark
+Runs the momentum filter the way the live bot sees tokens: evaluated at
+creation with only the creator's buy in the flow, then re-checked on every
+later trade. Checks that a token with real buying gets bought, that one
+without it never is and is dropped after its wait, then measures the
+on_trade() cost for mints that aren't waiting (every other trade).
+
+Usage:
+    python benchmarks/bench_momentum.py [--trades 200000]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="cipher_momentum_"))
+os.environ.setdefault("METRICS_PORT", "0")
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import DATA_DIR
+from control import control
+from database import db
+from paper_trader import paper_trader
+from trade_flow import trade_flow
+
+B58 = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+SETTINGS = {
+    "filters": ["trading_enabled", "max_open_positions", "not_already_open", "momentum", "balance"],
+    "momentum_window": "60s",
+    "momentum_min_buys": 3,
+    "momentum_min_traders": 2,
+    "momentum_min_buy_ratio": 0.6,
+    "momentum_wait_seconds": 0.5,
+}
+
+
+def fake_key(rng: random.Random) -> str:
+    return "".join(rng.choice(B58) for _ in range(44))
+
+
+def check(name: str, ok: bool, detail: str = ""):
+    print(f"  {'ok  ' if ok else 'FAIL'} {name}{': ' + detail if detail else ''}")
+    if not ok:
+        raise SystemExit(1)
+
+
+async def create(mint: str, creator: str):
+    """What on_new_token sees: the creator's initial buy is the only trade"""
+    await db.add_token(mint, "Bench", "BNCH", creator)
+    trade_flow.update(mint, creator, True, 1.0, 3e-8)
+    token_data = {"mint": mint, "creator": creator, "creator_score": 50, "symbol": "BNCH"}
+    if await paper_trader.evaluate_token(token_data):
+        return await paper_trader.open_position(token_data)
+    return None
+
+
+async def trade(mint: str, trader: str, is_buy: bool, price: float):
+    trade_flow.update(mint, trader, is_buy, 0.5, price)
+    return await paper_trader.on_trade(mint, price, 31.0)
+
+
+async def run_checks(rng: random.Random):
+    print(f"Momentum re-checks ({SETTINGS['momentum_min_buys']} buys, "
+          f"{SETTINGS['momentum_min_traders']} traders, wait {SETTINGS['momentum_wait_seconds']}s)")
+
+    hot, cold = fake_key(rng), fake_key(rng)
+    check("rejected at creation", await create(hot, fake_key(rng)) is None
+          and paper_trader.filters.rejected_by == "momentum", "creator's buy only")
+    check("kept waiting", hot in paper_trader.awaiting_momentum)
+
+    opened, buys = None, 1
+    while opened is None and buys < 10:
+        buys += 1
+        price = 3e-8 + buys * 1e-8
+        opened = await trade(hot, fake_key(rng), True, price)
+    position = paper_trader.active_positions.get(hot)
+    check("bought once momentum builds", opened is not None and position is not None
+          and hot not in paper_trader.awaiting_momentum,
+          f"trade #{opened} on buy {buys}")
+    check("entered at the triggering trade's price", position["entry_price"] == price,
+          f"{price:.1e} SOL")
+
+    await create(cold, fake_key(rng))
+    await trade(cold, fake_key(rng), False, 2e-8)
+    check("no buy on selling", cold not in paper_trader.active_positions
+          and cold in paper_trader.awaiting_momentum)
+    await asyncio.sleep(SETTINGS["momentum_wait_seconds"])
+    await trade(cold, fake_key(rng), True, 3e-8)
+    check("dropped after its wait", cold not in paper_trader.awaiting_momentum
+          and cold not in paper_trader.active_positions)
+
+
+async def run_overhead(rng: random.Random, trades: int):
+    mints = [fake_key(rng) for _ in range(256)]
+    start = time.perf_counter()
+    for i in range(trades):
+        await paper_trader.on_trade(mints[i & 255], 3e-8, 31.0)
+    elapsed = time.perf_counter() - start
+    print(f"on_trade() for mints not waiting: {elapsed / trades * 1e9:.0f} ns per trade "
+          f"({trades} trades)")
+
+
+async def run(trades: int):
+    control.path = DATA_DIR / "control.json"
+    control.path.write_text(json.dumps(SETTINGS))
+    rng = random.Random(35)
+    await db.connect()
+    try:
+        await db.init_paper_portfolio(1.0)
+        await paper_trader.initialize()
+        await run_checks(rng)
+        await run_overhead(rng, trades)
+    finally:
+        await db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Momentum filter with re-checks on later trades")
+    parser.add_argument("--trades", type=int, default=200000)
+    args = parser.parse_args()
+    asyncio.run(run(args.trades))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+CIPHER Sniper Bot - Solana RPC Client Benchmark
+Runs the client against a local mock RPC server (aiohttp.web, fixed
+latency per HTTP request) and compares HTTP round trips and wall time for
+N concurrent reads against one request per read.
+
+Usage:
+    python benchmarks/bench_rpc.py [--reads 500] [--latency-ms 40]
+"""
+import argparse
+import asyncio
+import base64
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="cipher_rpc_"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import aiohttp
+from aiohttp import web
+
+import rpc as rpc_module
+from config import RPC_MAX_CONNECTIONS
+from rpc import BONDING_CURVE, SolanaRPC
+
+B58 = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+def fake_key(rng: random.Random) -> str:
+    return "".join(rng.choice(B58) for _ in range(44))
+
+
+class MockRPC:
+    """Answers single and batch JSON-RPC requests after a fixed delay"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.http_requests = 0
+        self.calls = 0
+
+    def _account(self, pubkey: str) -> dict:
+        data = BONDING_CURVE.pack(1_073_000_000_000_000, 30_000_000_000,
+                                  793_100_000_000_000, len(pubkey) * 10**8,
+                                  1_000_000_000_000_000, False)
+        return {"lamports": 1_500_000, "owner": "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P",
+                "executable": False, "data": [base64.b64encode(data).decode(), "base64"]}
+
+    def _answer(self, call: dict) -> dict:
+        self.calls += 1
+        method, params = call["method"], call.get("params") or []
+        if method == "getMultipleAccounts":
+            result = {"context": {"slot": 1}, "value": [self._account(p) for p in params[0]]}
+        elif method == "getBalance":
+            result = {"context": {"slot": 1}, "value": 2_500_000_000}
+        else:
+            return {"jsonrpc": "2.0", "id": call["id"],
+                    "error": {"code": -32601, "message": "Method not found"}}
+        return {"jsonrpc": "2.0", "id": call["id"], "result": result}
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.http_requests += 1
+        body = await request.json()
+        await asyncio.sleep(self.latency)
+        if isinstance(body, list):
+            return web.json_response([self._answer(c) for c in body])
+        return web.json_response(self._answer(body))
+
+
+async def run(reads: int, latency: float):
+    mock = MockRPC(latency)
+    app = web.Application()
+    app.router.add_post("/", mock.handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    url = f"http://127.0.0.1:{port}/"
+
+    rng = random.Random(40)
+    curves = [fake_key(rng) for _ in range(reads)]
+    wallets = [fake_key(rng) for _ in range(reads)]
+
+    # Baseline: one HTTP request per read over a pool of the same size (no
+    # timeout, requests queue for a connection)
+    session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=RPC_MAX_CONNECTIONS))
+    mock.http_requests = 0
+    start = time.perf_counter()
+
+    async def single(i: int):
+        payload = {"jsonrpc": "2.0", "id": i, "method": "getMultipleAccounts",
+                   "params": [[curves[i]], {"encoding": "base64"}]}
+        async with session.post(url, json=payload) as resp:
+            await resp.json()
+
+    await asyncio.gather(*(single(i) for i in range(reads)))
+    print(f"{reads} concurrent reads, mock latency {latency * 1000:.0f} ms")
+    print(f"  unbatched   {mock.http_requests:>5} HTTP requests  "
+          f"{(time.perf_counter() - start) * 1000:>7.0f} ms")
+    await session.close()
+
+    # Batched: curves + balances issued at once (rate limit lifted to compare
+    # transport only; the baseline above isn't limited either)
+    client = SolanaRPC(url)
+    client.bucket = rpc_module.TokenBucket(rate=1e9, burst=1e9)
+    mock.http_requests = mock.calls = 0
+    start = time.perf_counter()
+    results = await asyncio.gather(*(client.get_bonding_curve(c) for c in curves),
+                                   *(client.get_balance(w) for w in wallets))
+    elapsed = (time.perf_counter() - start) * 1000
+    assert all(r is not None for r in results)
+    assert abs(results[0]["real_sol"] - len(curves[0]) / 10) < 1e-9
+    print(f"  batched     {mock.http_requests:>5} HTTP requests  {elapsed:>7.0f} ms  "
+          f"({mock.calls} JSON-RPC calls for {2 * reads} reads)")
+
+    # Cached: same reads again within RPC_CACHE_TTL
+    mock.http_requests = 0
+    start = time.perf_counter()
+    await asyncio.gather(*(client.get_bonding_curve(c) for c in curves))
+    print(f"  cached      {mock.http_requests:>5} HTTP requests  "
+          f"{(time.perf_counter() - start) * 1000:>7.0f} ms")
+
+    # Coalesced: many callers asking for one uncached key
+    mock.http_requests = mock.calls = 0
+    await asyncio.gather(*(client.call("getBalance", [wallets[0]], cache=False) for _ in range(reads)))
+    print(f"  coalesced   {mock.http_requests:>5} HTTP requests  "
+          f"({mock.calls} call for {reads} identical reads)")
+
+    # Errors: unknown methods fail alone, the rest of the batch resolves
+    mock.http_requests = 0
+    mixed = await asyncio.gather(client.call("getSlotLeaders", [1, 2]),
+                                 client.call("getBalance", [wallets[1]], cache=False),
+                                 return_exceptions=True)
+    assert isinstance(mixed[0], rpc_module.RPCError) and mixed[1]["value"] == 2_500_000_000
+    print(f"  mixed batch {mock.http_requests:>5} HTTP request   (error isolated to its call)")
+    print(f"  client stats {client.stats()}")
+    await client.close()
+
+    # Rate limit: batches beyond the burst wait for the bucket to refill
+    client = SolanaRPC(url)
+    client.bucket = rpc_module.TokenBucket(rate=100, burst=20)
+    start = time.perf_counter()
+    for _ in range(5):
+        await asyncio.gather(*(client.get_balance(fake_key(rng)) for _ in range(20)))
+    limited = time.perf_counter() - start
+    print(f"  rate limit  100 calls in batches of 20 at 100/s, burst 20: {limited * 1000:.0f} ms "
+          f"(floor {(100 - 20) / 100 * 1000:.0f} ms + 5 round trips)")
+    await client.close()
+
+    await runner.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Solana RPC client benchmark (local mock server)")
+    parser.add_argument("--reads", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=40)
+    args = parser.parse_args()
+    asyncio.run(run(args.reads, args.latency_ms / 1000))
+
+
+if __name__ == "__main__":
+    main()
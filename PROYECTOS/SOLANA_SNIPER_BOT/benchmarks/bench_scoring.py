@@ -0,0 +1,90 @@
+"""
+CIPHER Sniper Bot - Creator Scoring Benchmark
+Full scoring pass over a synthetic creators table (feature query,
+vectorized scoring, bulk UPSERT), then an incremental pass after touching
+1% of creators.
+
+Usage:
+    python benchmarks/bench_scoring.py [--creators 1000000]
+"""
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="cipher_scoring_"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import numpy as np
+
+from database import db
+from scoring import creator_scorer, score_features
+
+
+async def populate(creators: int):
+    """Creators with rolled-up aggregates, as the lifecycle worker leaves them"""
+    rng = random.Random(42)
+    now = time.time()
+    wallets = [f"W{i:043d}" for i in range(creators)]
+
+    def rows():
+        for w in wallets:
+            created = rng.randint(1, 12)
+            finished = rng.randint(0, created)
+            avg_peak = rng.uniform(25, 600)
+            yield (w, created, finished, rng.randint(0, finished), avg_peak,
+                   avg_peak * rng.uniform(1, 3), f"-{rng.randint(0, 86400 * 30)} seconds", now - 60)
+
+    await db.conn.executemany("""
+        INSERT INTO creators (wallet, tokens_created, tokens_finished, tokens_graduated,
+                              avg_peak_mcap, max_peak_mcap, first_seen, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, datetime('now', ?), ?)
+    """, rows())
+    await db.conn.commit()
+    return wallets
+
+
+async def run(creators: int):
+    workdir = Path(tempfile.mkdtemp(prefix="cipher_bench_"))
+    db.db_path = workdir / "bench.db"
+    await db.connect()
+    try:
+        start = time.perf_counter()
+        wallets = await populate(creators)
+        print(f"Populated {creators} creators in {time.perf_counter() - start:.1f}s")
+
+        features = np.random.default_rng(0).uniform(0, 10, size=(creators, 6))
+        start = time.perf_counter()
+        score_features(features)
+        print(f"score_features ({creators} rows):   {time.perf_counter() - start:8.3f}s")
+
+        start = time.perf_counter()
+        scored, changed = await creator_scorer.score_once()
+        print(f"full pass ({scored} scored, {changed} written): {time.perf_counter() - start:8.3f}s")
+
+        touched = wallets[::100]
+        await db.conn.executemany("UPDATE creators SET updated_at = ? WHERE wallet = ?",
+                                  [(time.time(), w) for w in touched])
+        await db.conn.commit()
+        start = time.perf_counter()
+        scored, changed = await creator_scorer.score_once()
+        print(f"incremental pass ({scored} scored, {changed} written): {time.perf_counter() - start:8.3f}s")
+    finally:
+        await db.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Creator scoring benchmark")
+    parser.add_argument("--creators", type=int, default=1_000_000)
+    args = parser.parse_args()
+    asyncio.run(run(args.creators))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+CIPHER Sniper Bot - Cold Start Benchmark
+Measures `python main.py --status` from process spawn to exit, served from
+a snapshot and from the read-only DB fallback. Target: under 100 ms.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 20]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BOT_DIR = Path(__file__).parent.parent
+TARGET_MS = 100
+
+
+def time_status(data_dir: Path, runs: int) -> list:
+    """Spawn `main.py --status` repeatedly, return wall times in ms"""
+    env = dict(os.environ, DATA_DIR=str(data_dir))
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, str(BOT_DIR / "main.py"), "--status"],
+            env=env, stdout=subprocess.DEVNULL, check=True
+        )
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+async def build_database(data_dir: Path):
+    """Create a small database with the real schema"""
+    from database import Database
+
+    db = Database(data_dir / "cipher_sniper.db")
+    await db.connect()
+    await db.init_paper_portfolio(1.0)
+    for i in range(200):
+        await db.add_token(f"mint{i}", f"Token {i}", f"T{i}", f"creator{i % 20}")
+    await db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold start benchmark for --status")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    data_dir = Path(tempfile.mkdtemp(prefix="cipher_bench_"))
+    os.environ["DATA_DIR"] = str(data_dir)
+    sys.path.insert(0, str(BOT_DIR / "src"))
+
+    # DB fallback first (no snapshot yet), then the snapshot path
+    asyncio.run(build_database(data_dir))
+    results = {"db_fallback": time_status(data_dir, args.runs)}
+
+    from status_snapshot import read_from_db, write_snapshot
+    snapshot = read_from_db(data_dir / "cipher_sniper.db")
+    write_snapshot(snapshot["status"], snapshot["creators"], data_dir / "status.json")
+    results["snapshot"] = time_status(data_dir, args.runs)
+
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    interpreter_ms = (time.perf_counter() - start) * 1000
+
+    print(f"Interpreter startup: {interpreter_ms:.1f} ms")
+    for name, times in results.items():
+        median = statistics.median(times)
+        verdict = "OK" if median < TARGET_MS else "SLOW"
+        print(f"{name:<12} median {median:6.1f} ms | min {min(times):6.1f} ms "
+              f"| target {TARGET_MS} ms [{verdict}]")
+
+
+if __name__ == "__main__":
+    main()
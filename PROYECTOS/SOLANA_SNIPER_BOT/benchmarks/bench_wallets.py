@@ -0,0 +1,75 @@
+"""
+CIPHER Sniper Bot - Watched Wallet Index Benchmark
+Reload time and per-trade check cost at 10k and 100k watched wallets.
+
+Usage:
+    python benchmarks/bench_wallets.py [--sizes 10000,100000]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import timeit
+from pathlib import Path
+
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="cipher_wallets_"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from wallets import WalletIndex
+
+B58 = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+RUNS = 200_000
+
+
+def fake_key(rng: random.Random) -> str:
+    return "".join(rng.choice(B58) for _ in range(44))
+
+
+def bench(size: int):
+    rng = random.Random(size)
+    wallets = [fake_key(rng) for _ in range(size)]
+    path = Path(tempfile.mkdtemp(prefix="cipher_wallets_")) / "watched_wallets.json"
+    with open(path, "w") as f:
+        json.dump({w: {"label": f"w{i}", "min_sol": 0.1} for i, w in enumerate(wallets)}, f)
+
+    index = WalletIndex(path)
+    start = time.perf_counter()
+    index.load()
+    reload_ms = (time.perf_counter() - start) * 1000
+
+    hit, miss = wallets[size // 2], fake_key(rng)
+    miss_ns = min(timeit.repeat(lambda: index.match(miss, True, 1.0), number=RUNS, repeat=5)) / RUNS * 1e9
+    hit_ns = min(timeit.repeat(lambda: index.match(hit, True, 1.0), number=RUNS, repeat=5)) / RUNS * 1e9
+
+    # Decode + check, i.e. what every trade message pays for copy trading
+    messages = [json.dumps({
+        "signature": fake_key(rng), "mint": fake_key(rng),
+        "traderPublicKey": wallets[i] if i % 100 == 0 else fake_key(rng),
+        "txType": "buy", "tokenAmount": 1.2e7, "solAmount": 0.35, "marketCapSol": 31.0,
+    }) for i in range(10_000)]
+
+    def check_all():
+        for message in messages:
+            data = json.loads(message)
+            index.match(data["traderPublicKey"], data["txType"] == "buy", data["solAmount"])
+
+    per_batch = min(timeit.repeat(check_all, number=1, repeat=5))
+    rate = len(messages) / per_batch
+
+    print(f"{size:>8} wallets | reload {reload_ms:7.1f} ms | match miss {miss_ns:5.0f} ns | "
+          f"hit {hit_ns:5.0f} ns | decode+check {rate:,.0f} trades/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Watched wallet index benchmark")
+    parser.add_argument("--sizes", default="10000,100000")
+    args = parser.parse_args()
+    for size in (int(s) for s in args.sizes.split(",") if s):
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
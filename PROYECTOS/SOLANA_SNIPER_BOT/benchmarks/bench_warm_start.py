@@ -0,0 +1,135 @@
+"""
+CIPHER Sniper Bot - Warm Start Benchmark
+Snapshot size, write time and load time with every cache at its configured
+limit (token peaks, creator rows, trade flow windows, recent mints).
+
+Usage:
+    python benchmarks/bench_warm_start.py [--events 20]
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="cipher_warm_"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import (
+    DATA_DIR, TOKEN_CACHE_SIZE, CREATOR_CACHE_SIZE, TRADE_FLOW_MAX_MINTS,
+    TRADE_SUBSCRIPTION_LIMIT
+)
+from trade_flow import TradeFlow
+from warm_start import WarmStart, read_snapshot, write_snapshot
+
+B58 = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+def fake_key(rng: random.Random) -> str:
+    return "".join(rng.choice(B58) for _ in range(44))
+
+
+def build_state(events_per_mint: int) -> dict:
+    rng = random.Random(37)
+    mints = [fake_key(rng) for _ in range(TOKEN_CACHE_SIZE)]
+    peaks = OrderedDict((m, [rng.random() * 1e-6, rng.random() * 500]) for m in mints)
+
+    creators = OrderedDict()
+    for i in range(CREATOR_CACHE_SIZE):
+        wallet = fake_key(rng)
+        creators[wallet] = {
+            "wallet": wallet, "first_seen": "2026-01-01 00:00:00",
+            "last_seen": "2026-01-02 00:00:00", "tokens_created": i % 40 + 1,
+            "tokens_graduated": i % 3, "avg_peak_mcap": 42.0, "total_volume": 0.0,
+            "tokens_finished": i % 40, "max_peak_mcap": 120.0,
+            "trust_score": 50.0, "risk_level": "unknown", "is_blacklisted": 0,
+            "blacklist_reason": None, "updated_at": time.time(),
+        }
+
+    flow = TradeFlow()
+    now = time.time()
+    traders = [fake_key(rng) for _ in range(2000)]
+    for mint in mints[:TRADE_FLOW_MAX_MINTS]:
+        for j in range(events_per_mint):
+            flow.update(mint, rng.choice(traders), rng.random() < 0.6,
+                        rng.random(), rng.random() * 1e-6, now - events_per_mint + j)
+
+    state = {"last_event_ts": now, "scoring_watermark": repr(now), "positions": {}}
+    sections = {
+        "trade_subscriptions": mints[:TRADE_SUBSCRIPTION_LIMIT],
+        "peaks": list(peaks.items()),
+        "creators": list(creators.items()),
+        "trade_flow": flow.export(),
+        "metadata": [],
+        "metadata_content": [],
+    }
+    return state, sections
+
+
+class Captured(WarmStart):
+    """WarmStart serializing prebuilt sections instead of the live singletons"""
+
+    def __init__(self, captured: tuple):
+        super().__init__("bench")
+        self.captured = captured
+
+    async def _capture(self) -> tuple:
+        return self.captured
+
+
+async def dumps(warm: WarmStart) -> tuple:
+    """Payload and the longest single stretch without yielding to the loop"""
+    longest, last = 0.0, time.perf_counter()
+    done = False
+
+    async def watch():
+        nonlocal longest, last
+        while not done:
+            await asyncio.sleep(0)
+            now = time.perf_counter()
+            longest, last = max(longest, now - last), now
+
+    watcher = asyncio.create_task(watch())
+    payload = await warm._dumps()
+    done = True
+    await watcher
+    return payload, longest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm start snapshot benchmark")
+    parser.add_argument("--events", type=int, default=20, help="trades per mint in the flow windows")
+    args = parser.parse_args()
+
+    captured = build_state(args.events)
+    path = DATA_DIR / "warm_bench.snap"
+
+    start = time.perf_counter()
+    payload, stall = asyncio.run(dumps(Captured(captured)))
+    pickle_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    write_snapshot(path, payload, time.time())
+    write_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    _, _, sections = read_snapshot(path)
+    load_ms = (time.perf_counter() - start) * 1000
+    assert len(sections["creators"]) == len(captured[1]["creators"])
+
+    start = time.perf_counter()
+    TradeFlow().restore(sections["trade_flow"])
+    flow_ms = (time.perf_counter() - start) * 1000
+
+    print(f"{TOKEN_CACHE_SIZE} peaks, {CREATOR_CACHE_SIZE} creators, "
+          f"{TRADE_FLOW_MAX_MINTS} flow mints x {args.events} trades")
+    print(f"  snapshot {len(payload) / 1e6:.1f} MB | pickle {pickle_ms:.0f} ms "
+          f"(longest loop stall {stall * 1000:.0f} ms) | write {write_ms:.0f} ms (thread)")
+    print(f"  load {load_ms:.0f} ms | rebuild trade flow {flow_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
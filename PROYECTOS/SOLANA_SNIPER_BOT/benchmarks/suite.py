@@ -0,0 +1,307 @@
+"""
+CIPHER Sniper Bot - Benchmark Suite
+Offline benchmarks against temp databases and synthetic data, with JSON
+results that can be kept as baselines and compared for regressions.
+
+Usage:
+    python benchmarks/suite.py run                          # -> benchmarks/results/latest.json
+    python benchmarks/suite.py run --save-baseline          # also -> benchmarks/results/baseline.json
+    python benchmarks/suite.py run --compare benchmarks/results/baseline.json --threshold 15
+    python benchmarks/suite.py compare OLD.json NEW.json --threshold 15
+
+`run --compare` and `compare` exit with status 1 if any benchmark got slower
+than the threshold (percent).
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List
+
+BENCH_DIR = Path(__file__).parent
+RESULTS_DIR = BENCH_DIR / "results"
+
+# Keep the bot's data/ untouched
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="cipher_suite_"))
+os.environ.setdefault("METRICS_PORT", "0")
+os.environ.setdefault("METADATA_FETCH", "false")  # no network from the suite
+sys.path.insert(0, str(BENCH_DIR.parent / "src"))
+
+from database import db
+from collector import collector
+from paper_trader import paper_trader
+from trade_flow import TradeFlow
+
+DEFAULT_SIZES = [1000, 10000, 50000]
+REPEATS = 3
+
+B58 = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+def fake_key(rng: random.Random) -> str:
+    return "".join(rng.choice(B58) for _ in range(44))
+
+
+async def measure(fn: Callable[[int], Awaitable], ops: int) -> float:
+    """Median seconds per op over REPEATS runs of `ops` calls"""
+    runs = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for i in range(ops):
+            await fn(i)
+        runs.append((time.perf_counter() - start) / ops)
+    return statistics.median(runs)
+
+
+@contextlib.asynccontextmanager
+async def temp_database(tokens: int, rng: random.Random):
+    """Connect the db singleton to a fresh file with `tokens` synthetic tokens"""
+    workdir = Path(tempfile.mkdtemp(prefix="cipher_bench_"))
+    db.db_path = workdir / "bench.db"
+    db.ticks_path = workdir / "bench_ticks.db"
+    # Caches from the previous size would answer for rows this file doesn't have
+    db.peaks.clear()
+    db.creators.clear()
+    await db.connect()
+
+    creators = [fake_key(rng) for _ in range(max(tokens // 4, 1))]
+    mints = [fake_key(rng) for _ in range(tokens)]
+    await db.conn.executemany(
+        "INSERT INTO tokens (mint, name, symbol, creator_wallet, peak_mcap) VALUES (?, ?, ?, ?, ?)",
+        [(m, f"Token {i}", f"T{i}", creators[i % len(creators)], rng.uniform(25, 500))
+         for i, m in enumerate(mints)]
+    )
+    await db.conn.executemany(
+        "INSERT INTO creators (wallet, tokens_created, trust_score) VALUES (?, ?, ?)",
+        [(c, rng.randint(1, 12), rng.uniform(0, 100)) for c in creators]
+    )
+    await db.conn.executemany(
+        "INSERT INTO price_history (mint, price, mcap) VALUES (?, ?, ?)",
+        [(mints[i % tokens], rng.random() * 1e-6, rng.uniform(25, 500)) for i in range(tokens * 4)]
+    )
+    await db.init_paper_portfolio(1.0)
+    await db.conn.commit()
+    try:
+        yield mints, creators
+    finally:
+        await db.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+# ==================== BENCHMARKS ====================
+
+async def bench_database(size: int, results: Dict):
+    rng = random.Random(size)
+    async with temp_database(size, rng) as (mints, creators):
+        new_mints = [fake_key(rng) for _ in range(REPEATS * 500)]
+        counter = iter(range(len(new_mints)))
+
+        async def add_token(i):
+            n = next(counter)
+            await db.add_token(new_mints[n], "Bench", "BN", creators[n % len(creators)])
+
+        async def update_price(i):
+            await db.update_token_price(mints[(i * 7919) % size], 1e-6 + i * 1e-12, 30 + i * 0.01)
+
+        async def get_stats(i):
+            await db.get_stats()
+
+        async def leaderboard(i):
+            await db.get_creator_leaderboard(20)
+
+        results[f"db.add_token[n={size}]"] = await measure(add_token, 500)
+        results[f"db.update_token_price[n={size}]"] = await measure(update_price, 500)
+        results[f"db.get_stats[n={size}]"] = await measure(get_stats, 20)
+        results[f"db.get_creator_leaderboard[n={size}]"] = await measure(leaderboard, 50)
+
+
+async def bench_collector(size: int, results: Dict):
+    rng = random.Random(size + 1)
+    async with temp_database(size, rng) as (mints, creators):
+        collector.on_new_token = None
+        new_tokens = [
+            json.dumps({
+                "signature": fake_key(rng), "mint": fake_key(rng),
+                "traderPublicKey": creators[i % len(creators)], "txType": "create",
+                "initialBuy": 5e7, "solAmount": 1.5, "marketCapSol": 30.5,
+                "name": f"Bench {i}", "symbol": "BN", "uri": "https://ipfs.io/ipfs/Qm" + "x" * 44,
+            })
+            for i in range(REPEATS * 500)
+        ]
+        trades = [
+            json.dumps({
+                "signature": fake_key(rng), "mint": mints[i % size],
+                "traderPublicKey": fake_key(rng),
+                "txType": "buy" if i % 3 else "sell",
+                "tokenAmount": 1.2e7, "solAmount": 0.35, "marketCapSol": 31.0 + i * 0.001,
+            })
+            for i in range(1000)
+        ]
+        counter = iter(range(len(new_tokens)))
+
+        async def handle_new_token(i):
+            await collector._handle_message(new_tokens[next(counter)])
+
+        async def handle_trade(i):
+            await collector._handle_message(trades[i % len(trades)])
+
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            results[f"collector.new_token[n={size}]"] = await measure(handle_new_token, 500)
+            results[f"collector.trade[n={size}]"] = await measure(handle_trade, 500)
+
+
+async def bench_trader(size: int, results: Dict):
+    rng = random.Random(size + 2)
+    async with temp_database(size, rng) as (mints, creators):
+        paper_trader.active_positions.clear()
+        await paper_trader.initialize()
+
+        rejected = {"mint": mints[0], "creator": creators[0], "creator_score": 50, "creator_tokens": 1}
+        accepted = {"mint": mints[1], "creator": creators[1], "creator_score": 95, "creator_tokens": 8}
+
+        async def evaluate_rejected(i):
+            await paper_trader.evaluate_token(rejected)
+
+        async def evaluate_accepted(i):
+            await paper_trader.evaluate_token(accepted)
+
+        async def check_exits(i):
+            await paper_trader.check_exits(prices)
+
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            results[f"trader.evaluate_token.rejected[n={size}]"] = await measure(evaluate_rejected, 5000)
+            results[f"trader.evaluate_token.accepted[n={size}]"] = await measure(evaluate_accepted, 500)
+
+            # Open positions that never hit stop loss / take profit
+            for m in mints[2:7]:
+                paper_trader.active_positions[m] = {"trade_id": 0, "mint": m, "entry_price": 1e-6}
+            prices = {m: 1.1e-6 for m in mints[2:7]}
+            results[f"trader.check_exits.5_positions[n={size}]"] = await measure(check_exits, 5000)
+        paper_trader.active_positions.clear()
+
+
+async def bench_trade_flow(size: int, results: Dict):
+    rng = random.Random(size + 3)
+    flow = TradeFlow(max_mints=size)
+    mints = [fake_key(rng) for _ in range(size)]
+    traders = [fake_key(rng) for _ in range(256)]
+    clock = [time.time()]
+
+    async def update(i):
+        clock[0] += 0.01
+        flow.update(mints[(i * 7919) % size], traders[i % 256], i % 3 != 0, 0.5, 1e-6 + i * 1e-12, clock[0])
+
+    async def get(i):
+        flow.get(mints[(i * 7919) % size], clock[0])
+
+    results[f"trade_flow.update[n={size}]"] = await measure(update, 20000)
+    results[f"trade_flow.get[n={size}]"] = await measure(get, 5000)
+
+
+BENCHMARKS = [bench_database, bench_collector, bench_trader, bench_trade_flow]
+
+
+# ==================== RUN / COMPARE ====================
+
+async def run_suite(sizes: List[int]) -> Dict:
+    results: Dict[str, float] = {}
+    for size in sizes:
+        for bench in BENCHMARKS:
+            start = time.perf_counter()
+            await bench(size, results)
+            print(f"[BENCH] {bench.__name__}[n={size}] done in {time.perf_counter() - start:.1f}s")
+
+    return {
+        "meta": {
+            "timestamp": time.time(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": sizes,
+        },
+        "results": {name: {"seconds_per_op": s, "us_per_op": s * 1e6} for name, s in results.items()},
+    }
+
+
+def print_results(report: Dict):
+    print(f"\n{'BENCHMARK':<52} {'us/op':>12}")
+    print("-" * 65)
+    for name, r in report["results"].items():
+        print(f"{name:<52} {r['us_per_op']:>12.2f}")
+
+
+def compare(old: Dict, new: Dict, threshold: float) -> bool:
+    """Print the diff table, return True if any benchmark regressed"""
+    regressed = False
+    print(f"\n{'BENCHMARK':<52} {'base us':>10} {'new us':>10} {'change':>9}")
+    print("-" * 84)
+    for name, r in new["results"].items():
+        base = old["results"].get(name)
+        if not base:
+            print(f"{name:<52} {'-':>10} {r['us_per_op']:>10.2f} {'new':>9}")
+            continue
+        change = (r["us_per_op"] - base["us_per_op"]) / base["us_per_op"] * 100
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressed = True
+        print(f"{name:<52} {base['us_per_op']:>10.2f} {r['us_per_op']:>10.2f} {change:>+8.1f}%{flag}")
+    return regressed
+
+
+def load(path: Path) -> Dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def save(report: Dict, path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"[BENCH] Results written to {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CIPHER benchmark suite")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_p = sub.add_parser("run", help="Run the suite")
+    run_p.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                       help="Comma-separated table sizes")
+    run_p.add_argument("--output", type=Path, default=RESULTS_DIR / "latest.json")
+    run_p.add_argument("--save-baseline", action="store_true",
+                       help="Also write results to benchmarks/results/baseline.json")
+    run_p.add_argument("--compare", type=Path, help="Baseline to compare against")
+    run_p.add_argument("--threshold", type=float, default=15.0,
+                       help="Regression threshold in percent")
+
+    cmp_p = sub.add_parser("compare", help="Compare two result files")
+    cmp_p.add_argument("baseline", type=Path)
+    cmp_p.add_argument("results", type=Path)
+    cmp_p.add_argument("--threshold", type=float, default=15.0)
+
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        sys.exit(1 if compare(load(args.baseline), load(args.results), args.threshold) else 0)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    report = asyncio.run(run_suite(sizes))
+    print_results(report)
+    save(report, args.output)
+    if args.save_baseline:
+        save(report, RESULTS_DIR / "baseline.json")
+    if args.compare:
+        sys.exit(1 if compare(load(args.compare), report, args.threshold) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,8 +7,9 @@ Usage:
     python main.py              # Run collector + paper trader
     python main.py --collect    # Only collect data (no trading)
     python main.py --status     # Show current status
+    python main.py --split      # Collector, writer and trader as separate processes
+    python main.py --export     # Export new tokens, price history and trades
 """
-import asyncio
 import argparse
 import sys
 from pathlib import Path
@@ -16,10 +17,10 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from config import MODE, IS_PAPER, PAPER_INITIAL_BALANCE
-from database import db
-from collector import collector
-from paper_trader import paper_trader
+from config import MODE, IS_PAPER, PAPER_INITIAL_BALANCE, STATUS_SNAPSHOT_INTERVAL
+
+# The async stack (asyncio, websockets, aiosqlite) is imported inside the
+# run functions so `--status` starts without paying for it.
 
 
 BANNER = """
@@ -41,6 +42,8 @@ BANNER = """
 
 async def on_new_token(token_data: dict):
     """Callback when new token is detected"""
+    from paper_trader import paper_trader
+
     # Evaluate if we should trade
     should_trade = await paper_trader.evaluate_token(token_data)
 
@@ -48,24 +51,72 @@ async def on_new_token(token_data: dict):
         await paper_trader.open_position(token_data)
 
 
+async def snapshot_writer():
+    """Refresh the status snapshot periodically"""
+    import asyncio
+    from paper_trader import paper_trader
+
+    while True:
+        await paper_trader.write_status_snapshot()
+        await asyncio.sleep(STATUS_SNAPSHOT_INTERVAL)
+
+
 async def run_collector_only():
     """Run only the data collector (no trading)"""
+    import asyncio
+    import metrics
+    from database import db
+    from collector import collector
+    from paper_trader import paper_trader
+    from profiler import profiler
+    from analytics import lifecycle_worker
+    from scoring import creator_scorer
+    from wallets import wallet_index
+    from warm_start import WarmStart
+
     print(BANNER)
     print("[MODE] Data Collection Only - No trading")
     print("=" * 60)
 
     await db.connect()
+    warm = WarmStart("main", collector=collector, database=db)
+    await warm.restore()
 
     try:
-        await collector.start()
-    except KeyboardInterrupt:
+        await asyncio.gather(
+            collector.start(),
+            snapshot_writer(),
+            metrics.serve(),
+            profiler.run(),
+            lifecycle_worker.run(),
+            creator_scorer.run(),
+            wallet_index.run(),
+            warm.run(),
+            db.run_maintenance()
+        )
+    finally:
+        # Ctrl-C reaches this coroutine as CancelledError from asyncio.run,
+        # KeyboardInterrupt is only raised after it returns
         print("\n[SHUTDOWN] Stopping collector...")
         await collector.stop()
+        await warm.save()
+        await paper_trader.write_status_snapshot()
         await db.close()
 
 
 async def run_paper_trading():
     """Run full paper trading bot"""
+    import asyncio
+    import metrics
+    from database import db
+    from collector import collector
+    from paper_trader import paper_trader
+    from profiler import profiler
+    from analytics import lifecycle_worker
+    from scoring import creator_scorer
+    from wallets import wallet_index
+    from warm_start import WarmStart
+
     print(BANNER)
     print(f"[MODE] Paper Trading - Initial Balance: {PAPER_INITIAL_BALANCE} SOL")
     print("=" * 60)
@@ -73,9 +124,13 @@ async def run_paper_trading():
     # Initialize
     await db.connect()
     await paper_trader.initialize()
+    warm = WarmStart("main", collector=collector, database=db, trader=paper_trader)
+    await warm.restore()
 
-    # Set callback for new tokens
+    # Set callbacks for new tokens, trades (momentum re-checks) and watched-wallet buys
     collector.on_new_token = on_new_token
+    collector.on_copy_signal = paper_trader.on_copy_signal
+    collector.on_trade = paper_trader.on_trade
 
     # Print initial status
     await paper_trader.print_status()
@@ -89,51 +144,90 @@ async def run_paper_trading():
             await paper_trader.print_status()
 
     try:
-        # Run collector and status printer concurrently
+        # Run collector, status printer, snapshot writer and metrics concurrently
         await asyncio.gather(
             collector.start(),
-            status_printer()
+            status_printer(),
+            snapshot_writer(),
+            metrics.serve(),
+            profiler.run(),
+            lifecycle_worker.run(),
+            creator_scorer.run(),
+            wallet_index.run(),
+            warm.run(),
+            db.run_maintenance()
         )
-    except KeyboardInterrupt:
+    finally:
+        # Ctrl-C reaches this coroutine as CancelledError (see run_collector_only)
         print("\n[SHUTDOWN] Stopping bot...")
         await collector.stop()
+        await warm.save()
         await paper_trader.print_status()
+        await paper_trader.write_status_snapshot()
         await db.close()
 
 
-async def show_status():
-    """Show current status and exit"""
+def show_status():
+    """Show current status and exit (snapshot or read-only DB, no async stack)"""
+    from status_snapshot import show_status as print_snapshot_status
+
     print(BANNER)
-    await db.connect()
-    await paper_trader.initialize()
-    await paper_trader.print_status()
+    print_snapshot_status()
 
-    # Show top creators
-    creators = await db.get_creator_leaderboard(10)
-    if creators:
-        print("\nTOP CREATORS:")
-        print("-" * 50)
-        for i, c in enumerate(creators, 1):
-            print(f"{i}. {c['wallet'][:20]}... | Score: {c['trust_score']:.1f} | Tokens: {c['tokens_created']}")
 
-    await db.close()
+def run_export(args):
+    """Export tables incrementally (stdlib + read-only DB, no async stack)"""
+    from export import Exporter, TABLES, DEFAULT_FORMAT
+
+    tables = args.tables.split(",") if args.tables else TABLES
+    try:
+        exporter = Exporter(fmt=args.format or DEFAULT_FORMAT)
+        exporter.export(tables, full=args.full)
+    except (ValueError, FileNotFoundError) as e:
+        print(f"[EXPORT] {e}")
+        sys.exit(1)
 
 
 def main():
     parser = argparse.ArgumentParser(description="CIPHER Pump.fun Sniper Bot")
     parser.add_argument("--collect", action="store_true", help="Only collect data, no trading")
     parser.add_argument("--status", action="store_true", help="Show current status")
+    parser.add_argument("--split", action="store_true",
+                        help="Run collector, DB writer and trader as separate processes")
+    parser.add_argument("--export", action="store_true",
+                        help="Export tables to data/exports since the last export")
+    parser.add_argument("--format", choices=("parquet", "csv", "npz"),
+                        help="Export format (default: parquet if pyarrow is installed, else csv)")
+    parser.add_argument("--tables", help="Comma-separated tables to export (default: all)")
+    parser.add_argument("--full", action="store_true", help="Export from the beginning, ignoring watermarks")
 
     args = parser.parse_args()
 
     if args.status:
-        asyncio.run(show_status())
-    elif args.collect:
-        asyncio.run(run_collector_only())
-    else:
-        if not IS_PAPER:
-            print("[WARNING] Live trading not implemented yet. Running in paper mode.")
-        asyncio.run(run_paper_trading())
+        show_status()
+        return
+
+    if args.export:
+        run_export(args)
+        return
+
+    if args.split:
+        from split_mode import run_split
+
+        print(BANNER)
+        print("[MODE] Paper Trading - Process split (collector / writer / trader)")
+        print("=" * 60)
+        run_split()
+        return
+
+    import asyncio
+
+    if not args.collect and not IS_PAPER:
+        print("[WARNING] Live trading not implemented yet. Running in paper mode.")
+    try:
+        asyncio.run(run_collector_only() if args.collect else run_paper_trading())
+    except KeyboardInterrupt:
+        pass  # shutdown already ran in the coroutine's finally
 
 
 if __name__ == "__main__":
@@ -0,0 +1,135 @@
+"""
+CIPHER Sniper Bot - Token Lifecycle Analytics
+Background worker that finalizes tokens once they go quiet and rolls the
+results up into creator aggregates
+"""
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from config import (
+    LIFECYCLE_QUIET_SECONDS, LIFECYCLE_CHUNK, LIFECYCLE_INTERVAL,
+    GRADUATION_MCAP_SOL, STOP_LOSS_PERCENT, TAKE_PROFIT_2_PERCENT
+)
+from database import db
+
+WATERMARK_KEY = "lifecycle_watermark"
+
+
+def _parse_ts(value: str) -> Optional[float]:
+    """SQLite CURRENT_TIMESTAMP text (UTC) -> unix time"""
+    if not value:
+        return None
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc).timestamp()
+
+
+def _format_ts(ts: float) -> str:
+    """unix time -> SQLite CURRENT_TIMESTAMP text (UTC)"""
+    return datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def simulate_trade(history: List[Tuple[int, float, float]],
+                   stop_loss: float = STOP_LOSS_PERCENT,
+                   take_profit: float = TAKE_PROFIT_2_PERCENT) -> Optional[float]:
+    """
+    Profit % of buying at the first observed price and exiting on the
+    paper trader's stop loss / take profit, else at the last price
+    """
+    entry = next((p for _, p, _ in history if p), None)
+    if not entry:
+        return None
+
+    change = 0.0
+    for _, price, _ in history:
+        change = (price - entry) / entry * 100
+        if change <= -stop_loss or change >= take_profit:
+            break
+    return change
+
+
+def compute_lifecycle(token: Dict, history: List[Tuple[int, float, float]]) -> tuple:
+    """
+    Lifecycle metrics for one finished token:
+    (status, graduated_at, time_to_peak_seconds, simulated_profit_percent, mint)
+    """
+    created = _parse_ts(token["created_at"])
+    status, graduated_at, time_to_peak = "dead", None, None
+
+    if history:
+        peak_ts, peak_mcap = history[0][0], history[0][2]
+        for ts, _, mcap in history:
+            if mcap > peak_mcap:
+                peak_ts, peak_mcap = ts, mcap
+            if graduated_at is None and mcap >= GRADUATION_MCAP_SOL:
+                graduated_at = _format_ts(ts)
+                status = "graduated"
+        if created is not None:
+            time_to_peak = max(int(peak_ts - created), 0)
+
+    return (status, graduated_at, time_to_peak, simulate_trade(history), token["mint"])
+
+
+class LifecycleWorker:
+    """
+    Processes tokens in bounded chunks, oldest activity first, resuming from a
+    (last_activity, mint) watermark so each pass only sees tokens changed
+    since the previous one. Each chunk is one transaction; the loop yields
+    between chunks so ingestion keeps flowing.
+    """
+
+    def __init__(self, chunk_size: int = LIFECYCLE_CHUNK,
+                 quiet_seconds: int = LIFECYCLE_QUIET_SECONDS):
+        self.chunk_size = chunk_size
+        self.quiet_seconds = quiet_seconds
+        self.tokens_processed = 0
+        self.running = False
+
+    async def _load_watermark(self) -> Tuple[float, str]:
+        raw = await db.get_meta(WATERMARK_KEY, "0|")
+        ts, _, mint = raw.partition("|")
+        return float(ts), mint
+
+    async def process_chunk(self) -> int:
+        """Finalize one chunk of quiet tokens, returns how many were processed"""
+        after, after_mint = await self._load_watermark()
+        quiet_before = time.time() - self.quiet_seconds
+
+        tokens = await db.get_quiet_tokens(after, after_mint, quiet_before, self.chunk_size)
+        if not tokens:
+            return 0
+
+        histories = await db.get_price_histories([t["mint"] for t in tokens])
+        updates = [compute_lifecycle(t, histories[t["mint"]]) for t in tokens]
+        creators = sorted({t["creator_wallet"] for t in tokens if t["creator_wallet"]})
+
+        last = tokens[-1]
+        await db.save_lifecycle(updates, creators, f"{last['last_activity']!r}|{last['mint']}")
+
+        self.tokens_processed += len(tokens)
+        return len(tokens)
+
+    async def run(self):
+        """Drain the backlog chunk by chunk, then poll every LIFECYCLE_INTERVAL"""
+        self.running = True
+        while self.running:
+            try:
+                processed = await self.process_chunk()
+            except Exception as e:
+                print(f"[LIFECYCLE] Error processing chunk: {e}")
+                processed = 0
+
+            if processed:
+                print(f"[LIFECYCLE] Finalized {processed} tokens (total {self.tokens_processed})")
+
+            if processed < self.chunk_size:
+                await asyncio.sleep(LIFECYCLE_INTERVAL)
+            else:
+                await asyncio.sleep(0)  # backlog: yield to ingestion between chunks
+
+    def stop(self):
+        self.running = False
+
+
+# Singleton instance
+lifecycle_worker = LifecycleWorker()
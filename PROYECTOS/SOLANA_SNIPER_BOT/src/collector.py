@@ -4,12 +4,36 @@ WebSocket connection to collect new tokens in real-time
 """
 import asyncio
 import json
+import time
 import websockets
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Union
 
-from config import PUMP_FUN_WS
+from config import (
+    PUMP_FUN_WS, METADATA_FETCH, TRADE_SUBSCRIPTION_LIMIT, ACCOUNT_SUBSCRIBE_CHUNK
+)
 from database import db
+from eventlog import event_log
+from events import DecodeError, NewToken, Trade, decode
+from metadata import metadata_fetcher
+from metrics import MESSAGES, PARSE_ERRORS, RECONNECTS
+from rpc import rpc
+from trade_flow import trade_flow
+from wallets import copy_signal, wallet_index
+
+# Hot-path metric children, looked up once
+_MSG_NEW_TOKEN = MESSAGES.labels("new_token")
+_MSG_TRADE = MESSAGES.labels("trade")
+_MSG_OTHER = MESSAGES.labels("other")
+
+# Console form of a new token (formatted by the event log thread, rate-limited)
+NEW_TOKEN_CONSOLE = (
+    "\n[NEW TOKEN] {symbol} ({name})\n"
+    "  Mint: {mint:.20}...\n"
+    "  Creator: {creator:.20}... (tokens: {creator_tokens}, score: {creator_score})\n"
+    "  Total collected: {collected}"
+)
 
 
 class PumpFunCollector:
@@ -21,7 +45,13 @@ class PumpFunCollector:
         self.ws: Optional[websockets.WebSocketClientProtocol] = None
         self.running = False
         self.tokens_collected = 0
+        self.last_event_ts = 0.0  # unix time of the last message handled
         self.on_new_token: Optional[Callable] = None  # Callback for new tokens
+        self.on_copy_signal: Optional[Callable] = None  # Callback for watched-wallet buys
+        self.on_trade: Optional[Callable] = None  # Callback for every priced trade (momentum re-checks)
+        self.trade_subscriptions: OrderedDict = OrderedDict()  # mints watched for trades, oldest first
+        self.account_subscriptions: set = set()  # watched wallets subscribed on this connection
+        wallet_index.on_reload.append(self.sync_account_trades)
 
     async def connect(self):
         """Establish WebSocket connection"""
@@ -52,6 +82,45 @@ class PumpFunCollector:
         await self.ws.send(json.dumps(subscribe_msg))
         print("[COLLECTOR] Subscribed to newToken events")
 
+        # Resume trade subscriptions after a reconnect
+        if self.trade_subscriptions:
+            await self.ws.send(json.dumps({
+                "method": "subscribeTokenTrade",
+                "keys": list(self.trade_subscriptions)
+            }))
+        self.account_subscriptions = set()
+        await self.sync_account_trades()
+
+    async def sync_account_trades(self):
+        """Subscribe to trades by watched wallets, diffing against what this connection has"""
+        if not self.ws:
+            return
+        wanted = set(wallet_index.wallets)
+        for method, keys in (("subscribeAccountTrade", wanted - self.account_subscriptions),
+                             ("unsubscribeAccountTrade", self.account_subscriptions - wanted)):
+            keys = list(keys)
+            for i in range(0, len(keys), ACCOUNT_SUBSCRIBE_CHUNK):
+                await self.ws.send(json.dumps({"method": method, "keys": keys[i:i + ACCOUNT_SUBSCRIBE_CHUNK]}))
+        if wanted != self.account_subscriptions:
+            print(f"[COLLECTOR] Watching trades of {len(wanted)} wallets")
+        self.account_subscriptions = wanted
+
+    async def _watch_trades(self, mint: str):
+        """Subscribe to a new mint's trades, dropping the oldest watched mint past the limit"""
+        self.trade_subscriptions[mint] = None
+        unsubscribe = []
+        while len(self.trade_subscriptions) > TRADE_SUBSCRIPTION_LIMIT:
+            unsubscribe.append(self.trade_subscriptions.popitem(last=False)[0])
+
+        if not self.ws:
+            return
+        try:
+            await self.ws.send(json.dumps({"method": "subscribeTokenTrade", "keys": [mint]}))
+            if unsubscribe:
+                await self.ws.send(json.dumps({"method": "unsubscribeTokenTrade", "keys": unsubscribe}))
+        except websockets.ConnectionClosed:
+            pass  # resubscribed on reconnect
+
     async def start(self):
         """Start collecting data"""
         self.running = True
@@ -59,6 +128,8 @@ class PumpFunCollector:
         while self.running:
             try:
                 if not self.ws or self.ws.closed:
+                    if self.ws:
+                        RECONNECTS.inc()
                     success = await self.connect()
                     if not success:
                         print("[COLLECTOR] Retrying in 5 seconds...")
@@ -77,31 +148,40 @@ class PumpFunCollector:
                 print(f"[COLLECTOR] Error: {e}")
                 await asyncio.sleep(5)
 
-    async def _handle_message(self, message: str):
-        """Process incoming WebSocket message"""
+    async def _handle_message(self, message: Union[bytes, str]):
+        """Process incoming WebSocket message (raw frame, bytes or str)"""
+        self.last_event_ts = time.time()
         try:
-            data = json.loads(message)
-
-            # Handle different message types
-            if "mint" in data:
-                await self._process_new_token(data)
-            elif "txType" in data:
-                await self._process_trade(data)
-
-        except json.JSONDecodeError:
-            print(f"[COLLECTOR] Invalid JSON: {message[:100]}")
+            event = decode(message)
+
+            event_type = type(event)
+            if event_type is Trade:
+                _MSG_TRADE.inc()
+                await self._process_trade(event)
+            elif event_type is NewToken:
+                _MSG_NEW_TOKEN.inc()
+                await self._process_new_token(event)
+            else:
+                _MSG_OTHER.inc()
+
+        except DecodeError:
+            PARSE_ERRORS.inc()
+            if isinstance(message, bytes):
+                message = message.decode("utf-8", "replace")
+            event_log.error("invalid_json", "[COLLECTOR] Invalid JSON: {message}", message=message[:100])
         except Exception as e:
-            print(f"[COLLECTOR] Error processing message: {e}")
+            event_log.error("message_error", "[COLLECTOR] Error processing message: {error}", error=repr(e))
 
-    async def _process_new_token(self, data: Dict[str, Any]):
+    async def _process_new_token(self, event: NewToken):
         """Process new token creation event"""
-        mint = data.get("mint")
-        name = data.get("name", "Unknown")
-        symbol = data.get("symbol", "???")
-        creator = data.get("traderPublicKey") or data.get("creator")
-        uri = data.get("uri")
-
-        if not mint or not creator:
+        mint = event.mint
+        name = event.name
+        symbol = event.symbol
+        creator = event.creator
+        uri = event.uri
+
+        # Recently seen mints are still watched for trades: skip repeated create events
+        if not mint or not creator or mint in self.trade_subscriptions:
             return
 
         # Save to database
@@ -110,15 +190,25 @@ class PumpFunCollector:
         if saved:
             self.tokens_collected += 1
 
+            # Metadata download runs in the background while the token is evaluated
+            if METADATA_FETCH:
+                metadata_fetcher.submit(mint, uri)
+
+            # The creator's initial buy is the first trade in the mint's flow
+            sol_amount = event.sol_amount
+            initial_buy = event.initial_buy
+            if sol_amount and initial_buy:
+                trade_flow.update(mint, creator, True, sol_amount, sol_amount / initial_buy)
+            await self._watch_trades(mint)
+
             # Get creator info
             creator_info = await db.get_creator(creator)
             tokens_by_creator = creator_info.get("tokens_created", 1) if creator_info else 1
             trust_score = creator_info.get("trust_score", 50) if creator_info else 50
 
-            print(f"\n[NEW TOKEN] {symbol} ({name})")
-            print(f"  Mint: {mint[:20]}...")
-            print(f"  Creator: {creator[:20]}... (tokens: {tokens_by_creator}, score: {trust_score})")
-            print(f"  Total collected: {self.tokens_collected}")
+            event_log.info("new_token", NEW_TOKEN_CONSOLE, mint=mint, symbol=symbol, name=name,
+                           creator=creator, creator_tokens=tokens_by_creator,
+                           creator_score=trust_score, collected=self.tokens_collected)
 
             # Trigger callback if set
             if self.on_new_token:
@@ -128,27 +218,38 @@ class PumpFunCollector:
                     "symbol": symbol,
                     "creator": creator,
                     "uri": uri,
+                    "bonding_curve": event.bonding_curve,
                     "creator_tokens": tokens_by_creator,
                     "creator_score": trust_score,
                     "timestamp": datetime.now()
                 })
 
-    async def _process_trade(self, data: Dict[str, Any]):
+    async def _process_trade(self, event: Trade):
         """Process trade event (buy/sell)"""
-        tx_type = data.get("txType")
-        mint = data.get("mint")
+        mint = event.mint
 
         if not mint:
             return
 
-        # Extract price info if available
-        sol_amount = data.get("solAmount", 0)
-        token_amount = data.get("tokenAmount", 0)
+        sol_amount = event.sol_amount
+        token_amount = event.token_amount
 
         if sol_amount and token_amount:
             # Calculate approximate price
-            price = sol_amount / token_amount if token_amount > 0 else 0
-            mcap = data.get("marketCapSol", 0)
+            price = event.price
+            mcap = event.mcap
+
+            # Rolling windows for momentum signals
+            trader = event.trader
+            is_buy = event.is_buy
+            trade_flow.update(mint, trader, is_buy, sol_amount, price)
+            if self.on_trade:
+                await self.on_trade(mint, price, mcap)
+
+            # Copy trading: one dict lookup per trade
+            watched = wallet_index.match(trader, is_buy, sol_amount)
+            if watched and self.on_copy_signal:
+                await self.on_copy_signal(copy_signal(watched, mint, sol_amount, price, mcap))
 
             # Update token price in database
             await db.update_token_price(mint, price, mcap)
@@ -158,6 +259,8 @@ class PumpFunCollector:
         self.running = False
         if self.ws:
             await self.ws.close()
+        await metadata_fetcher.close()
+        await rpc.close()
         print(f"[COLLECTOR] Stopped. Total tokens collected: {self.tokens_collected}")
 
 
@@ -2,16 +2,20 @@
 CIPHER Sniper Bot - Configuration
 """
 import os
-from dotenv import load_dotenv
 from pathlib import Path
 
-# Load environment variables
-load_dotenv()
+BASE_DIR = Path(__file__).parent.parent
+
+# Load environment variables (python-dotenv is only imported when .env exists,
+# it adds ~30 ms to every cold start otherwise)
+ENV_FILE = BASE_DIR / ".env"
+if ENV_FILE.exists():
+    from dotenv import load_dotenv
+    load_dotenv(ENV_FILE)
 
 # Paths
-BASE_DIR = Path(__file__).parent.parent
-DATA_DIR = BASE_DIR / "data"
-DATA_DIR.mkdir(exist_ok=True)
+DATA_DIR = Path(os.getenv("DATA_DIR", BASE_DIR / "data"))
+DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 # Mode
 MODE = os.getenv("MODE", "paper")  # "paper" or "live"
@@ -19,6 +23,16 @@ IS_PAPER = MODE == "paper"
 
 # RPC
 RPC_URL = os.getenv("RPC_URL", "https://api.mainnet-beta.solana.com")
+RPC_COMMITMENT = os.getenv("RPC_COMMITMENT", "confirmed")
+RPC_MAX_CONNECTIONS = int(os.getenv("RPC_MAX_CONNECTIONS", "16"))
+RPC_TIMEOUT = float(os.getenv("RPC_TIMEOUT", "5"))  # seconds per HTTP request
+RPC_RETRIES = int(os.getenv("RPC_RETRIES", "2"))
+RPC_RATE_LIMIT = float(os.getenv("RPC_RATE_LIMIT", "40"))  # JSON-RPC calls per second
+RPC_BATCH_WINDOW_MS = float(os.getenv("RPC_BATCH_WINDOW_MS", "2"))  # wait to fill a batch
+RPC_BATCH_MAX = int(os.getenv("RPC_BATCH_MAX", "100"))  # calls per JSON-RPC batch
+RPC_CACHE_TTL = float(os.getenv("RPC_CACHE_TTL", "2"))  # seconds
+RPC_CACHE_SIZE = int(os.getenv("RPC_CACHE_SIZE", "10000"))
+RPC_BUDGET_MS = float(os.getenv("RPC_BUDGET_MS", "300"))  # max wait for on-chain filters
 
 # Pump.fun WebSocket
 PUMP_FUN_WS = "wss://pumpportal.fun/api/data"
@@ -40,11 +54,92 @@ TAKE_PROFIT_2_PERCENT = float(os.getenv("TAKE_PROFIT_2_PERCENT", "100"))
 MIN_CREATOR_SCORE = float(os.getenv("MIN_CREATOR_SCORE", "50"))
 MIN_CREATOR_TOKENS = int(os.getenv("MIN_CREATOR_TOKENS", "2"))
 
+# Lifecycle analytics (background worker)
+LIFECYCLE_QUIET_SECONDS = int(os.getenv("LIFECYCLE_QUIET_SECONDS", "900"))  # no trades for this long = done
+LIFECYCLE_CHUNK = int(os.getenv("LIFECYCLE_CHUNK", "500"))  # tokens per transaction
+LIFECYCLE_INTERVAL = int(os.getenv("LIFECYCLE_INTERVAL", "60"))  # idle sleep when caught up
+GRADUATION_MCAP_SOL = float(os.getenv("GRADUATION_MCAP_SOL", "400"))  # bonding curve complete
+
+# Creator scoring (vectorized batch model)
+SCORING_INTERVAL = int(os.getenv("SCORING_INTERVAL", "300"))
+
+# Token metadata fetcher (tokens.uri -> token_metadata)
+METADATA_FETCH = os.getenv("METADATA_FETCH", "true").lower() == "true"
+METADATA_MAX_CONNECTIONS = int(os.getenv("METADATA_MAX_CONNECTIONS", "32"))
+METADATA_PER_HOST = int(os.getenv("METADATA_PER_HOST", "8"))
+METADATA_TIMEOUT = float(os.getenv("METADATA_TIMEOUT", "5"))  # seconds per attempt
+METADATA_RETRIES = int(os.getenv("METADATA_RETRIES", "2"))
+METADATA_CACHE_SIZE = int(os.getenv("METADATA_CACHE_SIZE", "5000"))  # entries per LRU
+METADATA_MAX_PENDING = int(os.getenv("METADATA_MAX_PENDING", "500"))  # in-flight fetches
+METADATA_MAX_BYTES = int(os.getenv("METADATA_MAX_BYTES", "262144"))
+METADATA_BUDGET_MS = float(os.getenv("METADATA_BUDGET_MS", "250"))  # max wait in evaluate_token
+METADATA_IPFS_GATEWAY = os.getenv("METADATA_IPFS_GATEWAY", "https://ipfs.io/ipfs/")
+
+# Rolling trade flow (per-mint 10s / 60s / 5m windows)
+TRADE_FLOW_MAX_MINTS = int(os.getenv("TRADE_FLOW_MAX_MINTS", "5000"))
+TRADE_FLOW_MAX_EVENTS = int(os.getenv("TRADE_FLOW_MAX_EVENTS", "4096"))  # per mint and window
+TRADE_SUBSCRIPTION_LIMIT = int(os.getenv("TRADE_SUBSCRIPTION_LIMIT", "500"))  # mints watched for trades
+
+# Copy trading (watched wallet index, hot-reloaded)
+WATCHED_WALLETS_FILE = Path(os.getenv("WATCHED_WALLETS_FILE", BASE_DIR / "watched_wallets.json"))
+WATCHED_WALLETS_POLL = float(os.getenv("WATCHED_WALLETS_POLL", "2"))  # seconds between mtime checks
+COPY_MIN_SOL = float(os.getenv("COPY_MIN_SOL", "0.1"))  # ignore smaller buys by default
+ACCOUNT_SUBSCRIBE_CHUNK = int(os.getenv("ACCOUNT_SUBSCRIBE_CHUNK", "1000"))  # keys per subscribe message
+
 # Database
 DB_PATH = DATA_DIR / "cipher_sniper.db"
+DB_SYNCHRONOUS = os.getenv("DB_SYNCHRONOUS", "FULL")  # tokens, creators, paper trades
+DB_CHECKPOINT_INTERVAL = int(os.getenv("DB_CHECKPOINT_INTERVAL", "60"))  # seconds
+
+# Tick database (price_history), attached to the main one as "ticks"
+TICKS_DB_PATH = DATA_DIR / "cipher_ticks.db"
+TICKS_SYNCHRONOUS = os.getenv("TICKS_SYNCHRONOUS", "NORMAL")  # may lose the last ticks on power loss
+TICKS_CHECKPOINT_INTERVAL = int(os.getenv("TICKS_CHECKPOINT_INTERVAL", "10"))  # seconds
+TICKS_FLUSH_ROWS = int(os.getenv("TICKS_FLUSH_ROWS", "500"))  # buffered ticks per insert batch
+TICKS_FLUSH_INTERVAL = float(os.getenv("TICKS_FLUSH_INTERVAL", "1"))  # max seconds a tick waits
+TICKS_ROTATE_MB = int(os.getenv("TICKS_ROTATE_MB", "512"))  # rotate the tick file past this size
+TICKS_KEEP_FILES = int(os.getenv("TICKS_KEEP_FILES", "4"))  # rotated tick files kept on disk
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "20000"))  # mints with cached peaks
+CREATOR_CACHE_SIZE = int(os.getenv("CREATOR_CACHE_SIZE", "50000"))  # cached creator rows
+
+# Export (python main.py --export)
+EXPORT_DIR = Path(os.getenv("EXPORT_DIR", DATA_DIR / "exports"))
+EXPORT_CHUNK_ROWS = int(os.getenv("EXPORT_CHUNK_ROWS", "50000"))  # rows per query / row group
+
+# Warm-start snapshots of in-memory state (loaded on restart)
+WARM_SNAPSHOT_INTERVAL = int(os.getenv("WARM_SNAPSHOT_INTERVAL", "30"))
+WARM_SNAPSHOT_MAX_AGE = int(os.getenv("WARM_SNAPSHOT_MAX_AGE", "3600"))  # older snapshots are ignored
+
+# Status snapshot for fast `--status` (written by the running bot)
+STATUS_FILE = DATA_DIR / "status.json"
+STATUS_SNAPSHOT_INTERVAL = int(os.getenv("STATUS_SNAPSHOT_INTERVAL", "30"))
+STATUS_MAX_AGE = int(os.getenv("STATUS_MAX_AGE", "300"))
+
+# Process-split mode (collector / writer / trader over shared memory rings)
+RING_CAPACITY = int(os.getenv("RING_CAPACITY", "16384"))  # records, power of two
+RING_POLL_INTERVAL = float(os.getenv("RING_POLL_INTERVAL", "0.0005"))  # seconds
+SPLIT_STATS_INTERVAL = int(os.getenv("SPLIT_STATS_INTERVAL", "60"))
+
+# Metrics (local Prometheus endpoint, 0 disables it)
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9108"))
+METRICS_DUMP_INTERVAL = int(os.getenv("METRICS_DUMP_INTERVAL", "60"))
+
+# Runtime profiler (settings live in control.json "profiling")
+PROFILER_POLL_INTERVAL = float(os.getenv("PROFILER_POLL_INTERVAL", "2"))
+
+# Control file for real-time adjustments
+CONTROL_FILE = BASE_DIR / "control.json"
 
-# Logging
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+# Logging (JSON lines written by a background thread, see eventlog.py)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")  # INFO shows event lines, WARNING only errors + summaries
+LOG_DIR = Path(os.getenv("LOG_DIR", DATA_DIR / "logs"))
+LOG_ROTATE_MB = int(os.getenv("LOG_ROTATE_MB", "64"))  # rotate the log file past this size
+LOG_KEEP_FILES = int(os.getenv("LOG_KEEP_FILES", "5"))  # rotated log files kept on disk
+LOG_QUEUE_MAX = int(os.getenv("LOG_QUEUE_MAX", "100000"))  # records waiting; beyond that they're dropped
+LOG_CONSOLE_RATE = float(os.getenv("LOG_CONSOLE_RATE", "2"))  # console lines per second per event type
+LOG_CONSOLE_BURST = int(os.getenv("LOG_CONSOLE_BURST", "5"))
+LOG_SUMMARY_INTERVAL = float(os.getenv("LOG_SUMMARY_INTERVAL", "5"))  # seconds between activity summaries
 
 # Position sizing by creator score
 def get_position_size(creator_score: float) -> float:
@@ -0,0 +1,52 @@
+"""
+CIPHER Sniper Bot - Control File
+Hot-reloaded control.json, re-parsed only when the file changes on disk
+"""
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from config import CONTROL_FILE
+
+
+class ControlFile:
+    """
+    Cached view of control.json
+
+    Every `load()` costs a single stat(); the JSON is only parsed again when
+    the modification time changes. `version` is bumped on every successful
+    reload so callers can cheaply detect that settings changed.
+    """
+
+    def __init__(self, path: Path = CONTROL_FILE):
+        self.path = path
+        self.data: Dict[str, Any] = {}
+        self.version = 0
+        self._mtime: Optional[int] = None
+
+    def load(self) -> Dict[str, Any]:
+        """Return current settings, reloading if the file changed"""
+        try:
+            mtime = self.path.stat().st_mtime_ns
+        except OSError:
+            return self.data
+
+        if mtime != self._mtime:
+            # Remember the mtime even on failure so a broken file is reported once
+            self._mtime = mtime
+            try:
+                with open(self.path, 'r') as f:
+                    self.data = json.load(f)
+                self.version += 1
+            except Exception as e:
+                print(f"[CONTROL] Error loading control file: {e}")
+
+        return self.data
+
+    def get(self, key: str, default=None):
+        """Get control value with fallback to default"""
+        return self.load().get(key, default)
+
+
+# Singleton instance
+control = ControlFile()
@@ -1,33 +1,229 @@
 """
 CIPHER Sniper Bot - Database Manager
-SQLite async database for tracking tokens, creators, and trades
+SQLite async database for tracking tokens, creators, and trades.
+High-churn price_history lives in a separate file attached as "ticks",
+with its own durability setting, checkpoints and rotation.
 """
+import asyncio
+import os
+import sqlite3
 import aiosqlite
-from datetime import datetime
+from collections import OrderedDict
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 import json
-
-from config import DB_PATH
+import time
+
+from config import (
+    DB_PATH, DB_SYNCHRONOUS, DB_CHECKPOINT_INTERVAL, TICKS_DB_PATH, TICKS_SYNCHRONOUS,
+    TICKS_CHECKPOINT_INTERVAL, TICKS_FLUSH_ROWS, TICKS_FLUSH_INTERVAL, TICKS_ROTATE_MB,
+    TICKS_KEEP_FILES, TOKEN_CACHE_SIZE, CREATOR_CACHE_SIZE
+)
+from metrics import DB_COMMIT_SECONDS, DB_CHECKPOINT_SECONDS
+
+# Columns added after the first schema version: table -> [(column, type)]
+# (ALTER TABLE can't add columns with non-constant defaults, so these are set explicitly)
+MIGRATIONS = {
+    "tokens": [("last_activity", "REAL")],      # unix time of creation / last trade
+    "paper_trades": [("entry_reason", "TEXT")], # strategy that opened the trade
+    "creators": [
+        ("updated_at", "REAL"),                 # unix time aggregates last changed
+        ("tokens_finished", "INTEGER DEFAULT 0"),
+        ("max_peak_mcap", "REAL DEFAULT 0"),
+    ],
+}
 
 
 class Database:
-    def __init__(self, db_path: Path = DB_PATH):
+    def __init__(self, db_path: Path = DB_PATH, ticks_path: Path = TICKS_DB_PATH):
         self.db_path = db_path
+        self.ticks_path = ticks_path
         self.conn: Optional[aiosqlite.Connection] = None
+        # Processes that never touch price_history (split-mode trader) skip the
+        # tick file, so only one process ever holds it open
+        self.attach_ticks = True
+        self.has_prev_ticks = False  # last rotated tick file attached as ticks_prev
+        self.tick_buffer: List[tuple] = []  # price_history rows waiting for a batch insert
+        # Hot caches, kept coherent by this instance's writes and saved in
+        # warm-start snapshots. Processes that don't own creator writes set
+        # creator_cache_size = 0.
+        self.peaks: OrderedDict = OrderedDict()     # mint -> [peak_price, peak_mcap]
+        self.creators: OrderedDict = OrderedDict()  # wallet -> creators row
+        self.creator_cache_size = CREATOR_CACHE_SIZE
 
     async def connect(self):
         """Initialize database connection and create tables"""
         self.conn = await aiosqlite.connect(self.db_path)
         self.conn.row_factory = aiosqlite.Row
+        # WAL lets the split-mode writer and trader processes share the file
+        await self.conn.execute("PRAGMA journal_mode=WAL")
+        await self.conn.execute(f"PRAGMA main.synchronous={DB_SYNCHRONOUS}")
         await self._create_tables()
+        if self.attach_ticks:
+            await self._attach_ticks()
+        await self._migrate()
         print(f"[DB] Connected to {self.db_path}")
 
     async def close(self):
         """Close database connection"""
         if self.conn:
+            if self.attach_ticks:
+                await self.flush_ticks()
             await self.conn.close()
 
+    async def _commit(self):
+        """Commit and record latency"""
+        start = time.perf_counter()
+        await self.conn.commit()
+        DB_COMMIT_SECONDS.observe(time.perf_counter() - start)
+
+    @staticmethod
+    def _cache_put(cache: OrderedDict, key: str, value, size: int):
+        """Insert into a bounded LRU cache"""
+        if size <= 0:
+            return
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > size:
+            cache.popitem(last=False)
+
+    # ==================== TICK DATABASE ====================
+
+    @staticmethod
+    def _file_in_use(path: Path) -> bool:
+        """
+        True if another connection has a WAL database open. Every WAL
+        connection holds a SHARED lock on the file while open (idle or not),
+        so an exclusive lock is only granted when nobody else has it.
+        """
+        probe = sqlite3.connect(str(path), timeout=0, isolation_level=None)
+        try:
+            probe.execute("PRAGMA locking_mode=EXCLUSIVE")
+            probe.execute("BEGIN EXCLUSIVE")
+            probe.execute("ROLLBACK")
+            return False
+        except sqlite3.OperationalError:
+            return True
+        finally:
+            probe.close()
+
+    def _tick_archives(self) -> List[Path]:
+        """Rotated tick files, oldest first"""
+        return sorted(self.ticks_path.parent.glob(f"{self.ticks_path.stem}.*.db"))
+
+    async def _attach_ticks(self):
+        """Attach the tick file, and the newest rotated one for reads"""
+        await self.conn.execute("ATTACH DATABASE ? AS ticks", (str(self.ticks_path),))
+        await self.conn.execute("PRAGMA ticks.journal_mode=WAL")
+        await self.conn.execute(f"PRAGMA ticks.synchronous={TICKS_SYNCHRONOUS}")
+        await self.conn.executescript("""
+            -- PRICE HISTORY: Snapshots for analysis
+            CREATE TABLE IF NOT EXISTS ticks.price_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                mint TEXT,
+                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                price REAL,
+                mcap REAL
+            );
+
+            CREATE INDEX IF NOT EXISTS ticks.idx_price_mint ON price_history(mint);
+        """)
+
+        archives = self._tick_archives()
+        self.has_prev_ticks = bool(archives)
+        if archives:
+            # Lifecycle analytics may still need ticks from just before a rotation
+            await self.conn.execute("ATTACH DATABASE ? AS ticks_prev", (str(archives[-1]),))
+            # A fresh tick file continues the previous one's ids, so ids stay
+            # monotonic across rotations (incremental export relies on it)
+            await self.conn.execute("""
+                INSERT INTO ticks.sqlite_sequence (name, seq)
+                SELECT 'price_history', MAX(id) FROM ticks_prev.price_history
+                HAVING MAX(id) IS NOT NULL
+                   AND NOT EXISTS (SELECT 1 FROM ticks.sqlite_sequence WHERE name = 'price_history')
+            """)
+            await self._commit()
+
+    async def flush_ticks(self):
+        """Insert buffered ticks in their own transaction"""
+        if not self.tick_buffer:
+            return
+        rows, self.tick_buffer = self.tick_buffer, []
+        try:
+            await self.conn.executemany("""
+                INSERT INTO ticks.price_history (mint, timestamp, price, mcap)
+                VALUES (?, ?, ?, ?)
+            """, rows)
+            await self._commit()
+        except Exception as e:
+            print(f"[DB] Error writing {len(rows)} ticks: {e}")
+
+    async def checkpoint(self, schema: str = "main", mode: str = "PASSIVE") -> tuple:
+        """Checkpoint one attached database's WAL: (busy, wal_pages, checkpointed_pages)"""
+        start = time.perf_counter()
+        cursor = await self.conn.execute(f"PRAGMA {schema}.wal_checkpoint({mode})")
+        row = await cursor.fetchone()
+        DB_CHECKPOINT_SECONDS.labels(schema).observe(time.perf_counter() - start)
+        return tuple(row)
+
+    async def rotate_ticks(self) -> Optional[Path]:
+        """
+        Archive the tick file and start an empty one. The archive stays
+        attached as ticks_prev until the next rotation; archives beyond
+        TICKS_KEEP_FILES are deleted. Returns the archive path.
+        """
+        await self.flush_ticks()
+        busy, _, _ = await self.checkpoint("ticks", "TRUNCATE")
+        if self.has_prev_ticks:
+            await self.conn.execute("DETACH DATABASE ticks_prev")
+        await self.conn.execute("DETACH DATABASE ticks")
+
+        # Renaming a file another connection (e.g. --export) has open would
+        # delete its -wal / -shm from under it mid-read
+        if busy or await asyncio.to_thread(self._file_in_use, self.ticks_path):
+            print("[DB] Tick file in use by another connection, not rotating")
+            await self._attach_ticks()
+            return None
+
+        archive = self.ticks_path.with_name(
+            f"{self.ticks_path.stem}.{time.strftime('%Y%m%d-%H%M%S')}.db")
+        os.replace(self.ticks_path, archive)
+        for suffix in ("-wal", "-shm"):
+            Path(f"{self.ticks_path}{suffix}").unlink(missing_ok=True)
+        for old in self._tick_archives()[:-TICKS_KEEP_FILES or None]:
+            old.unlink(missing_ok=True)
+
+        await self._attach_ticks()
+        print(f"[DB] Rotated tick database to {archive.name}")
+        return archive
+
+    async def run_maintenance(self):
+        """
+        Flush buffered ticks and checkpoint each file on its own schedule
+        until cancelled, rotating the tick file once it outgrows TICKS_ROTATE_MB.
+        Automatic checkpoints are turned off on this connection.
+        """
+        await self.conn.execute("PRAGMA wal_autocheckpoint=0")
+        now = time.monotonic()
+        next_main = now + DB_CHECKPOINT_INTERVAL
+        next_ticks = now + TICKS_CHECKPOINT_INTERVAL
+        while True:
+            await asyncio.sleep(TICKS_FLUSH_INTERVAL)
+            try:
+                await self.flush_ticks()
+                now = time.monotonic()
+                if self.attach_ticks and now >= next_ticks:
+                    await self.checkpoint("ticks")
+                    if TICKS_ROTATE_MB and self.ticks_path.stat().st_size > TICKS_ROTATE_MB * 1024 * 1024:
+                        await self.rotate_ticks()
+                    next_ticks = now + TICKS_CHECKPOINT_INTERVAL
+                if now >= next_main:
+                    await self.checkpoint("main")
+                    next_main = now + DB_CHECKPOINT_INTERVAL
+            except Exception as e:
+                print(f"[DB] Maintenance error: {e}")
+
     async def _create_tables(self):
         """Create all required tables"""
         await self.conn.executescript("""
@@ -53,7 +249,8 @@ class Database:
 
                 -- Analysis
                 time_to_peak_seconds INTEGER,
-                simulated_profit_percent REAL
+                simulated_profit_percent REAL,
+                last_activity REAL
             );
 
             -- CREATORS: Wallet history and scoring
@@ -68,23 +265,18 @@ class Database:
                 avg_peak_mcap REAL DEFAULT 0,
                 total_volume REAL DEFAULT 0,
 
+                tokens_finished INTEGER DEFAULT 0,
+                max_peak_mcap REAL DEFAULT 0,
+
                 -- Scoring
                 trust_score REAL DEFAULT 50,
                 risk_level TEXT DEFAULT 'unknown',
 
                 -- Flags
                 is_blacklisted BOOLEAN DEFAULT FALSE,
-                blacklist_reason TEXT
-            );
+                blacklist_reason TEXT,
 
-            -- PRICE HISTORY: Snapshots for analysis
-            CREATE TABLE IF NOT EXISTS price_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                mint TEXT,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                price REAL,
-                mcap REAL,
-                FOREIGN KEY (mint) REFERENCES tokens(mint)
+                updated_at REAL
             );
 
             -- PAPER TRADES: Simulated trades
@@ -99,6 +291,7 @@ class Database:
                 entry_mcap REAL,
                 entry_amount_sol REAL,
                 creator_score_at_entry REAL,
+                entry_reason TEXT,
 
                 -- Exit
                 exit_timestamp TIMESTAMP,
@@ -117,6 +310,31 @@ class Database:
                 FOREIGN KEY (mint) REFERENCES tokens(mint)
             );
 
+            -- TOKEN METADATA: Parsed metadata JSON behind tokens.uri
+            CREATE TABLE IF NOT EXISTS token_metadata (
+                mint TEXT PRIMARY KEY,
+                uri TEXT,
+                content_hash TEXT,
+                name TEXT,
+                symbol TEXT,
+                description TEXT,
+                image TEXT,
+                twitter TEXT,
+                telegram TEXT,
+                website TEXT,
+                fetch_ms REAL,
+                error TEXT,
+                fetched_at REAL,
+
+                FOREIGN KEY (mint) REFERENCES tokens(mint)
+            );
+
+            -- META: Worker watermarks and other small key/value state
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+
             -- PAPER PORTFOLIO: Current state
             CREATE TABLE IF NOT EXISTS paper_portfolio (
                 id INTEGER PRIMARY KEY CHECK (id = 1),
@@ -132,22 +350,95 @@ class Database:
             CREATE INDEX IF NOT EXISTS idx_tokens_creator ON tokens(creator_wallet);
             CREATE INDEX IF NOT EXISTS idx_tokens_status ON tokens(status);
             CREATE INDEX IF NOT EXISTS idx_tokens_created ON tokens(created_at);
-            CREATE INDEX IF NOT EXISTS idx_price_mint ON price_history(mint);
             CREATE INDEX IF NOT EXISTS idx_trades_status ON paper_trades(status);
         """)
-        await self.conn.commit()
+        await self._commit()
+
+    async def _migrate(self):
+        """Add columns introduced after a database was first created"""
+        added = set()
+        for table, columns in MIGRATIONS.items():
+            cursor = await self.conn.execute(f"PRAGMA table_info({table})")
+            existing = {row['name'] for row in await cursor.fetchall()}
+            for column, col_type in columns:
+                if column not in existing:
+                    await self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {col_type}")
+                    added.add(column)
+
+        if "tokens_finished" in added:
+            # Roll up history that was finalized before these aggregates existed
+            await self.conn.execute("""
+                UPDATE creators SET
+                    tokens_finished = (
+                        SELECT COUNT(*) FROM tokens
+                        WHERE creator_wallet = creators.wallet AND status != 'active'),
+                    max_peak_mcap = COALESCE((
+                        SELECT MAX(peak_mcap) FROM tokens
+                        WHERE creator_wallet = creators.wallet AND status != 'active'), 0),
+                    updated_at = ?
+            """, (time.time(),))
+
+        if self.attach_ticks:
+            await self._migrate_price_history()
+
+        # Backfill activity time for rows written before the column existed
+        await self.conn.executescript("""
+            UPDATE tokens SET last_activity = CAST(strftime('%s', created_at) AS REAL)
+            WHERE last_activity IS NULL;
+
+            CREATE INDEX IF NOT EXISTS idx_tokens_activity ON tokens(last_activity, mint);
+            CREATE INDEX IF NOT EXISTS idx_creators_updated ON creators(updated_at);
+        """)
+        await self._commit()
+
+    async def _migrate_price_history(self):
+        """Move price_history out of the main file (ids kept, so an interrupted move can resume)"""
+        cursor = await self.conn.execute(
+            "SELECT 1 FROM main.sqlite_master WHERE type = 'table' AND name = 'price_history'"
+        )
+        if not await cursor.fetchone():
+            return
+
+        print("[DB] Moving price_history to the tick database...")
+        await self.conn.execute("""
+            INSERT OR IGNORE INTO ticks.price_history (id, mint, timestamp, price, mcap)
+            SELECT id, mint, timestamp, price, mcap FROM main.price_history
+        """)
+        await self._commit()
+        await self.conn.execute("DROP TABLE main.price_history")
+        await self._commit()
+
+    # ==================== META ====================
+
+    async def get_meta(self, key: str, default: str = None) -> Optional[str]:
+        """Get a value from the meta key/value table"""
+        cursor = await self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,))
+        row = await cursor.fetchone()
+        return row['value'] if row else default
+
+    async def set_meta(self, key: str, value: str, commit: bool = True):
+        """Set a value in the meta key/value table"""
+        await self.conn.execute("""
+            INSERT INTO meta (key, value) VALUES (?, ?)
+            ON CONFLICT(key) DO UPDATE SET value = excluded.value
+        """, (key, value))
+        if commit:
+            await self._commit()
 
     # ==================== TOKEN OPERATIONS ====================
 
     async def add_token(self, mint: str, name: str, symbol: str,
                        creator: str, uri: str = None) -> bool:
-        """Add new token to database"""
+        """Add new token to database (False if it was already known)"""
         try:
-            await self.conn.execute("""
-                INSERT OR IGNORE INTO tokens (mint, name, symbol, creator_wallet, uri)
-                VALUES (?, ?, ?, ?, ?)
-            """, (mint, name, symbol, creator, uri))
-            await self.conn.commit()
+            cursor = await self.conn.execute("""
+                INSERT OR IGNORE INTO tokens (mint, name, symbol, creator_wallet, uri, last_activity)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (mint, name, symbol, creator, uri, time.time()))
+            await self._commit()
+            if not cursor.rowcount:
+                return False
+            self._cache_put(self.peaks, mint, [0.0, 0.0], TOKEN_CACHE_SIZE)
 
             # Update creator stats
             await self._update_creator_on_new_token(creator)
@@ -159,30 +450,37 @@ class Database:
     async def update_token_price(self, mint: str, price: float, mcap: float):
         """Update token current price and track peak"""
         try:
-            # Get current peak
-            cursor = await self.conn.execute(
-                "SELECT peak_mcap, peak_price FROM tokens WHERE mint = ?", (mint,)
-            )
-            row = await cursor.fetchone()
-
-            if row:
-                new_peak_mcap = max(row['peak_mcap'] or 0, mcap)
-                new_peak_price = max(row['peak_price'] or 0, price)
+            # Get current peak (cached for recently active tokens)
+            peaks = self.peaks.get(mint)
+            if peaks is None:
+                cursor = await self.conn.execute(
+                    "SELECT peak_mcap, peak_price FROM tokens WHERE mint = ?", (mint,)
+                )
+                row = await cursor.fetchone()
+                if row:
+                    peaks = [row['peak_price'] or 0, row['peak_mcap'] or 0]
+                    self._cache_put(self.peaks, mint, peaks, TOKEN_CACHE_SIZE)
+            else:
+                self.peaks.move_to_end(mint)
+
+            if peaks:
+                new_peak_mcap = peaks[1] = max(peaks[1], mcap)
+                new_peak_price = peaks[0] = max(peaks[0], price)
 
                 await self.conn.execute("""
                     UPDATE tokens
                     SET current_price = ?, current_mcap = ?,
-                        peak_price = ?, peak_mcap = ?
+                        peak_price = ?, peak_mcap = ?, last_activity = ?
                     WHERE mint = ?
-                """, (price, mcap, new_peak_price, new_peak_mcap, mint))
+                """, (price, mcap, new_peak_price, new_peak_mcap, time.time(), mint))
 
-                # Add to price history
-                await self.conn.execute("""
-                    INSERT INTO price_history (mint, price, mcap)
-                    VALUES (?, ?, ?)
-                """, (mint, price, mcap))
+                await self._commit()
 
-                await self.conn.commit()
+                # Price history is batched into the tick database
+                self.tick_buffer.append(
+                    (mint, time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime()), price, mcap))
+                if len(self.tick_buffer) >= TICKS_FLUSH_ROWS:
+                    await self.flush_ticks()
         except Exception as e:
             print(f"[DB] Error updating price: {e}")
 
@@ -205,26 +503,67 @@ class Database:
         rows = await cursor.fetchall()
         return [dict(row) for row in rows]
 
+    # ==================== TOKEN METADATA ====================
+
+    async def save_token_metadata(self, mint: str, uri: str, content_hash: Optional[str],
+                                  meta: Optional[Dict], fetch_ms: float,
+                                  error: Optional[str] = None):
+        """Store a metadata fetch result (meta is None when the fetch failed)"""
+        meta = meta or {}
+        await self.conn.execute("""
+            INSERT OR REPLACE INTO token_metadata
+            (mint, uri, content_hash, name, symbol, description, image,
+             twitter, telegram, website, fetch_ms, error, fetched_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (mint, uri, content_hash, meta.get("name"), meta.get("symbol"),
+              meta.get("description"), meta.get("image"), meta.get("twitter"),
+              meta.get("telegram"), meta.get("website"), fetch_ms, error, time.time()))
+        await self._commit()
+
+    async def get_token_metadata(self, mint: str) -> Optional[Dict]:
+        """Get stored metadata for a token"""
+        cursor = await self.conn.execute(
+            "SELECT * FROM token_metadata WHERE mint = ?", (mint,)
+        )
+        row = await cursor.fetchone()
+        return dict(row) if row else None
+
     # ==================== CREATOR OPERATIONS ====================
 
     async def _update_creator_on_new_token(self, wallet: str):
         """Update creator stats when they create a new token"""
         await self.conn.execute("""
-            INSERT INTO creators (wallet, tokens_created, last_seen)
-            VALUES (?, 1, CURRENT_TIMESTAMP)
+            INSERT INTO creators (wallet, tokens_created, last_seen, updated_at)
+            VALUES (?, 1, CURRENT_TIMESTAMP, ?)
             ON CONFLICT(wallet) DO UPDATE SET
                 tokens_created = tokens_created + 1,
-                last_seen = CURRENT_TIMESTAMP
-        """, (wallet,))
-        await self.conn.commit()
+                last_seen = CURRENT_TIMESTAMP,
+                updated_at = excluded.updated_at
+        """, (wallet, time.time()))
+        await self._commit()
+
+        cached = self.creators.get(wallet)
+        if cached:
+            cached["tokens_created"] += 1
+            cached["last_seen"] = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+            cached["updated_at"] = time.time()
 
     async def get_creator(self, wallet: str) -> Optional[Dict]:
         """Get creator by wallet address"""
+        cached = self.creators.get(wallet)
+        if cached:
+            self.creators.move_to_end(wallet)
+            return dict(cached)
+
         cursor = await self.conn.execute(
             "SELECT * FROM creators WHERE wallet = ?", (wallet,)
         )
         row = await cursor.fetchone()
-        return dict(row) if row else None
+        if not row:
+            return None
+        creator = dict(row)
+        self._cache_put(self.creators, wallet, creator, self.creator_cache_size)
+        return dict(creator)
 
     async def update_creator_score(self, wallet: str, score: float, risk: str):
         """Update creator trust score"""
@@ -233,7 +572,8 @@ class Database:
             SET trust_score = ?, risk_level = ?
             WHERE wallet = ?
         """, (score, risk, wallet))
-        await self.conn.commit()
+        await self._commit()
+        self.creators.pop(wallet, None)
 
     async def blacklist_creator(self, wallet: str, reason: str):
         """Add creator to blacklist"""
@@ -242,7 +582,8 @@ class Database:
             SET is_blacklisted = TRUE, blacklist_reason = ?
             WHERE wallet = ?
         """, (reason, wallet))
-        await self.conn.commit()
+        await self._commit()
+        self.creators.pop(wallet, None)
 
     async def get_creator_leaderboard(self, limit: int = 20) -> List[Dict]:
         """Get top creators by score"""
@@ -255,6 +596,143 @@ class Database:
         rows = await cursor.fetchall()
         return [dict(row) for row in rows]
 
+    # ==================== LIFECYCLE ANALYTICS ====================
+
+    async def get_quiet_tokens(self, after: float, after_mint: str,
+                               quiet_before: float, limit: int) -> List[Dict]:
+        """
+        Tokens whose last activity is past the (last_activity, mint) watermark
+        but older than quiet_before, oldest first
+        """
+        cursor = await self.conn.execute("""
+            SELECT mint, creator_wallet, created_at, last_activity FROM tokens
+            WHERE (last_activity > ? OR (last_activity = ? AND mint > ?))
+              AND last_activity <= ?
+            ORDER BY last_activity, mint
+            LIMIT ?
+        """, (after, after, after_mint, quiet_before, limit))
+        rows = await cursor.fetchall()
+        return [dict(row) for row in rows]
+
+    async def get_price_histories(self, mints: List[str]) -> Dict[str, List[tuple]]:
+        """mint -> [(unix_ts, price, mcap), ...] in insertion order"""
+        histories: Dict[str, List[tuple]] = {m: [] for m in mints}
+        if not mints:
+            return histories
+
+        placeholders = ",".join("?" * len(mints))
+        schemas = ["ticks_prev", "ticks"] if self.has_prev_ticks else ["ticks"]
+        parts = " UNION ALL ".join(f"""
+            SELECT {part} AS part, id, mint,
+                   CAST(strftime('%s', timestamp) AS INTEGER) AS ts, price, mcap
+            FROM {schema}.price_history
+            WHERE mint IN ({placeholders})
+        """ for part, schema in enumerate(schemas))
+        cursor = await self.conn.execute(f"""
+            SELECT mint, ts, price, mcap FROM ({parts})
+            ORDER BY mint, part, id
+        """, mints * len(schemas))
+        for mint, ts, price, mcap in await cursor.fetchall():
+            histories[mint].append((ts, price, mcap))
+        return histories
+
+    async def save_lifecycle(self, updates: List[tuple], creators: List[str],
+                             watermark: str):
+        """
+        Write lifecycle metrics for a chunk of tokens, roll them up into the
+        touched creators and advance the watermark - all in one commit.
+        updates: [(status, graduated_at, time_to_peak_seconds, simulated_profit_percent, mint)]
+        """
+        await self.conn.executemany("""
+            UPDATE tokens SET
+                status = ?, graduated_at = ?,
+                time_to_peak_seconds = ?, simulated_profit_percent = ?
+            WHERE mint = ?
+        """, updates)
+
+        now = time.time()
+        await self.conn.executemany("""
+            UPDATE creators SET
+                tokens_graduated = (
+                    SELECT COUNT(*) FROM tokens
+                    WHERE creator_wallet = ? AND status = 'graduated'),
+                tokens_finished = (
+                    SELECT COUNT(*) FROM tokens
+                    WHERE creator_wallet = ? AND status != 'active'),
+                avg_peak_mcap = COALESCE((
+                    SELECT AVG(peak_mcap) FROM tokens
+                    WHERE creator_wallet = ? AND status != 'active'), 0),
+                max_peak_mcap = COALESCE((
+                    SELECT MAX(peak_mcap) FROM tokens
+                    WHERE creator_wallet = ? AND status != 'active'), 0),
+                updated_at = ?
+            WHERE wallet = ?
+        """, [(w, w, w, w, now, w) for w in creators])
+
+        await self.set_meta("lifecycle_watermark", watermark, commit=False)
+        await self._commit()
+        for wallet in creators:
+            self.creators.pop(wallet, None)
+
+    # ==================== CREATOR SCORING ====================
+
+    async def get_creator_features(self, after: float, until: float) -> List[tuple]:
+        """
+        Feature rows for creators whose aggregates changed in (after, until]:
+        (wallet, trust_score, risk_level, tokens_created, tokens_finished,
+         tokens_graduated, avg_peak_mcap, max_peak_mcap, launch_span_seconds)
+        Reads only the rolled-up creator columns, so cost scales with the
+        number of touched creators rather than their token history.
+        """
+        cursor = await self.conn.execute("""
+            SELECT wallet, trust_score, risk_level,
+                   tokens_created, tokens_finished, tokens_graduated,
+                   avg_peak_mcap, max_peak_mcap,
+                   COALESCE((julianday(last_seen) - julianday(first_seen)) * 86400, 0)
+            FROM creators
+            WHERE updated_at > ? AND updated_at <= ?
+        """, (after, until))
+        cursor.row_factory = None  # plain tuples: much cheaper than Row at this volume
+        return await cursor.fetchall()
+
+    async def save_creator_scores(self, scores: List[tuple], watermark: float):
+        """
+        Bulk UPSERT of (wallet, trust_score, risk_level) and the scoring
+        watermark in one commit. Leaves updated_at alone so scoring doesn't
+        re-trigger itself.
+        """
+        await self.conn.executemany("""
+            INSERT INTO creators (wallet, trust_score, risk_level) VALUES (?, ?, ?)
+            ON CONFLICT(wallet) DO UPDATE SET
+                trust_score = excluded.trust_score,
+                risk_level = excluded.risk_level
+        """, scores)
+        await self.set_meta("scoring_watermark", repr(watermark), commit=False)
+        await self._commit()
+        for wallet, score, risk in scores:
+            cached = self.creators.get(wallet)
+            if cached:
+                cached["trust_score"], cached["risk_level"] = score, risk
+
+    # ==================== WARM START ====================
+
+    async def get_token_peaks_since(self, since: float) -> List[tuple]:
+        """(mint, peak_price, peak_mcap) for tokens created or traded after `since`"""
+        cursor = await self.conn.execute("""
+            SELECT mint, COALESCE(peak_price, 0), COALESCE(peak_mcap, 0)
+            FROM tokens WHERE last_activity > ?
+        """, (since,))
+        cursor.row_factory = None
+        return await cursor.fetchall()
+
+    async def get_creators_changed_since(self, since: float) -> List[str]:
+        """Wallets of creators updated after `since`"""
+        cursor = await self.conn.execute(
+            "SELECT wallet FROM creators WHERE updated_at > ?", (since,)
+        )
+        cursor.row_factory = None
+        return [row[0] for row in await cursor.fetchall()]
+
     # ==================== PAPER TRADING OPERATIONS ====================
 
     async def init_paper_portfolio(self, initial_balance: float):
@@ -263,7 +741,7 @@ class Database:
             INSERT OR REPLACE INTO paper_portfolio (id, balance_sol)
             VALUES (1, ?)
         """, (initial_balance,))
-        await self.conn.commit()
+        await self._commit()
 
     async def get_paper_portfolio(self) -> Dict:
         """Get current paper portfolio state"""
@@ -275,14 +753,15 @@ class Database:
 
     async def open_paper_trade(self, mint: str, creator: str,
                                price: float, mcap: float,
-                               amount_sol: float, creator_score: float) -> int:
+                               amount_sol: float, creator_score: float,
+                               entry_reason: str = "new_token") -> int:
         """Open a new paper trade"""
         cursor = await self.conn.execute("""
             INSERT INTO paper_trades
             (mint, creator_wallet, entry_timestamp, entry_price, entry_mcap,
-             entry_amount_sol, creator_score_at_entry, status)
-            VALUES (?, ?, CURRENT_TIMESTAMP, ?, ?, ?, ?, 'open')
-        """, (mint, creator, price, mcap, amount_sol, creator_score))
+             entry_amount_sol, creator_score_at_entry, entry_reason, status)
+            VALUES (?, ?, CURRENT_TIMESTAMP, ?, ?, ?, ?, ?, 'open')
+        """, (mint, creator, price, mcap, amount_sol, creator_score, entry_reason))
 
         # Deduct from balance
         await self.conn.execute("""
@@ -291,7 +770,7 @@ class Database:
             WHERE id = 1
         """, (amount_sol,))
 
-        await self.conn.commit()
+        await self._commit()
         return cursor.lastrowid
 
     async def close_paper_trade(self, trade_id: int, exit_price: float,
@@ -346,7 +825,7 @@ class Database:
             WHERE id = 1
         """, (exit_amount, profit_sol, 1 if is_win else 0, 0 if is_win else 1))
 
-        await self.conn.commit()
+        await self._commit()
 
         return {
             "trade_id": trade_id,
@@ -0,0 +1,227 @@
+"""
+CIPHER Sniper Bot - Event Log
+Structured logging off the event loop. A log call only enqueues a tuple;
+a background thread turns records into JSON lines in
+LOG_DIR/cipher_<role>.jsonl (rotated by size) and drives the console:
+
+    event lines   printed from the caller's template, at most
+                  LOG_CONSOLE_RATE per second per event (bursts of
+                  LOG_CONSOLE_BURST)
+    summaries     every LOG_SUMMARY_INTERVAL seconds when lines were held
+                  back: "+340 new_token in last 5s"
+
+A slow stdout or disk delays the writer thread, never the trading loop.
+"""
+import atexit
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+from config import (
+    LOG_LEVEL, LOG_DIR, LOG_ROTATE_MB, LOG_KEEP_FILES, LOG_QUEUE_MAX,
+    LOG_CONSOLE_RATE, LOG_CONSOLE_BURST, LOG_SUMMARY_INTERVAL
+)
+
+INFO = "info"
+ERROR = "error"
+
+# LOG_LEVEL WARNING / ERROR keeps info events out of the console (file only)
+SHOW_INFO = LOG_LEVEL.upper() in ("DEBUG", "INFO")
+
+# Records serialized per file write
+WRITE_BATCH = 100
+
+_STOP = object()
+
+
+class EventLog:
+    """
+    Call info() / error() from anywhere; the writer thread starts on the
+    first record and drains the queue on exit.
+    """
+
+    def __init__(self, role: str = "main", directory=LOG_DIR):
+        self.role = role
+        self.directory = directory
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.thread: Optional[threading.Thread] = None
+        self.dropped = 0   # records refused because the queue was full
+        self.written = 0
+        # Writer thread state
+        self.file = None
+        self.size = 0
+        self.counts: Counter = Counter()      # records per event since the last summary
+        self.held_back: Counter = Counter()   # console lines skipped by the rate limit
+        self.allowance: Dict[str, tuple] = {}  # event -> (tokens, updated)
+        self.reported_dropped = 0
+
+    @property
+    def path(self):
+        return self.directory / f"cipher_{self.role}.jsonl"
+
+    # ==================== HOT PATH ====================
+
+    def info(self, event: str, console: Optional[str] = None, **fields):
+        """
+        Log an event. `console` is a str.format template over the fields,
+        printed subject to the rate limit; the JSON line always has them all.
+        """
+        if self.thread is None:
+            self.start()
+        if self.queue.qsize() >= LOG_QUEUE_MAX:
+            self.dropped += 1
+            return
+        self.queue.put((time.time(), INFO, event, console, fields))
+
+    def error(self, event: str, console: Optional[str] = None, **fields):
+        """Same as info(), shown on the console whatever LOG_LEVEL says"""
+        if self.thread is None:
+            self.start()
+        if self.queue.qsize() >= LOG_QUEUE_MAX:
+            self.dropped += 1
+            return
+        self.queue.put((time.time(), ERROR, event, console, fields))
+
+    # ==================== WRITER THREAD ====================
+
+    def start(self):
+        if self.thread is not None:
+            return
+        self.thread = threading.Thread(target=self._run, name=f"eventlog-{self.role}", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def close(self, timeout: float = 5.0):
+        """Write out everything queued and stop the thread"""
+        thread = self.thread
+        if thread is None or not thread.is_alive():
+            return
+        self.queue.put(_STOP)
+        thread.join(timeout)
+
+    def _run(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._open()
+        last_summary = time.monotonic()
+        stopping = False
+        while not stopping:
+            lines: List[str] = []
+            console: List[str] = []
+            try:
+                item = self.queue.get(timeout=max(0.0, last_summary + LOG_SUMMARY_INTERVAL - time.monotonic()))
+                while True:
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    self._handle(item, lines, console)
+                    if len(lines) >= WRITE_BATCH:
+                        break
+                    item = self.queue.get_nowait()
+            except queue.Empty:
+                pass
+
+            if lines:
+                self._write(lines)
+                time.sleep(0)  # hand the GIL back to the event loop between batches
+            if console:
+                self._print("\n".join(console))
+
+            now = time.monotonic()
+            if stopping or now >= last_summary + LOG_SUMMARY_INTERVAL:
+                self._summarize(now - last_summary)
+                last_summary = now
+        self.file.close()
+
+    def _handle(self, item: tuple, lines: List[str], console: List[str]):
+        ts, level, event, template, fields = item
+        self.counts[event] += 1
+        record = {"ts": round(ts, 6), "level": level, "event": event}
+        record.update(fields)
+        lines.append(json.dumps(record, default=str, ensure_ascii=False))
+
+        if template is None or (level == INFO and not SHOW_INFO):
+            return
+        if not self._allow(event):
+            self.held_back[event] += 1
+            return
+        try:
+            console.append(template.format(**fields))
+        except (KeyError, IndexError, ValueError) as e:
+            console.append(f"[LOG] Bad console template for {event}: {e}")
+
+    def _allow(self, event: str) -> bool:
+        """Per-event token bucket for console lines"""
+        now = time.monotonic()
+        tokens, updated = self.allowance.get(event, (LOG_CONSOLE_BURST, now))
+        tokens = min(LOG_CONSOLE_BURST, tokens + (now - updated) * LOG_CONSOLE_RATE)
+        allowed = tokens >= 1
+        self.allowance[event] = (tokens - 1 if allowed else tokens, now)
+        return allowed
+
+    def _summarize(self, elapsed: float):
+        """One line of counts, only when some lines were held back or hidden"""
+        dropped = self.dropped - self.reported_dropped
+        if self.counts and (self.held_back or dropped or not SHOW_INFO):
+            counts = ", ".join(f"+{n} {event}" for event, n in self.counts.most_common())
+            line = f"[ACTIVITY] {counts} in last {elapsed:.0f}s"
+            if self.held_back:
+                line += f" ({sum(self.held_back.values())} lines not shown)"
+            if dropped:
+                line += f" | {dropped} records dropped, log queue full"
+            self._print(line)
+        self.counts.clear()
+        self.held_back.clear()
+        self.reported_dropped += dropped
+
+    # ==================== FILES ====================
+
+    def _open(self):
+        self.file = open(self.path, "ab")
+        self.size = self.file.tell()
+
+    def _write(self, lines: List[str]):
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+        try:
+            if self.size + len(data) > LOG_ROTATE_MB * 1024 * 1024:
+                self._rotate()
+            self.file.write(data)
+            self.file.flush()
+        except OSError as e:
+            self._print(f"[LOG] Error writing {self.path.name}: {e}")
+            return
+        self.size += len(data)
+        self.written += len(lines)
+
+    def _rotate(self):
+        """cipher_x.jsonl -> .1 -> .2 ..., keeping LOG_KEEP_FILES"""
+        self.file.close()
+        path = self.path
+        for i in range(LOG_KEEP_FILES - 1, 0, -1):
+            older = path.with_name(f"{path.name}.{i}")
+            if older.exists():
+                os.replace(older, path.with_name(f"{path.name}.{i + 1}"))
+        if LOG_KEEP_FILES > 0:
+            os.replace(path, path.with_name(f"{path.name}.1"))
+        else:
+            path.unlink()
+        self._open()
+
+    @staticmethod
+    def _print(text: str):
+        try:
+            sys.stdout.write(text + "\n")
+            sys.stdout.flush()
+        except (OSError, ValueError):
+            pass  # closed or broken stdout must not kill the writer
+
+    def stats(self) -> Dict[str, int]:
+        return {"queued": self.queue.qsize(), "written": self.written, "dropped": self.dropped}
+
+
+# Singleton instance
+event_log = EventLog()
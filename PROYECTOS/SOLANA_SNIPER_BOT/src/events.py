@@ -0,0 +1,95 @@
+"""
+CIPHER Sniper Bot - Event Decoding
+Turns raw PumpPortal frames (bytes or str) into typed events. Parsed with
+orjson when it's installed, stdlib json otherwise. Only the fields the bot
+uses are kept, and numbers are coerced to float once here instead of in
+every handler:
+
+    NewToken    create event ("mint" without a buy/sell txType)
+    Trade       buy / sell on a watched mint or by a watched wallet
+    None        anything else (subscription acks, errors)
+"""
+import json
+from typing import Optional, Union
+
+try:
+    import orjson
+    JSON_BACKEND = "orjson"
+    _loads = orjson.loads
+except ImportError:  # optional dependency
+    JSON_BACKEND = "json"
+    _loads = json.loads
+
+# orjson.JSONDecodeError subclasses this too
+DecodeError = json.JSONDecodeError
+
+
+class NewToken:
+    """Token creation; sol_amount / initial_buy are the creator's first buy"""
+    __slots__ = ("mint", "creator", "name", "symbol", "uri", "bonding_curve",
+                 "sol_amount", "initial_buy", "mcap")
+
+    def __init__(self, mint: str, creator: str, name: str, symbol: str, uri: Optional[str],
+                 bonding_curve: Optional[str], sol_amount: float, initial_buy: float, mcap: float):
+        self.mint = mint
+        self.creator = creator
+        self.name = name
+        self.symbol = symbol
+        self.uri = uri
+        self.bonding_curve = bonding_curve
+        self.sol_amount = sol_amount
+        self.initial_buy = initial_buy
+        self.mcap = mcap
+
+
+class Trade:
+    """Buy or sell; price is SOL per token, 0 if either amount is missing"""
+    __slots__ = ("mint", "trader", "is_buy", "sol_amount", "token_amount", "mcap")
+
+    def __init__(self, mint: str, trader: str, is_buy: bool,
+                 sol_amount: float, token_amount: float, mcap: float):
+        self.mint = mint
+        self.trader = trader
+        self.is_buy = is_buy
+        self.sol_amount = sol_amount
+        self.token_amount = token_amount
+        self.mcap = mcap
+
+    @property
+    def price(self) -> float:
+        return self.sol_amount / self.token_amount if self.token_amount > 0 else 0.0
+
+
+def decode(message: Union[bytes, str], loads=_loads) -> Union[NewToken, Trade, None]:
+    """
+    One frame to an event. Raises DecodeError on invalid JSON and
+    ValueError / TypeError on non-numeric amounts.
+    """
+    data = loads(message)
+    if type(data) is not dict:
+        return None
+
+    # Trades carry a mint too, so dispatch on txType first
+    tx_type = data.get("txType")
+    if tx_type == "buy" or tx_type == "sell":
+        return Trade(
+            data.get("mint"),
+            data.get("traderPublicKey") or "",
+            tx_type == "buy",
+            float(data.get("solAmount") or 0),
+            float(data.get("tokenAmount") or 0),
+            float(data.get("marketCapSol") or 0),
+        )
+    if "mint" in data:
+        return NewToken(
+            data["mint"],
+            data.get("traderPublicKey") or data.get("creator"),
+            data.get("name", "Unknown"),
+            data.get("symbol", "???"),
+            data.get("uri"),
+            data.get("bondingCurveKey"),
+            float(data.get("solAmount") or 0),
+            float(data.get("initialBuy") or 0),
+            float(data.get("marketCapSol") or 0),
+        )
+    return None
@@ -0,0 +1,389 @@
+"""
+CIPHER Sniper Bot - Data Export
+Streams tokens, price_history and paper_trades out of SQLite in fixed-size
+keyset chunks and appends them to columnar files, so memory stays flat no
+matter how large the tables are. Parquet when pyarrow is installed,
+otherwise chunked CSV or NPZ. Stdlib + read-only connections only, like
+status_snapshot.
+
+Exports are incremental: the watermark per table is kept in
+exports/watermarks.json and each run continues from it.
+
+    tokens          (last_activity, mint) up to the lifecycle watermark,
+                    so every token is exported once it is finalized
+    price_history   id, across the current and rotated tick files
+    paper_trades    id, plus the ids still open at the last run, so each
+                    trade is exported once it closes and a stuck position
+                    doesn't hold back the ones after it
+"""
+import csv
+import json
+import os
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from config import DB_PATH, TICKS_DB_PATH, EXPORT_DIR, EXPORT_CHUNK_ROWS
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional dependency
+    pa = None
+
+TABLES = ("tokens", "price_history", "paper_trades")
+FORMATS = ("parquet", "csv", "npz")
+DEFAULT_FORMAT = "parquet" if pa is not None else "csv"
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    """Read-only connection: never creates files or takes write locks"""
+    return sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+
+
+def _columns(conn: sqlite3.Connection, table: str) -> List[Tuple[str, str]]:
+    """[(name, kind)] with kind one of int / float / str, from declared types"""
+    columns = []
+    for _, name, decl, *_ in conn.execute(f"PRAGMA table_info({table})"):
+        decl = (decl or "").upper()
+        if "INT" in decl or "BOOL" in decl:
+            kind = "int"
+        elif "REAL" in decl or "FLOA" in decl or "DOUB" in decl:
+            kind = "float"
+        else:
+            kind = "str"
+        columns.append((name, kind))
+    return columns
+
+
+# ==================== CHUNK GENERATORS ====================
+
+def iter_chunks(conn: sqlite3.Connection, sql: str, key, start, stop, chunk_rows: int) -> Iterator[List[tuple]]:
+    """
+    Keyset pagination: `sql` selects rows with key > ? and key <= ?, ordered
+    by key. `key(row)` gives the next start. Each chunk is its own query, so
+    no read transaction is held across chunks.
+    """
+    while True:
+        rows = conn.execute(sql, (*_flat(start), *_flat(stop), chunk_rows)).fetchall()
+        if not rows:
+            return
+        yield rows
+        if len(rows) < chunk_rows:
+            return
+        start = key(rows[-1])
+
+
+def _flat(value) -> tuple:
+    return value if isinstance(value, tuple) else (value,)
+
+
+def iter_tokens(conn: sqlite3.Connection, columns: List[str], after: Tuple[float, str],
+                chunk_rows: int = EXPORT_CHUNK_ROWS) -> Iterator[List[tuple]]:
+    """Finalized tokens after `after`, in (last_activity, mint) order"""
+    raw = _meta(conn, "lifecycle_watermark", "0|")
+    ts, _, mint = raw.partition("|")
+    until = (float(ts), mint)
+    if until <= after:
+        return iter(())
+
+    key_at = columns.index("last_activity"), columns.index("mint")
+    sql = f"""
+        SELECT {", ".join(columns)} FROM tokens
+        WHERE (last_activity > ? OR (last_activity = ? AND mint > ?))
+          AND (last_activity < ? OR (last_activity = ? AND mint <= ?))
+        ORDER BY last_activity, mint
+        LIMIT ?
+    """
+    return iter_chunks(conn, sql, lambda row: (row[key_at[0]], row[key_at[0]], row[key_at[1]]),
+                       (after[0], after[0], after[1]), (until[0], until[0], until[1]), chunk_rows)
+
+
+def iter_by_id(conn: sqlite3.Connection, table: str, columns: List[str], after: int, until: int,
+               chunk_rows: int = EXPORT_CHUNK_ROWS, where: str = "") -> Iterator[List[tuple]]:
+    """Rows with after < id <= until (and `where`, if given), in id order"""
+    id_at = columns.index("id")
+    sql = f"""
+        SELECT {", ".join(columns)} FROM {table}
+        WHERE id > ? AND id <= ? {f"AND {where}" if where else ""}
+        ORDER BY id
+        LIMIT ?
+    """
+    return iter_chunks(conn, sql, lambda row: row[id_at], after, until, chunk_rows)
+
+
+def iter_ids(conn: sqlite3.Connection, table: str, columns: List[str], ids: List[int],
+             chunk_rows: int = EXPORT_CHUNK_ROWS, where: str = "") -> Iterator[List[tuple]]:
+    """Rows with one of `ids` (and `where`, if given), in id order"""
+    ids = sorted(ids)
+    step = min(chunk_rows, 500)  # bound parameters per query
+    for i in range(0, len(ids), step):
+        batch = ids[i:i + step]
+        rows = conn.execute(f"""
+            SELECT {", ".join(columns)} FROM {table}
+            WHERE id IN ({", ".join("?" * len(batch))}) {f"AND {where}" if where else ""}
+            ORDER BY id
+        """, batch).fetchall()
+        if rows:
+            yield rows
+
+
+def _meta(conn: sqlite3.Connection, key: str, default: str) -> str:
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    except sqlite3.Error:
+        return default
+    return row[0] if row else default
+
+
+def tick_files(ticks_path: Path = TICKS_DB_PATH) -> List[Path]:
+    """Rotated tick files oldest first, then the current one"""
+    files = sorted(ticks_path.parent.glob(f"{ticks_path.stem}.*.db"))
+    if ticks_path.exists():
+        files.append(ticks_path)
+    return files
+
+
+# ==================== WRITERS ====================
+
+class ChunkWriter(ABC):
+    """Appends column-oriented chunks to one output (file or file set)"""
+
+    def __init__(self, base: Path, columns: List[Tuple[str, str]]):
+        self.base = base
+        self.names = [name for name, _ in columns]
+        self.kinds = [kind for _, kind in columns]
+        self.chunks = 0
+        self.paths: List[Path] = []
+
+    def write(self, rows: List[tuple]):
+        self._write(rows)
+        self.chunks += 1
+
+    @abstractmethod
+    def _write(self, rows: List[tuple]):
+        """Append one chunk of rows"""
+
+    def close(self):
+        pass
+
+
+class ParquetWriter(ChunkWriter):
+    """One Parquet file per run, one row group per chunk"""
+    ARROW_TYPES = {"int": "int64", "float": "float64", "str": "string"}
+
+    def __init__(self, base: Path, columns: List[Tuple[str, str]]):
+        super().__init__(base, columns)
+        self.schema = pa.schema([(name, getattr(pa, self.ARROW_TYPES[kind])())
+                                 for name, kind in columns])
+        path = base.with_suffix(".parquet")
+        self.writer = pq.ParquetWriter(path, self.schema)
+        self.paths.append(path)
+
+    def _write(self, rows: List[tuple]):
+        arrays = [pa.array(column, type=field.type)
+                  for column, field in zip(zip(*rows), self.schema)]
+        self.writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+class CsvWriter(ChunkWriter):
+    """One CSV file per run, appended chunk by chunk"""
+
+    def __init__(self, base: Path, columns: List[Tuple[str, str]]):
+        super().__init__(base, columns)
+        path = base.with_suffix(".csv")
+        self.file = open(path, "w", newline="")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(self.names)
+        self.paths.append(path)
+
+    def _write(self, rows: List[tuple]):
+        self.writer.writerows(rows)
+
+    def close(self):
+        self.file.close()
+
+
+class NpzWriter(ChunkWriter):
+    """One .npz per chunk, an array per column (NULL ints become float NaN)"""
+
+    def _write(self, rows: List[tuple]):
+        import numpy as np
+
+        arrays = {}
+        for name, kind, column in zip(self.names, self.kinds, zip(*rows)):
+            if kind == "str":
+                arrays[name] = np.array(["" if v is None else str(v) for v in column])
+            elif kind == "int" and None not in column:
+                arrays[name] = np.array(column, dtype=np.int64)
+            else:
+                arrays[name] = np.array([np.nan if v is None else v for v in column], dtype=np.float64)
+        path = Path(f"{self.base}-{self.chunks:05d}.npz")
+        np.savez(path, **arrays)
+        self.paths.append(path)
+
+
+WRITERS = {"parquet": ParquetWriter, "csv": CsvWriter, "npz": NpzWriter}
+
+
+# ==================== EXPORT ====================
+
+class Exporter:
+    """
+    Incremental table export. Watermarks only advance after a table's
+    output is complete, so an interrupted run is simply repeated.
+    """
+
+    def __init__(self, out_dir: Path = EXPORT_DIR, fmt: str = DEFAULT_FORMAT,
+                 chunk_rows: int = EXPORT_CHUNK_ROWS, db_path: Path = DB_PATH,
+                 ticks_path: Path = TICKS_DB_PATH):
+        if fmt not in FORMATS:
+            raise ValueError(f"unknown export format {fmt!r}, expected one of {FORMATS}")
+        if fmt == "parquet" and pa is None:
+            raise ValueError("parquet export needs pyarrow (pip install pyarrow), use csv or npz")
+        self.out_dir = out_dir
+        self.fmt = fmt
+        self.chunk_rows = chunk_rows
+        self.db_path = db_path
+        self.ticks_path = ticks_path
+        self.watermark_file = out_dir / "watermarks.json"
+
+    def load_watermarks(self) -> Dict:
+        try:
+            with open(self.watermark_file, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_watermarks(self, watermarks: Dict):
+        tmp = self.watermark_file.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(watermarks, f, indent=2)
+        os.replace(tmp, self.watermark_file)
+
+    def _writer(self, table: str, columns: List[Tuple[str, str]]) -> ChunkWriter:
+        directory = self.out_dir / table
+        directory.mkdir(parents=True, exist_ok=True)
+        name = f"{table}-{time.strftime('%Y%m%d-%H%M%S')}"
+        # Never overwrite an earlier export: its watermark has already moved on
+        base, n = directory / name, 1
+        while any(directory.glob(f"{base.name}.*")) or any(directory.glob(f"{base.name}-0*.npz")):
+            base, n = directory / f"{name}-{n}", n + 1
+        return WRITERS[self.fmt](base, columns)
+
+    def _drain(self, writer: Optional[ChunkWriter], make_writer, chunks: Iterator[List[tuple]],
+               result: Dict) -> Tuple[Optional[ChunkWriter], Optional[tuple]]:
+        """Write every chunk (the writer is created on the first one), returns (writer, last row)"""
+        last = None
+        for rows in chunks:
+            if writer is None:
+                writer = make_writer()
+            writer.write(rows)
+            result["rows"] += len(rows)
+            last = rows[-1]
+        return writer, last
+
+    def export_table(self, table: str, watermarks: Dict) -> Dict:
+        """Export one table from its watermark, returns rows, seconds, files"""
+        start = time.perf_counter()
+        result = {"rows": 0}
+        writer = None
+
+        conn = _connect(self.db_path)
+        try:
+            if table == "price_history":
+                after = int(watermarks.get(table, 0))
+                for path in tick_files(self.ticks_path):
+                    ticks = _connect(path)
+                    try:
+                        columns = _columns(ticks, table)
+                        names = [name for name, _ in columns]
+                        until = ticks.execute("SELECT MAX(id) FROM price_history").fetchone()[0] or 0
+                        writer, last = self._drain(
+                            writer, lambda: self._writer(table, columns),
+                            iter_by_id(ticks, table, names, after, until, self.chunk_rows), result)
+                        if last is not None:
+                            after = last[names.index("id")]
+                    finally:
+                        ticks.close()
+                watermark = after
+
+            elif table == "paper_trades":
+                columns = _columns(conn, table)
+                names = [name for name, _ in columns]
+                mark = watermarks.get(table, 0)
+                if not isinstance(mark, dict):
+                    # Plain id from older runs: everything up to it was closed
+                    mark = {"id": mark, "open": []}
+                after = int(mark["id"])
+                until = conn.execute("SELECT COALESCE(MAX(id), 0) FROM paper_trades").fetchone()[0]
+                # Taken before the scans: a trade only goes open -> closed, so
+                # a new trade not in here is closed by the time it's read
+                still_open = set(mark["open"])
+                still_open.update(row[0] for row in conn.execute(
+                    "SELECT id FROM paper_trades WHERE status = 'open' AND id > ? AND id <= ?",
+                    (after, until)))
+
+                id_at = names.index("id")
+                exported = set()
+
+                def closed(chunks: Iterator[List[tuple]]) -> Iterator[List[tuple]]:
+                    for rows in chunks:
+                        exported.update(row[id_at] for row in rows)
+                        yield rows
+
+                # Trades left open by earlier runs that have closed since, then new ones
+                writer, _ = self._drain(
+                    writer, lambda: self._writer(table, columns),
+                    closed(iter_ids(conn, table, names, mark["open"], self.chunk_rows,
+                                    where="status != 'open'")), result)
+                writer, _ = self._drain(
+                    writer, lambda: self._writer(table, columns),
+                    closed(iter_by_id(conn, table, names, after, until, self.chunk_rows,
+                                      where="status != 'open'")), result)
+                watermark = {"id": until, "open": sorted(still_open - exported)}
+
+            elif table == "tokens":
+                columns = _columns(conn, table)
+                names = [name for name, _ in columns]
+                ts, _, mint = str(watermarks.get(table, "0|")).partition("|")
+                after = (float(ts), mint)
+                writer, last = self._drain(
+                    writer, lambda: self._writer(table, columns),
+                    iter_tokens(conn, names, after, self.chunk_rows), result)
+                if last is not None:
+                    after = (last[names.index("last_activity")], last[names.index("mint")])
+                watermark = f"{after[0]!r}|{after[1]}"
+
+            else:
+                raise ValueError(f"unknown table {table!r}, expected one of {TABLES}")
+        finally:
+            conn.close()
+            if writer is not None:
+                writer.close()
+
+        watermarks[table] = watermark
+        result["seconds"] = time.perf_counter() - start
+        result["files"] = [str(p) for p in writer.paths] if writer else []
+        return result
+
+    def export(self, tables=TABLES, full: bool = False) -> Dict[str, Dict]:
+        """Export tables in turn, saving each watermark as soon as its table is done"""
+        if not self.db_path.exists():
+            raise FileNotFoundError(f"no database at {self.db_path}")
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        watermarks = {} if full else self.load_watermarks()
+
+        results = {}
+        for table in tables:
+            results[table] = result = self.export_table(table, watermarks)
+            self._save_watermarks(watermarks)
+            rate = result["rows"] / result["seconds"] if result["seconds"] > 0 else 0
+            print(f"[EXPORT] {table}: {result['rows']} rows in {result['seconds']:.2f}s "
+                  f"({rate:,.0f} rows/s) -> {len(result['files'])} {self.fmt} file(s)")
+        return results
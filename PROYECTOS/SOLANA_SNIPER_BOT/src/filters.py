@@ -0,0 +1,391 @@
+"""
+CIPHER Sniper Bot - Entry Filter Pipeline
+Declarative token filters compiled into a cost-ordered chain of closures
+"""
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from config import (
+    MAX_POSITION_SIZE, MAX_OPEN_POSITIONS, METADATA_BUDGET_MS, RPC_BUDGET_MS,
+    MIN_CREATOR_SCORE, MIN_CREATOR_TOKENS, get_position_size
+)
+from database import db
+from eventlog import event_log
+from metadata import SOCIAL_FIELDS, metadata_fetcher
+from rpc import RPCError, rpc
+from trade_flow import trade_flow
+
+# Cost tiers: every cheap (in-memory) filter runs before any expensive one
+COST_CHEAP = 0
+COST_EXPENSIVE = 1
+
+BLACKLIST_CONSOLE = "[SKIP] Creator {creator:.16}... is blacklisted"
+
+# Filter order used when control.json has no "filters" list
+DEFAULT_FILTERS = [
+    "trading_enabled",
+    "pause_new_trades",
+    "blacklist",
+    "whitelist",
+    "min_creator_score",
+    "min_creator_tokens",
+    "max_open_positions",
+    "not_already_open",
+    "balance",
+]
+
+# Filter order for copy-trade signals ("copy_filters" in control.json)
+DEFAULT_COPY_FILTERS = [
+    "trading_enabled",
+    "pause_new_trades",
+    "copy_trading_enabled",
+    "blacklist",
+    "max_open_positions",
+    "not_already_open",
+    "balance",
+]
+
+# Re-rank filters from observed stats every N evaluations
+REORDER_EVERY = 256
+
+
+class Filter:
+    """
+    A single compiled filter: a closure plus its pass/reject/time counters
+    """
+    __slots__ = ("name", "check", "cost", "is_async", "passed", "rejected", "time_ns")
+
+    def __init__(self, name: str, check: Callable, cost: int = COST_CHEAP,
+                 is_async: bool = False):
+        self.name = name
+        self.check = check
+        self.cost = cost
+        self.is_async = is_async
+        self.passed = 0
+        self.rejected = 0
+        self.time_ns = 0
+
+    @property
+    def calls(self) -> int:
+        return self.passed + self.rejected
+
+    @property
+    def rejection_rate(self) -> float:
+        return self.rejected / self.calls if self.calls else 0.0
+
+    @property
+    def avg_ns(self) -> float:
+        return self.time_ns / self.calls if self.calls else 0.0
+
+    def rank(self) -> float:
+        """
+        Expected time spent per rejection - lower runs earlier.
+        For independent filters, sorting by cost / P(reject) minimizes the
+        average time to reject a token.
+        """
+        if not self.calls:
+            return 0.0
+        return self.avg_ns / max(self.rejection_rate, 1e-3)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "passed": self.passed,
+            "rejected": self.rejected,
+            "rejection_rate": self.rejection_rate,
+            "avg_us": self.avg_ns / 1000,
+            "total_ms": self.time_ns / 1e6,
+        }
+
+
+# ==================== FILTER REGISTRY ====================
+
+# name -> builder(trader, settings) -> Filter
+FILTERS: Dict[str, Callable[[Any, Dict], Filter]] = {}
+
+
+def register(name: str):
+    """Register a filter builder under a control.json name"""
+    def decorator(builder):
+        FILTERS[name] = builder
+        return builder
+    return decorator
+
+
+@register("trading_enabled")
+def _trading_enabled(trader, settings: Dict) -> Filter:
+    enabled = bool(settings.get("trading_enabled", True))
+    return Filter("trading_enabled", lambda token: enabled)
+
+
+@register("pause_new_trades")
+def _pause_new_trades(trader, settings: Dict) -> Filter:
+    paused = bool(settings.get("pause_new_trades", False))
+    return Filter("pause_new_trades", lambda token: not paused)
+
+
+@register("copy_trading_enabled")
+def _copy_trading_enabled(trader, settings: Dict) -> Filter:
+    enabled = bool(settings.get("copy_trading_enabled", True))
+    return Filter("copy_trading_enabled", lambda token: enabled)
+
+
+@register("blacklist")
+def _blacklist(trader, settings: Dict) -> Filter:
+    blacklist = frozenset(settings.get("blacklist_creators", []))
+
+    def check(token: Dict) -> bool:
+        creator = token.get("creator")
+        if creator in blacklist:
+            event_log.info("blacklist_skip", BLACKLIST_CONSOLE, mint=token.get("mint"), creator=creator)
+            return False
+        return True
+
+    return Filter("blacklist", check)
+
+
+@register("whitelist")
+def _whitelist(trader, settings: Dict) -> Filter:
+    whitelist = frozenset(settings.get("whitelist_creators", []))
+
+    # If whitelist exists and is not empty, only trade whitelisted
+    if not whitelist:
+        return Filter("whitelist", lambda token: True)
+    return Filter("whitelist", lambda token: token.get("creator") in whitelist)
+
+
+@register("min_creator_score")
+def _min_creator_score(trader, settings: Dict) -> Filter:
+    min_score = settings.get("min_creator_score", MIN_CREATOR_SCORE)
+    return Filter(
+        "min_creator_score",
+        lambda token: token.get("creator_score", 50) >= min_score
+    )
+
+
+@register("min_creator_tokens")
+def _min_creator_tokens(trader, settings: Dict) -> Filter:
+    min_tokens = settings.get("min_creator_tokens", MIN_CREATOR_TOKENS)
+    return Filter(
+        "min_creator_tokens",
+        lambda token: token.get("creator_tokens", 1) >= min_tokens
+    )
+
+
+@register("max_open_positions")
+def _max_open_positions(trader, settings: Dict) -> Filter:
+    positions = trader.active_positions
+    return Filter(
+        "max_open_positions",
+        lambda token: len(positions) < MAX_OPEN_POSITIONS
+    )
+
+
+@register("not_already_open")
+def _not_already_open(trader, settings: Dict) -> Filter:
+    positions = trader.active_positions
+    return Filter(
+        "not_already_open",
+        lambda token: token.get("mint") not in positions
+    )
+
+
+@register("balance")
+def _balance(trader, settings: Dict) -> Filter:
+    max_size = settings.get("max_position_size", MAX_POSITION_SIZE)
+
+    async def check(token: Dict) -> bool:
+        portfolio = await db.get_paper_portfolio()
+        size = token.get("size_sol") or get_position_size(token.get("creator_score", 50))
+        position_size = min(size, max_size)
+        return portfolio.get("balance_sol", 0) >= position_size
+
+    return Filter("balance", check, cost=COST_EXPENSIVE, is_async=True)
+
+
+@register("momentum")
+def _momentum(trader, settings: Dict) -> Filter:
+    """
+    Requires buying pressure in the momentum_window ("10s", "60s" or "5m")
+    trade-flow window: at least momentum_min_buys buys from
+    momentum_min_traders traders with a buy ratio of momentum_min_buy_ratio.
+    At creation only the creator's buy is in, so the paper trader re-checks
+    tokens this rejects on their later trades.
+    """
+    window = settings.get("momentum_window", "60s")
+    min_buys = settings.get("momentum_min_buys", 3)
+    min_traders = settings.get("momentum_min_traders", 2)
+    min_buy_ratio = settings.get("momentum_min_buy_ratio", 0.6)
+
+    def check(token: Dict) -> bool:
+        flow = trade_flow.get(token.get("mint"))
+        if not flow or window not in flow:
+            return False
+        features = flow[window]
+        token["trade_flow"] = flow
+        return (features["buys"] >= min_buys
+                and features["unique_traders"] >= min_traders
+                and features["buy_ratio"] >= min_buy_ratio)
+
+    return Filter("momentum", check)
+
+
+@register("metadata")
+def _metadata(trader, settings: Dict) -> Filter:
+    """
+    Waits up to metadata_budget_ms for the token's metadata, then requires
+    metadata_min_socials social links. Tokens whose metadata isn't ready in
+    time pass only if metadata_allow_missing is set.
+    """
+    budget = settings.get("metadata_budget_ms", METADATA_BUDGET_MS) / 1000
+    min_socials = settings.get("metadata_min_socials", 1)
+    allow_missing = bool(settings.get("metadata_allow_missing", False))
+
+    async def check(token: Dict) -> bool:
+        meta = await metadata_fetcher.get(token.get("mint"), budget)
+        token["metadata"] = meta
+        if meta is None:
+            return allow_missing
+        return sum(1 for field in SOCIAL_FIELDS if meta.get(field)) >= min_socials
+
+    return Filter("metadata", check, cost=COST_EXPENSIVE, is_async=True)
+
+
+async def _on_chain(read, budget: float):
+    """An RPC read bounded by the filter budget, None on timeout or error"""
+    try:
+        return await asyncio.wait_for(read, budget)
+    except (asyncio.TimeoutError, RPCError, KeyError, TypeError):
+        return None
+
+
+@register("creator_balance")
+def _creator_balance(trader, settings: Dict) -> Filter:
+    """
+    Requires the creator wallet to hold at least creator_min_balance_sol SOL
+    on-chain. Balances not read within rpc_budget_ms pass only if
+    rpc_allow_missing is set.
+    """
+    min_balance = settings.get("creator_min_balance_sol", 0.5)
+    budget = settings.get("rpc_budget_ms", RPC_BUDGET_MS) / 1000
+    allow_missing = bool(settings.get("rpc_allow_missing", False))
+
+    async def check(token: Dict) -> bool:
+        balance = await _on_chain(rpc.get_balance(token.get("creator")), budget)
+        token["creator_balance"] = balance
+        if balance is None:
+            return allow_missing
+        return balance >= min_balance
+
+    return Filter("creator_balance", check, cost=COST_EXPENSIVE, is_async=True)
+
+
+@register("bonding_curve")
+def _bonding_curve(trader, settings: Dict) -> Filter:
+    """
+    Reads the token's bonding curve account and requires an open curve with
+    between curve_min_sol and curve_max_sol real SOL in it. Needs the
+    bondingCurveKey from the create event; tokens without it, or whose curve
+    isn't read within rpc_budget_ms, pass only if rpc_allow_missing is set.
+    """
+    min_sol = settings.get("curve_min_sol", 0.0)
+    max_sol = settings.get("curve_max_sol", 30.0)
+    budget = settings.get("rpc_budget_ms", RPC_BUDGET_MS) / 1000
+    allow_missing = bool(settings.get("rpc_allow_missing", False))
+
+    async def check(token: Dict) -> bool:
+        key = token.get("bonding_curve")
+        curve = await _on_chain(rpc.get_bonding_curve(key), budget) if key else None
+        token["curve"] = curve
+        if curve is None:
+            return allow_missing
+        return not curve["complete"] and min_sol <= curve["real_sol"] <= max_sol
+
+    return Filter("bonding_curve", check, cost=COST_EXPENSIVE, is_async=True)
+
+
+# ==================== PIPELINE ====================
+
+class FilterPipeline:
+    """
+    Compiles the declared filter list into closures and runs them in
+    cost order, re-ranking cheap filters by observed rejection rate
+    """
+
+    def __init__(self, key: str = "filters", defaults: List[str] = DEFAULT_FILTERS):
+        self.key = key  # control.json list this pipeline is built from
+        self.defaults = defaults
+        self.filters: List[Filter] = []
+        self.sync_chain: List[Filter] = []
+        self.async_chain: List[Filter] = []
+        self.version = -1
+        self.evaluations = 0
+        self.rejected_by: Optional[str] = None  # filter that rejected the last token
+
+    def compile(self, trader, settings: Dict, version: int = 0):
+        """Build filters from settings, keeping counters of filters that survive"""
+        previous = {f.name: f for f in self.filters}
+        names = settings.get(self.key) or self.defaults
+
+        filters = []
+        for name in names:
+            builder = FILTERS.get(name)
+            if not builder:
+                print(f"[FILTERS] Unknown filter '{name}', skipping")
+                continue
+            f = builder(trader, settings)
+            old = previous.get(name)
+            if old:
+                f.passed, f.rejected, f.time_ns = old.passed, old.rejected, old.time_ns
+            filters.append(f)
+
+        self.filters = filters
+        self.version = version
+        self.reorder()
+
+    def ensure_compiled(self, trader, settings: Dict, version: int):
+        """Recompile only when the control settings changed"""
+        if version != self.version:
+            self.compile(trader, settings, version)
+
+    def reorder(self):
+        """Sort each cost tier by expected time per rejection (stable)"""
+        ordered = sorted(self.filters, key=lambda f: (f.cost, f.rank()))
+        self.sync_chain = [f for f in ordered if not f.is_async]
+        self.async_chain = [f for f in ordered if f.is_async]
+
+    async def run(self, token: Dict) -> bool:
+        """Return True if the token passes every filter"""
+        self.evaluations += 1
+        if self.evaluations % REORDER_EVERY == 0:
+            self.reorder()
+
+        clock = time.perf_counter_ns
+        self.rejected_by = None
+
+        for f in self.sync_chain:
+            start = clock()
+            ok = f.check(token)
+            f.time_ns += clock() - start
+            if not ok:
+                f.rejected += 1
+                self.rejected_by = f.name
+                return False
+            f.passed += 1
+
+        for f in self.async_chain:
+            start = clock()
+            ok = await f.check(token)
+            f.time_ns += clock() - start
+            if not ok:
+                f.rejected += 1
+                self.rejected_by = f.name
+                return False
+            f.passed += 1
+
+        return True
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-filter counters in current execution order"""
+        return [f.to_dict() for f in self.sync_chain + self.async_chain]
@@ -0,0 +1,240 @@
+"""
+CIPHER Sniper Bot - Shared Memory Event Ring
+Fixed-layout event records passed between processes through a
+single-producer / single-consumer ring buffer in shared memory
+"""
+import platform
+import struct
+import time
+from datetime import datetime
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+from eventlog import event_log
+
+# Slots are published with plain stores, which only keeps them ordered on
+# x86-64 (TSO). Weaker memory models (ARM, POWER) would need fences.
+MACHINE = platform.machine()
+ORDERED_STORES = MACHINE.lower() in ("x86_64", "amd64")
+
+# Event kinds
+EVENT_NEW_TOKEN = 1
+EVENT_TRADE = 2
+
+# Header: write sequence and read sequence on separate cache lines so the
+# producer and consumer never write the same line
+_SEQ = struct.Struct("<Q")
+_WRITE_OFFSET = 0
+_READ_OFFSET = 64
+HEADER_SIZE = 128
+
+# Record layout (little endian, fixed size):
+#   kind u8, is_buy u8, creator_tokens u32,
+#   sent_ns i64 (CLOCK_MONOTONIC, comparable across processes),
+#   timestamp f64 (wall clock), sol_amount f64, token_amount f64,
+#   mcap f64, creator_score f64,
+#   mint 48s, wallet 48s (creator or trader), name 64s, symbol 16s, uri 200s
+RECORD = struct.Struct("<BBxxIqddddd48s48s64s16s200s")
+
+# Text field capacities in bytes, must match RECORD. struct pads or silently
+# cuts to these, so push() checks lengths first.
+KEY_BYTES = 48
+NAME_BYTES = 64
+SYMBOL_BYTES = 16
+URI_BYTES = 200
+
+OVERSIZE_CONSOLE = "[IPC] {field} of {mint:.16}... is {length} bytes (max {limit}), {action}"
+
+# Decoded record: (kind, is_buy, creator_tokens, sent_ns, timestamp,
+#                  sol_amount, token_amount, mcap, creator_score,
+#                  mint, wallet, name, symbol, uri)
+Record = Tuple
+
+
+def _text(raw: bytes) -> str:
+    """Decode a null-padded field (truncated UTF-8 tails are dropped)"""
+    return raw.rstrip(b"\0").decode("utf-8", "ignore")
+
+
+class EventRing:
+    """
+    SPSC ring of fixed-size event records in a SharedMemory block.
+
+    The producer writes the slot, then publishes it by bumping the write
+    sequence; the consumer reads the slot, then frees it by bumping the read
+    sequence. Sequences are aligned 8-byte stores, which is enough ordering
+    on x86-64 (TSO). A full ring never blocks the producer: the record is
+    dropped and counted.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, capacity: int, owner: bool):
+        if capacity & (capacity - 1):
+            raise ValueError("capacity must be a power of two")
+        self.shm = shm
+        self.buf = shm.buf
+        self.capacity = capacity
+        self.mask = capacity - 1
+        self.owner = owner
+        self.dropped = 0
+        self.oversize = 0  # fields that didn't fit (truncated, emptied or record dropped)
+        # Each side only ever advances its own sequence, so keep a local copy
+        self._write = _SEQ.unpack_from(self.buf, _WRITE_OFFSET)[0]
+        self._read = _SEQ.unpack_from(self.buf, _READ_OFFSET)[0]
+
+    @classmethod
+    def create(cls, capacity: int) -> "EventRing":
+        """Allocate a new ring (the creating process owns and unlinks it)"""
+        if not ORDERED_STORES:
+            raise RuntimeError(f"EventRing needs x86-64 store ordering, not {MACHINE}")
+        size = HEADER_SIZE + capacity * RECORD.size
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        shm.buf[:HEADER_SIZE] = bytes(HEADER_SIZE)
+        return cls(shm, capacity, owner=True)
+
+    @classmethod
+    def attach(cls, name: str, capacity: int) -> "EventRing":
+        """Attach to a ring created by another process"""
+        return cls(shared_memory.SharedMemory(name=name), capacity, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def depth(self) -> int:
+        """Records written but not yet consumed"""
+        return (_SEQ.unpack_from(self.buf, _WRITE_OFFSET)[0]
+                - _SEQ.unpack_from(self.buf, _READ_OFFSET)[0])
+
+    # ==================== PRODUCER ====================
+
+    def push(self, kind: int, mint: str, wallet: str = "",
+             sol_amount: float = 0.0, token_amount: float = 0.0,
+             mcap: float = 0.0, is_buy: bool = False,
+             name: str = "", symbol: str = "", uri: str = "",
+             creator_score: float = 0.0, creator_tokens: int = 0,
+             timestamp: float = 0.0) -> bool:
+        """
+        Append one record. Returns False if the ring is full (counted in
+        dropped) or the record had to be dropped for an oversize key.
+
+        Text that doesn't fit its field is never cut silently: an oversize
+        mint / wallet can't be a real key, so the record is dropped; an
+        oversize uri is sent empty (a cut URL would fetch the wrong
+        document); name / symbol are display-only and get truncated.
+        """
+        w = self._write
+        if w - _SEQ.unpack_from(self.buf, _READ_OFFSET)[0] >= self.capacity:
+            self.dropped += 1
+            return False
+
+        mint_b = mint.encode()
+        wallet_b = wallet.encode()
+        name_b = (name or "").encode()
+        symbol_b = (symbol or "").encode()
+        uri_b = (uri or "").encode()
+        if (len(mint_b) > KEY_BYTES or len(wallet_b) > KEY_BYTES or len(name_b) > NAME_BYTES
+                or len(symbol_b) > SYMBOL_BYTES or len(uri_b) > URI_BYTES):
+            if len(mint_b) > KEY_BYTES or len(wallet_b) > KEY_BYTES:
+                self._oversize("mint" if len(mint_b) > KEY_BYTES else "wallet", mint,
+                               max(len(mint_b), len(wallet_b)), KEY_BYTES, "record dropped")
+                return False
+            if len(uri_b) > URI_BYTES:
+                self._oversize("uri", mint, len(uri_b), URI_BYTES, "sent without uri")
+                uri_b = b""
+            if len(name_b) > NAME_BYTES:
+                self._oversize("name", mint, len(name_b), NAME_BYTES, "truncated")
+            if len(symbol_b) > SYMBOL_BYTES:
+                self._oversize("symbol", mint, len(symbol_b), SYMBOL_BYTES, "truncated")
+
+        RECORD.pack_into(
+            self.buf, HEADER_SIZE + (w & self.mask) * RECORD.size,
+            kind, is_buy, creator_tokens, time.monotonic_ns(),
+            timestamp or time.time(), sol_amount, token_amount, mcap, creator_score,
+            mint_b, wallet_b, name_b, symbol_b, uri_b
+        )
+        self._write = w + 1
+        _SEQ.pack_into(self.buf, _WRITE_OFFSET, self._write)
+        return True
+
+    def _oversize(self, field: str, mint: str, length: int, limit: int, action: str):
+        self.oversize += 1
+        event_log.error("ipc_oversize", OVERSIZE_CONSOLE, field=field, mint=mint,
+                        length=length, limit=limit, action=action)
+
+    # ==================== CONSUMER ====================
+
+    def pop(self) -> Optional[Record]:
+        """Take the next record, or None if the ring is empty"""
+        batch = self.pop_batch(1)
+        return batch[0] if batch else None
+
+    def pop_batch(self, max_records: int = 256) -> List[Record]:
+        """Take up to max_records records with a single read-sequence update"""
+        r = self._read
+        available = _SEQ.unpack_from(self.buf, _WRITE_OFFSET)[0] - r
+        if available <= 0:
+            return []
+
+        n = min(available, max_records)
+        buf, mask, size = self.buf, self.mask, RECORD.size
+        records = []
+        for seq in range(r, r + n):
+            rec = RECORD.unpack_from(buf, HEADER_SIZE + (seq & mask) * size)
+            records.append(rec[:9] + tuple(_text(field) for field in rec[9:]))
+
+        self._read = r + n
+        _SEQ.pack_into(buf, _READ_OFFSET, self._read)
+        return records
+
+    def close(self):
+        """Detach (and unlink if this process created the ring)"""
+        self.buf = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def record_to_token_data(rec: Record) -> Dict:
+    """Convert a NEW_TOKEN record into the collector's on_new_token payload"""
+    return {
+        "mint": rec[9],
+        "name": rec[11],
+        "symbol": rec[12],
+        "creator": rec[10],
+        "uri": rec[13] or None,
+        "creator_tokens": rec[2],
+        "creator_score": rec[8],
+        "timestamp": datetime.fromtimestamp(rec[4]),
+    }
+
+
+class LatencyStats:
+    """Cross-process latency (send -> receive) and throughput for one consumer"""
+
+    def __init__(self, window: int = 4096):
+        self.window = window
+        self.samples: List[int] = []
+        self.count = 0
+        self.started = time.monotonic()
+
+    def observe(self, rec: Record, now_ns: int):
+        self.count += 1
+        samples = self.samples
+        if len(samples) >= self.window:
+            samples[self.count % self.window] = now_ns - rec[3]
+        else:
+            samples.append(now_ns - rec[3])
+
+    def summary(self) -> Dict[str, float]:
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        ordered = sorted(self.samples)
+        if not ordered:
+            return {"events": self.count, "events_per_sec": 0.0,
+                    "p50_us": 0.0, "p99_us": 0.0, "max_us": 0.0}
+        return {
+            "events": self.count,
+            "events_per_sec": self.count / elapsed,
+            "p50_us": ordered[len(ordered) // 2] / 1000,
+            "p99_us": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] / 1000,
+            "max_us": ordered[-1] / 1000,
+        }
@@ -0,0 +1,194 @@
+"""
+CIPHER Sniper Bot - Token Metadata Fetcher
+Fetches the metadata JSON behind tokens.uri over a pooled HTTP client and
+keeps the parsed results available to the entry filters
+"""
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import aiohttp
+
+from config import (
+    METADATA_MAX_CONNECTIONS, METADATA_PER_HOST, METADATA_TIMEOUT,
+    METADATA_RETRIES, METADATA_CACHE_SIZE, METADATA_MAX_PENDING,
+    METADATA_MAX_BYTES, METADATA_IPFS_GATEWAY
+)
+from database import db
+from metrics import METADATA_FETCHES, METADATA_FETCH_SECONDS
+
+# Hot-path metric children, looked up once
+_FETCH_OK = METADATA_FETCHES.labels("ok")
+_FETCH_CACHED = METADATA_FETCHES.labels("cached")
+_FETCH_ERROR = METADATA_FETCHES.labels("error")
+_FETCH_DROPPED = METADATA_FETCHES.labels("dropped")
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_BACKOFF = 0.25  # seconds, doubled per attempt
+
+SOCIAL_FIELDS = ("twitter", "telegram", "website")
+
+
+def resolve_uri(uri: str) -> str:
+    """ipfs:// URIs go through the configured gateway"""
+    if uri.startswith("ipfs://"):
+        return METADATA_IPFS_GATEWAY + uri[len("ipfs://"):].removeprefix("ipfs/")
+    return uri
+
+
+def parse_metadata(body: bytes) -> Dict:
+    """Pick the fields the filters use out of a metadata JSON document"""
+    doc = json.loads(body)
+    if not isinstance(doc, dict):
+        raise ValueError("metadata is not a JSON object")
+
+    meta = {
+        "name": doc.get("name"),
+        "symbol": doc.get("symbol"),
+        "description": (doc.get("description") or "")[:500],
+        "image": doc.get("image"),
+    }
+    # Socials are top-level on pump.fun, nested under "extensions" elsewhere
+    extensions = doc.get("extensions") if isinstance(doc.get("extensions"), dict) else {}
+    for field in SOCIAL_FIELDS:
+        meta[field] = doc.get(field) or extensions.get(field) or None
+    return meta
+
+
+class MetadataFetcher:
+    """
+    One shared aiohttp session (connection pool with total and per-host
+    limits) fetching metadata in the background as tokens arrive.
+    Parsed documents are cached by content hash, so identical copy-paste
+    metadata served from different URIs is parsed once.
+    """
+
+    def __init__(self):
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.inflight: Dict[str, asyncio.Task] = {}      # mint -> fetch task
+        self.results: OrderedDict = OrderedDict()        # mint -> metadata (LRU)
+        self.content_cache: OrderedDict = OrderedDict()  # content hash -> metadata (LRU)
+        self.fetched = 0
+        self.cache_hits = 0
+        self.errors = 0
+
+    def _session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=METADATA_MAX_CONNECTIONS,
+                limit_per_host=METADATA_PER_HOST,
+                ttl_dns_cache=300,
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=METADATA_TIMEOUT, connect=METADATA_TIMEOUT / 2),
+                headers={"Accept": "application/json"},
+            )
+        return self.session
+
+    @staticmethod
+    def _remember(cache: OrderedDict, key: str, value: Dict):
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > METADATA_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    # ==================== SUBMIT / GET ====================
+
+    def submit(self, mint: str, uri: Optional[str]):
+        """Start fetching a token's metadata in the background (no-op if already known)"""
+        if not uri or mint in self.results or mint in self.inflight:
+            return
+        if len(self.inflight) >= METADATA_MAX_PENDING:
+            _FETCH_DROPPED.inc()
+            return
+        task = asyncio.create_task(self._fetch(mint, uri))
+        self.inflight[mint] = task
+        task.add_done_callback(lambda _: self.inflight.pop(mint, None))
+
+    async def get(self, mint: str, timeout: float) -> Optional[Dict]:
+        """
+        Metadata for a mint, waiting at most `timeout` seconds for an
+        in-flight fetch. Returns None if unknown, failed or over budget.
+        The fetch itself keeps running past the budget.
+        """
+        meta = self.results.get(mint)
+        if meta is not None:
+            return meta
+        task = self.inflight.get(mint)
+        if task is None:
+            return None
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    # ==================== FETCH ====================
+
+    async def _download(self, url: str) -> bytes:
+        """GET with retries on connection errors, timeouts and retryable statuses"""
+        session = self._session()
+        for attempt in range(METADATA_RETRIES + 1):
+            try:
+                async with session.get(url) as resp:
+                    if resp.status in RETRY_STATUSES and attempt < METADATA_RETRIES:
+                        raise aiohttp.ClientResponseError(
+                            resp.request_info, resp.history, status=resp.status)
+                    resp.raise_for_status()
+                    body = bytearray()
+                    async for chunk in resp.content.iter_chunked(65536):
+                        body += chunk
+                        if len(body) > METADATA_MAX_BYTES:
+                            raise ValueError(f"metadata larger than {METADATA_MAX_BYTES} bytes")
+                    return bytes(body)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                retryable = not isinstance(e, aiohttp.ClientResponseError) or e.status in RETRY_STATUSES
+                if attempt >= METADATA_RETRIES or not retryable:
+                    raise
+                await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+    async def _fetch(self, mint: str, uri: str) -> Optional[Dict]:
+        start = time.perf_counter()
+        content_hash = None
+        try:
+            body = await self._download(resolve_uri(uri))
+            content_hash = hashlib.blake2b(body, digest_size=16).hexdigest()
+
+            meta = self.content_cache.get(content_hash)
+            if meta is None:
+                meta = parse_metadata(body)
+                _FETCH_OK.inc()
+            else:
+                self.cache_hits += 1
+                _FETCH_CACHED.inc()
+            self._remember(self.content_cache, content_hash, meta)
+            self._remember(self.results, mint, meta)
+            self.fetched += 1
+            error = None
+        except Exception as e:
+            self.errors += 1
+            _FETCH_ERROR.inc()
+            meta = None
+            error = (f"{type(e).__name__}: {e}" if str(e) else type(e).__name__)[:200]
+
+        elapsed = time.perf_counter() - start
+        METADATA_FETCH_SECONDS.observe(elapsed)
+        try:
+            await db.save_token_metadata(mint, uri, content_hash, meta, elapsed * 1000, error)
+        except Exception as e:
+            print(f"[METADATA] Error saving {mint[:16]}...: {e}")
+        return meta
+
+    async def close(self):
+        """Cancel pending fetches and close the connection pool"""
+        for task in list(self.inflight.values()):
+            task.cancel()
+        if self.session and not self.session.closed:
+            await self.session.close()
+
+
+# Singleton instance
+metadata_fetcher = MetadataFetcher()
@@ -0,0 +1,328 @@
+"""
+CIPHER Sniper Bot - Metrics Registry
+Counters, gauges and histograms cheap enough to leave on in production,
+served as Prometheus text over a local HTTP endpoint and dumped as JSON
+"""
+import asyncio
+import json
+import os
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from config import METRICS_HOST, METRICS_PORT, METRICS_DUMP_INTERVAL, DATA_DIR
+
+# Latency buckets in seconds (50us .. 5s)
+LATENCY_BUCKETS = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0
+)
+
+
+class Counter:
+    """Monotonic counter - `inc()` is a single attribute add"""
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+
+class Gauge:
+    """Value that can go up and down"""
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def set(self, value: float):
+        self.value = value
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+    def dec(self, amount: float = 1):
+        self.value -= amount
+
+
+class Histogram:
+    """Fixed-bucket histogram - `observe()` is one bisect and two adds"""
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # last slot is +Inf
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket containing quantile q (approximate, capped at the last bound)"""
+        total = self.count
+        if not total:
+            return 0.0
+        target = q * total
+        running = 0
+        for bound, n in zip(self.bounds, self.counts):
+            running += n
+            if running >= target:
+                return bound
+        return self.bounds[-1]
+
+
+class Metric:
+    """
+    A named metric family. Unlabeled metrics are used directly
+    (`metric.inc()`); labeled ones hand out children with `labels()`, which
+    hot paths should look up once and keep.
+    """
+
+    def __init__(self, kind: str, name: str, help: str,
+                 labelnames: Tuple[str, ...] = (), **kwargs):
+        self.kind = kind
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._kwargs = kwargs
+        self.children: Dict[Tuple[str, ...], object] = {}
+        if not labelnames:
+            self._default = self.labels()
+
+    def _new_child(self):
+        if self.kind == "counter":
+            return Counter()
+        if self.kind == "gauge":
+            return Gauge()
+        return Histogram(**self._kwargs)
+
+    def labels(self, *values: str):
+        child = self.children.get(values)
+        if child is None:
+            child = self.children[values] = self._new_child()
+        return child
+
+    # Unlabeled shortcuts
+    def inc(self, amount: float = 1):
+        self._default.inc(amount)
+
+    def dec(self, amount: float = 1):
+        self._default.dec(amount)
+
+    def set(self, value: float):
+        self._default.set(value)
+
+    def observe(self, value: float):
+        self._default.observe(value)
+
+    @property
+    def value(self):
+        return self._default.value
+
+
+class Registry:
+    """Holds all metric families and renders them"""
+
+    def __init__(self):
+        self.metrics: Dict[str, Metric] = {}
+        self.started = time.time()
+
+    def _register(self, metric: Metric) -> Metric:
+        existing = self.metrics.get(metric.name)
+        if existing:
+            return existing
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Tuple[str, ...] = ()) -> Metric:
+        return self._register(Metric("counter", name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Tuple[str, ...] = ()) -> Metric:
+        return self._register(Metric("gauge", name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: Tuple[str, ...] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Metric:
+        return self._register(Metric("histogram", name, help, labelnames, bounds=buckets))
+
+    # ==================== EXPORT ====================
+
+    @staticmethod
+    def _label_str(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+        pairs = [f'{n}="{v}"' for n, v in zip(names, values)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)"""
+        lines: List[str] = []
+        for m in self.metrics.values():
+            lines.append(f"# HELP {m.name} {m.help}")
+            lines.append(f"# TYPE {m.name} {m.kind}")
+            for values, child in m.children.items():
+                if m.kind != "histogram":
+                    lines.append(f"{m.name}{self._label_str(m.labelnames, values)} {child.value}")
+                    continue
+                running = 0
+                for bound, n in zip(child.bounds, child.counts):
+                    running += n
+                    le = self._label_str(m.labelnames, values, f'le="{bound}"')
+                    lines.append(f"{m.name}_bucket{le} {running}")
+                running += child.counts[-1]
+                le = self._label_str(m.labelnames, values, 'le="+Inf"')
+                lines.append(f"{m.name}_bucket{le} {running}")
+                labels = self._label_str(m.labelnames, values)
+                lines.append(f"{m.name}_sum{labels} {child.sum}")
+                lines.append(f"{m.name}_count{labels} {running}")
+        return "\n".join(lines) + "\n"
+
+    def to_dict(self) -> Dict:
+        """JSON-friendly snapshot (histograms summarized as count/sum/p50/p99)"""
+        out = {"timestamp": time.time(), "uptime_seconds": time.time() - self.started}
+        for m in self.metrics.values():
+            series = {}
+            for values, child in m.children.items():
+                key = ",".join(f"{n}={v}" for n, v in zip(m.labelnames, values)) or "value"
+                if m.kind == "histogram":
+                    series[key] = {
+                        "count": child.count,
+                        "sum": child.sum,
+                        "p50": child.quantile(0.5),
+                        "p99": child.quantile(0.99),
+                    }
+                else:
+                    series[key] = child.value
+            out[m.name] = series
+        return out
+
+
+# Singleton registry
+registry = Registry()
+
+
+# ==================== BOT METRICS ====================
+
+MESSAGES = registry.counter(
+    "cipher_messages_total", "WebSocket messages received by type", ("type",))
+PARSE_ERRORS = registry.counter(
+    "cipher_parse_errors_total", "WebSocket messages that failed to parse")
+RECONNECTS = registry.counter(
+    "cipher_reconnects_total", "WebSocket reconnect attempts")
+DB_COMMIT_SECONDS = registry.histogram(
+    "cipher_db_commit_seconds", "SQLite commit latency")
+DB_CHECKPOINT_SECONDS = registry.histogram(
+    "cipher_db_checkpoint_seconds", "SQLite WAL checkpoint latency by database", ("db",))
+QUEUE_DEPTH = registry.gauge(
+    "cipher_queue_depth", "Events waiting in an inter-stage queue", ("queue",))
+OPEN_POSITIONS = registry.gauge(
+    "cipher_open_positions", "Open paper trading positions")
+DECISION_SECONDS = registry.histogram(
+    "cipher_decision_seconds", "evaluate_token latency")
+COPY_SIGNALS = registry.counter(
+    "cipher_copy_signals_total", "Buys by watched wallets that produced a copy-trade signal")
+METADATA_FETCHES = registry.counter(
+    "cipher_metadata_fetches_total", "Token metadata fetches by result", ("result",))
+METADATA_FETCH_SECONDS = registry.histogram(
+    "cipher_metadata_fetch_seconds", "Token metadata fetch latency including retries")
+RPC_CALLS = registry.counter(
+    "cipher_rpc_calls_total", "Solana RPC reads by outcome (sent, cached, coalesced, error)", ("result",))
+RPC_REQUEST_SECONDS = registry.histogram(
+    "cipher_rpc_request_seconds", "Solana RPC HTTP round trip latency (one batch)")
+
+
+# ==================== HTTP ENDPOINT + JSON DUMP ====================
+
+async def _handle_http(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Minimal HTTP/1.0 responder for /metrics and /metrics.json"""
+    try:
+        request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+        # Drain headers
+        while (await asyncio.wait_for(reader.readline(), timeout=5)) not in (b"\r\n", b"\n", b""):
+            pass
+
+        parts = request_line.decode("latin-1").split()
+        path = parts[1] if len(parts) > 1 else "/"
+
+        if path.startswith("/metrics.json"):
+            body = json.dumps(registry.to_dict()).encode()
+            status, ctype = "200 OK", "application/json"
+        elif path.startswith("/metrics"):
+            body = registry.render_prometheus().encode()
+            status, ctype = "200 OK", "text/plain; version=0.0.4"
+        else:
+            body = b"not found\n"
+            status, ctype = "404 Not Found", "text/plain"
+
+        writer.write(
+            f"HTTP/1.0 {status}\r\nContent-Type: {ctype}\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+        )
+        await writer.drain()
+    except Exception:
+        pass
+    finally:
+        writer.close()
+
+
+_last_dump: Dict = {}
+
+
+def dump_json(path: Path):
+    """Atomically write the JSON snapshot, with per-second counter rates since the last dump"""
+    global _last_dump
+    data = registry.to_dict()
+
+    if _last_dump:
+        elapsed = max(data["timestamp"] - _last_dump["timestamp"], 1e-9)
+        rates = {}
+        for m in registry.metrics.values():
+            if m.kind != "counter":
+                continue
+            before = _last_dump.get(m.name, {})
+            rates[m.name] = {
+                key: (value - before.get(key, 0)) / elapsed
+                for key, value in data[m.name].items()
+            }
+        data["rates_per_sec"] = rates
+    _last_dump = data
+
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+async def serve(port: Optional[int] = None, dump_file: Optional[Path] = None):
+    """
+    Run the metrics endpoint and the periodic JSON dump until cancelled.
+    Port 0 disables the HTTP endpoint.
+    """
+    port = METRICS_PORT if port is None else port
+    dump_file = dump_file or DATA_DIR / "metrics.json"
+
+    server = None
+    if port:
+        try:
+            server = await asyncio.start_server(_handle_http, METRICS_HOST, port)
+            print(f"[METRICS] Serving http://{METRICS_HOST}:{port}/metrics")
+        except OSError as e:
+            print(f"[METRICS] Could not bind {METRICS_HOST}:{port}: {e}")
+
+    try:
+        while True:
+            await asyncio.sleep(METRICS_DUMP_INTERVAL)
+            try:
+                dump_json(dump_file)
+            except Exception as e:
+                print(f"[METRICS] Error writing {dump_file}: {e}")
+    finally:
+        if server:
+            server.close()
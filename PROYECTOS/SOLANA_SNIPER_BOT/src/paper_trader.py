@@ -2,21 +2,40 @@
 CIPHER Sniper Bot - Paper Trading Engine
 Simulates trades based on creator scores without real money
 """
-import asyncio
-import json
+import time
+from collections import OrderedDict
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Optional
 
 from config import (
-    PAPER_INITIAL_BALANCE, MAX_POSITION_SIZE, MAX_OPEN_POSITIONS,
-    STOP_LOSS_PERCENT, TAKE_PROFIT_1_PERCENT, TAKE_PROFIT_2_PERCENT,
-    MIN_CREATOR_SCORE, MIN_CREATOR_TOKENS, get_position_size, BASE_DIR
+    PAPER_INITIAL_BALANCE, STOP_LOSS_PERCENT, TAKE_PROFIT_2_PERCENT,
+    get_position_size
 )
+from control import control
 from database import db
-
-# Control file for real-time adjustments
-CONTROL_FILE = BASE_DIR / "control.json"
+from eventlog import event_log
+from filters import DEFAULT_COPY_FILTERS, FilterPipeline
+from metrics import DECISION_SECONDS, OPEN_POSITIONS
+from status_snapshot import print_status, write_snapshot
+from trade_flow import WINDOWS
+
+# Tokens kept waiting for momentum at once (oldest dropped first)
+MOMENTUM_PENDING_MAX = 1024
+
+# Console forms of trade events (formatted by the event log thread, rate-limited)
+COPY_CONSOLE = "[COPY] {label} bought {sol_amount:.3f} SOL of {symbol} -> {action}"
+BUY_CONSOLE = (
+    "\n[PAPER BUY] {symbol}\n"
+    "  Position: {size_sol} SOL\n"
+    "  Creator Score: {creator_score}\n"
+    "  Trade ID: {trade_id}"
+)
+SELL_CONSOLE = (
+    "\n[PAPER SELL] Trade #{trade_id}\n"
+    "  Reason: {reason}\n"
+    "  Profit: {profit_sol:+.4f} SOL ({profit_percent:+.1f}%)\n"
+    "  Hold time: {hold_time}s"
+)
 
 
 class PaperTrader:
@@ -28,22 +47,21 @@ class PaperTrader:
         self.active_positions: Dict[str, Dict] = {}  # mint -> position
         self.initialized = False
         self.control = {}  # Real-time control settings
+        self.filters = FilterPipeline()  # Entry filters, compiled from control
+        self.copy_filters = FilterPipeline("copy_filters", DEFAULT_COPY_FILTERS)
+        # New tokens rejected only by the momentum filter, re-checked on their
+        # trades until the deadline: mint -> (token_data, deadline)
+        self.awaiting_momentum: OrderedDict = OrderedDict()
         self._load_control()
 
     def _load_control(self) -> Dict:
-        """Load control settings from JSON file (hot reload)"""
-        try:
-            if CONTROL_FILE.exists():
-                with open(CONTROL_FILE, 'r') as f:
-                    self.control = json.load(f)
-        except Exception as e:
-            print(f"[CONTROL] Error loading control file: {e}")
+        """Load control settings from JSON file (hot reload on change)"""
+        self.control = control.load()
         return self.control
 
     def get_control(self, key: str, default=None):
         """Get control value with fallback to default"""
-        self._load_control()  # Reload each time for hot updates
-        return self.control.get(key, default)
+        return self._load_control().get(key, default)
 
     async def initialize(self):
         """Initialize paper trading portfolio"""
@@ -60,6 +78,7 @@ class PaperTrader:
         for trade in open_trades:
             self.active_positions[trade['mint']] = trade
 
+        OPEN_POSITIONS.set(len(self.active_positions))
         print(f"[PAPER] Open positions: {len(self.active_positions)}")
         self.initialized = True
 
@@ -68,56 +87,101 @@ class PaperTrader:
         Evaluate if we should paper-trade this token
         Returns True if we should buy
         """
-        # Check control settings (hot reload)
-        if not self.get_control("trading_enabled", True):
-            return False
-
-        if self.get_control("pause_new_trades", False):
-            return False
-
-        creator = token_data.get("creator")
-        creator_score = token_data.get("creator_score", 50)
-        creator_tokens = token_data.get("creator_tokens", 1)
+        start = time.perf_counter()
 
-        # Check blacklist/whitelist from control
-        blacklist = self.get_control("blacklist_creators", [])
-        whitelist = self.get_control("whitelist_creators", [])
-
-        if creator in blacklist:
-            print(f"[SKIP] Creator {creator[:16]}... is blacklisted")
-            return False
-
-        # If whitelist exists and is not empty, only trade whitelisted
-        if whitelist and creator not in whitelist:
-            return False
-
-        # Check basic criteria (use control values or defaults)
-        min_score = self.get_control("min_creator_score", MIN_CREATOR_SCORE)
-        min_tokens = self.get_control("min_creator_tokens", MIN_CREATOR_TOKENS)
-
-        if creator_score < min_score:
-            return False
-
-        if creator_tokens < min_tokens:
-            return False
-
-        # Check if we have too many open positions
-        if len(self.active_positions) >= MAX_OPEN_POSITIONS:
-            return False
+        # Recompile the filter chain only when control.json changed
+        self._load_control()
+        self.filters.ensure_compiled(self, self.control, control.version)
+        decision = await self.filters.run(token_data)
 
-        # Check if we already have a position in this token
-        if token_data.get("mint") in self.active_positions:
-            return False
+        DECISION_SECONDS.observe(time.perf_counter() - start)
+        if not decision and self.filters.rejected_by == "momentum":
+            self._await_momentum(token_data)
+        return decision
 
-        # Check balance
-        portfolio = await db.get_paper_portfolio()
-        max_size = self.get_control("max_position_size", MAX_POSITION_SIZE)
-        position_size = min(get_position_size(creator_score), max_size)
-
-        if portfolio.get("balance_sol", 0) < position_size:
-            return False
+    def _await_momentum(self, token_data: Dict):
+        """Park a token until its trades show momentum or its wait runs out"""
+        mint = token_data.get("mint")
+        pending = self.awaiting_momentum
+        if mint in pending:
+            return
+        now = time.time()
+        window = self.control.get("momentum_window", "60s")
+        wait = self.control.get("momentum_wait_seconds", WINDOWS.get(window, 60))
+        pending[mint] = (token_data, now + wait)
+
+        # Insertion order is deadline order while the wait is unchanged
+        while pending:
+            oldest_mint, (_, deadline) = next(iter(pending.items()))
+            if len(pending) <= MOMENTUM_PENDING_MAX and deadline > now:
+                break
+            del pending[oldest_mint]
+
+    async def on_trade(self, mint: str, price: float, mcap: float) -> Optional[int]:
+        """
+        A trade on a watched mint: if the token is waiting for momentum,
+        evaluate it again and buy at this trade's price once it passes
+        """
+        pending = self.awaiting_momentum.get(mint)
+        if pending is None:
+            return None
+        token_data, deadline = pending
+        if time.time() > deadline:
+            del self.awaiting_momentum[mint]
+            return None
+
+        if not await self.evaluate_token(token_data):
+            if self.filters.rejected_by != "momentum":
+                del self.awaiting_momentum[mint]  # now fails on something else
+            return None
+        del self.awaiting_momentum[mint]
+        token_data["price"] = price
+        token_data["mcap"] = mcap
+        token_data["entry_reason"] = "momentum"
+        return await self.open_position(token_data)
+
+    async def on_copy_signal(self, signal: Dict) -> Optional[int]:
+        """
+        A watched wallet bought: run the copy filters and mirror the buy
+        """
+        start = time.perf_counter()
+        mint = signal["mint"]
+
+        token = await db.get_token(mint)
+        if token is None:
+            # Never recorded (bought before we saw its creation): no creator,
+            # so the blacklist and creator filters couldn't judge it
+            event_log.info("copy_signal", COPY_CONSOLE, mint=mint, label=signal["label"],
+                           wallet=signal["wallet"], sol_amount=signal["sol_amount"],
+                           symbol=mint[:16], action="skip (unknown token)")
+            return None
+        creator = token.get("creator_wallet")
+        creator_info = await db.get_creator(creator) if creator else None
+        token_data = {
+            "mint": mint,
+            "symbol": token.get("symbol"),
+            "name": token.get("name"),
+            "creator": creator,
+            "creator_score": creator_info.get("trust_score", 50) if creator_info else 50,
+            "size_sol": signal.get("size_sol"),
+            # Copies enter mid-life, at the price the watched wallet paid
+            "price": signal.get("price"),
+            "mcap": signal.get("mcap"),
+            "entry_reason": f"copy:{signal['label']}",
+        }
 
-        return True
+        self._load_control()
+        self.copy_filters.ensure_compiled(self, self.control, control.version)
+        decision = await self.copy_filters.run(token_data)
+        DECISION_SECONDS.observe(time.perf_counter() - start)
+
+        event_log.info("copy_signal", COPY_CONSOLE, mint=mint, label=signal["label"],
+                       wallet=signal["wallet"], sol_amount=signal["sol_amount"],
+                       symbol=token_data["symbol"] or mint[:16],
+                       action="copy" if decision else "skip")
+        if not decision:
+            return None
+        return await self.open_position(token_data)
 
     async def open_position(self, token_data: Dict) -> Optional[int]:
         """
@@ -127,12 +191,13 @@ class PaperTrader:
         creator = token_data.get("creator")
         creator_score = token_data.get("creator_score", 50)
 
-        # Get position size based on creator score
-        position_size = get_position_size(creator_score)
+        # Get position size based on creator score (copy trades may fix their size)
+        position_size = token_data.get("size_sol") or get_position_size(creator_score)
 
-        # Simulate entry price (in paper mode, we assume instant fill)
-        entry_price = 0.000001  # Initial pump.fun price is usually very small
-        entry_mcap = 30000  # ~30k SOL initial mcap typical
+        # Simulate entry price (in paper mode, we assume instant fill). New
+        # tokens carry no price yet, copy trades the one they were signalled at.
+        entry_price = token_data.get("price") or 0.000001  # Initial pump.fun price is usually very small
+        entry_mcap = token_data.get("mcap") or 30000  # ~30k SOL initial mcap typical
 
         # Open the trade
         trade_id = await db.open_paper_trade(
@@ -141,7 +206,8 @@ class PaperTrader:
             price=entry_price,
             mcap=entry_mcap,
             amount_sol=position_size,
-            creator_score=creator_score
+            creator_score=creator_score,
+            entry_reason=token_data.get("entry_reason", "new_token")
         )
 
         # Track locally
@@ -154,11 +220,12 @@ class PaperTrader:
             "creator_score": creator_score,
             "entry_time": datetime.now()
         }
+        OPEN_POSITIONS.set(len(self.active_positions))
 
-        print(f"\n[PAPER BUY] {token_data.get('symbol', 'Unknown')}")
-        print(f"  Position: {position_size} SOL")
-        print(f"  Creator Score: {creator_score}")
-        print(f"  Trade ID: {trade_id}")
+        event_log.info("paper_buy", BUY_CONSOLE, trade_id=trade_id, mint=mint,
+                       symbol=token_data.get("symbol", "Unknown"), creator=creator,
+                       size_sol=position_size, creator_score=creator_score,
+                       entry_reason=token_data.get("entry_reason", "new_token"))
 
         return trade_id
 
@@ -214,17 +281,15 @@ class PaperTrader:
 
         # Remove from local tracking
         del self.active_positions[mint]
+        OPEN_POSITIONS.set(len(self.active_positions))
 
         profit_sol = result.get("profit_sol", 0)
         profit_pct = result.get("profit_percent", 0)
         hold_time = result.get("hold_time_seconds", 0)
 
-        emoji = "+" if profit_sol > 0 else ""
-
-        print(f"\n[PAPER SELL] Trade #{trade_id}")
-        print(f"  Reason: {reason}")
-        print(f"  Profit: {emoji}{profit_sol:.4f} SOL ({emoji}{profit_pct:.1f}%)")
-        print(f"  Hold time: {hold_time}s")
+        event_log.info("paper_sell", SELL_CONSOLE, trade_id=trade_id, mint=mint,
+                       reason=reason, exit_price=exit_price, profit_sol=profit_sol,
+                       profit_percent=profit_pct, hold_time=hold_time)
 
         return result
 
@@ -245,20 +310,27 @@ class PaperTrader:
             "creators_tracked": stats.get("creators", {}).get("total", 0)
         }
 
+    async def write_status_snapshot(self):
+        """Write the snapshot served by `main.py --status`"""
+        try:
+            status = await self.get_status()
+            creators = await db.get_creator_leaderboard(10)
+            write_snapshot(status, creators)
+        except Exception as e:
+            print(f"[STATUS] Error writing snapshot: {e}")
+
     async def print_status(self):
         """Print formatted status"""
         status = await self.get_status()
-
-        print("\n" + "=" * 50)
-        print("CIPHER PAPER TRADING STATUS")
-        print("=" * 50)
-        print(f"Balance:        {status['balance']:.4f} SOL")
-        print(f"Total Profit:   {status['total_profit']:+.4f} SOL")
-        print(f"Total Trades:   {status['total_trades']}")
-        print(f"Win Rate:       {status['win_rate']:.1f}% ({status['wins']}W/{status['losses']}L)")
-        print(f"Open Positions: {status['open_positions']}/{MAX_OPEN_POSITIONS}")
-        print(f"Tokens Tracked: {status['tokens_tracked']}")
-        print(f"Creators:       {status['creators_tracked']}")
+        print_status(status)
+
+        filter_stats = self.filters.stats()
+        if filter_stats:
+            print("-" * 50)
+            print("FILTERS (execution order):")
+            for f in filter_stats:
+                print(f"  {f['name']:<20} pass {f['passed']:>7} | reject {f['rejected']:>7}"
+                      f" | {f['avg_us']:.1f}us avg")
         print("=" * 50)
 
 
@@ -0,0 +1,183 @@
+"""
+CIPHER Sniper Bot - Runtime Profiler
+Profiling hooks switched on and off through control.json without a restart:
+
+    "profiling": {
+        "slow_callback_ms": 0,     > 0: asyncio debug mode, log callbacks slower than this
+        "task_dump_interval": 0,   > 0: every N seconds print task counts and oldest tasks
+        "sample_seconds": 10,      length of an on-demand sampling capture
+        "capture_id": ""           change to any new value to trigger a capture
+    }
+
+While everything is off the only cost is one control.json stat() per poll.
+"""
+import asyncio
+import logging
+import sys
+import threading
+import time
+import weakref
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Optional
+
+from config import DATA_DIR, PROFILER_POLL_INTERVAL
+from control import control
+
+PROFILE_DIR = DATA_DIR / "profiles"
+SAMPLE_INTERVAL = 0.005  # 200 Hz
+
+
+class RuntimeProfiler:
+    """Watches control.json and applies the profiling settings to the running loop"""
+
+    def __init__(self, role: str = "main"):
+        self.role = role
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.loop_thread_id = 0
+        self.slow_callback_ms = 0.0
+        self.task_dump_interval = 0.0
+        self.capture_id = None
+        self._next_task_dump = 0.0
+        self._task_started = weakref.WeakKeyDictionary()  # task -> monotonic start
+        self._capture_thread: Optional[threading.Thread] = None
+
+    # ==================== SETTINGS ====================
+
+    def apply(self, settings: Dict):
+        """Apply a "profiling" block from control.json"""
+        self._set_slow_callback(float(settings.get("slow_callback_ms", 0) or 0))
+        self._set_task_dumps(float(settings.get("task_dump_interval", 0) or 0))
+
+        capture_id = settings.get("capture_id") or ""
+        if self.capture_id is None:
+            # Don't fire for whatever id was left in the file at startup
+            self.capture_id = capture_id
+        elif capture_id and capture_id != self.capture_id:
+            self.capture_id = capture_id
+            self.start_capture(float(settings.get("sample_seconds", 10) or 10), capture_id)
+
+    def _set_slow_callback(self, ms: float):
+        if ms == self.slow_callback_ms:
+            return
+        self.slow_callback_ms = ms
+
+        if ms > 0:
+            asyncio_logger = logging.getLogger("asyncio")
+            if not asyncio_logger.handlers:
+                handler = logging.StreamHandler()
+                handler.setFormatter(logging.Formatter("[ASYNCIO] %(message)s"))
+                asyncio_logger.addHandler(handler)
+            asyncio_logger.setLevel(logging.WARNING)
+            self.loop.slow_callback_duration = ms / 1000
+            self.loop.set_debug(True)
+            print(f"[PROFILE] Slow callback logging on (> {ms:g} ms)")
+        else:
+            self.loop.set_debug(False)
+            print("[PROFILE] Slow callback logging off")
+
+    def _set_task_dumps(self, interval: float):
+        if interval == self.task_dump_interval:
+            return
+        self.task_dump_interval = interval
+
+        if interval > 0:
+            self.loop.set_task_factory(self._task_factory)
+            self._next_task_dump = time.monotonic() + interval
+            print(f"[PROFILE] Task dumps every {interval:g}s")
+        else:
+            self.loop.set_task_factory(None)
+            print("[PROFILE] Task dumps off")
+
+    def _task_factory(self, loop, coro, **kwargs):
+        """Stamp creation time on every task while task dumps are on"""
+        task = asyncio.Task(coro, loop=loop, **kwargs)
+        self._task_started[task] = time.monotonic()
+        return task
+
+    # ==================== TASK DUMPS ====================
+
+    def dump_tasks(self, top: int = 5):
+        """Print live task counts by coroutine and the longest-running tasks"""
+        now = time.monotonic()
+        tasks = asyncio.all_tasks(self.loop)
+        by_coro = Counter()
+        ages = []
+        for task in tasks:
+            coro = task.get_coro()
+            name = getattr(coro, "__qualname__", repr(coro))
+            by_coro[name] += 1
+            # Tasks created before dumps were enabled count from first sighting
+            started = self._task_started.setdefault(task, now)
+            ages.append((now - started, name, task.get_name()))
+
+        print(f"\n[PROFILE] {self.role}: {len(tasks)} tasks")
+        for name, count in by_coro.most_common(top):
+            print(f"  {count:>5} x {name}")
+        print("  Longest running:")
+        for age, name, task_name in sorted(ages, reverse=True)[:top]:
+            print(f"  {age:>8.1f}s {name} ({task_name})")
+
+    # ==================== SAMPLING CAPTURE ====================
+
+    def start_capture(self, seconds: float, capture_id: str):
+        """Sample the loop thread's stack from a background thread"""
+        if self._capture_thread and self._capture_thread.is_alive():
+            print("[PROFILE] Capture already running, ignoring trigger")
+            return
+
+        self._capture_thread = threading.Thread(
+            target=self._sample, args=(seconds, capture_id),
+            name="cipher-profiler", daemon=True
+        )
+        self._capture_thread.start()
+        print(f"[PROFILE] Sampling for {seconds:g}s (capture '{capture_id}')")
+
+    def _sample(self, seconds: float, capture_id: str):
+        stacks = Counter()
+        target = self.loop_thread_id
+        deadline = time.monotonic() + seconds
+
+        while time.monotonic() < deadline:
+            frame = sys._current_frames().get(target)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})")
+                frame = frame.f_back
+            if stack:
+                stacks[";".join(reversed(stack))] += 1
+            time.sleep(SAMPLE_INTERVAL)
+
+        path = self._write_capture(stacks, capture_id)
+        print(f"[PROFILE] {sum(stacks.values())} samples written to {path}")
+
+    def _write_capture(self, stacks: Counter, capture_id: str) -> Path:
+        """Collapsed-stack format, loadable by flamegraph.pl and speedscope"""
+        PROFILE_DIR.mkdir(exist_ok=True)
+        safe_id = "".join(c for c in str(capture_id) if c.isalnum() or c in "-_")[:40]
+        path = PROFILE_DIR / f"{time.strftime('%Y%m%d_%H%M%S')}_{self.role}_{safe_id}.txt"
+        with open(path, "w") as f:
+            for stack, count in stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        return path
+
+    # ==================== WATCHER ====================
+
+    async def run(self):
+        """Poll control.json and run periodic task dumps until cancelled"""
+        self.loop = asyncio.get_running_loop()
+        self.loop_thread_id = threading.get_ident()
+
+        while True:
+            self.apply(control.get("profiling", {}))
+
+            if self.task_dump_interval > 0 and time.monotonic() >= self._next_task_dump:
+                self.dump_tasks()
+                self._next_task_dump = time.monotonic() + self.task_dump_interval
+
+            await asyncio.sleep(PROFILER_POLL_INTERVAL)
+
+
+# Singleton instance
+profiler = RuntimeProfiler()
@@ -0,0 +1,335 @@
+"""
+CIPHER Sniper Bot - Solana RPC Client
+Async JSON-RPC client for on-chain reads (bonding curves, balances,
+holders). Concurrent requests share one pooled session and are:
+
+    coalesced   identical in-flight requests share one future
+    cached      results are reused for RPC_CACHE_TTL seconds
+    batched     account reads merge into getMultipleAccounts, other calls
+                into one JSON-RPC batch per RPC_BATCH_WINDOW_MS
+    limited     token bucket of RPC_RATE_LIMIT calls per second
+"""
+import asyncio
+import base64
+import json
+import struct
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+from config import (
+    RPC_URL, RPC_COMMITMENT, RPC_MAX_CONNECTIONS, RPC_TIMEOUT, RPC_RETRIES,
+    RPC_RATE_LIMIT, RPC_BATCH_WINDOW_MS, RPC_BATCH_MAX, RPC_CACHE_TTL, RPC_CACHE_SIZE
+)
+from metrics import RPC_CALLS, RPC_REQUEST_SECONDS
+
+# Hot-path metric children, looked up once
+_CALL_SENT = RPC_CALLS.labels("sent")
+_CALL_CACHED = RPC_CALLS.labels("cached")
+_CALL_COALESCED = RPC_CALLS.labels("coalesced")
+_CALL_ERROR = RPC_CALLS.labels("error")
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_BACKOFF = 0.25  # seconds, doubled per attempt
+
+ACCOUNTS_PER_CALL = 100  # getMultipleAccounts limit
+LAMPORTS_PER_SOL = 1_000_000_000
+
+# Pump.fun bonding curve account: 8-byte discriminator, five u64 reserves, complete flag
+BONDING_CURVE = struct.Struct("<8xQQQQQ?")
+
+
+class RPCError(Exception):
+    """JSON-RPC error response or failed request"""
+
+    def __init__(self, message: str, code: Optional[int] = None):
+        super().__init__(message)
+        self.code = code
+
+
+def parse_account(value: Optional[Dict]) -> Optional[Dict]:
+    """getAccountInfo / getMultipleAccounts value with base64 data decoded"""
+    if value is None:
+        return None
+    data = value.get("data")
+    return {
+        "lamports": value.get("lamports", 0),
+        "owner": value.get("owner"),
+        "executable": value.get("executable", False),
+        "data": base64.b64decode(data[0]) if isinstance(data, list) and data else b"",
+    }
+
+
+def parse_bonding_curve(data: bytes) -> Optional[Dict]:
+    """Reserves of a pump.fun bonding curve account, None if the layout doesn't match"""
+    if len(data) < BONDING_CURVE.size:
+        return None
+    v_tokens, v_sol, r_tokens, r_sol, supply, complete = BONDING_CURVE.unpack_from(data)
+    return {
+        "virtual_token_reserves": v_tokens,
+        "virtual_sol_reserves": v_sol,
+        "real_token_reserves": r_tokens,
+        "real_sol": r_sol / LAMPORTS_PER_SOL,
+        "token_total_supply": supply,
+        "complete": complete,
+        "price_sol": (v_sol / LAMPORTS_PER_SOL) / (v_tokens / 1e6) if v_tokens else 0.0,
+    }
+
+
+class TokenBucket:
+    """Rate limiter: `rate` tokens per second, bursts up to `burst`"""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    async def acquire(self, n: float = 1):
+        n = min(n, self.burst)
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= n:
+                self.tokens -= n
+                return
+            await asyncio.sleep((n - self.tokens) / self.rate)
+
+
+class SolanaRPC:
+    """
+    One shared aiohttp session. Callers just await single reads; requests
+    issued within the batch window leave together in one HTTP round trip.
+    """
+
+    def __init__(self, url: str = RPC_URL):
+        self.url = url
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.bucket = TokenBucket(RPC_RATE_LIMIT, max(RPC_RATE_LIMIT, RPC_BATCH_MAX))
+        self.cache: OrderedDict = OrderedDict()   # key -> (expires_at, result)
+        self.inflight: Dict[tuple, asyncio.Future] = {}
+        self.uncached: set = set()                # in-flight keys requested with cache=False
+        self.pending_calls: List[tuple] = []      # (key, method, params)
+        self.pending_accounts: List[str] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._sending: set = set()
+        self.requests = 0  # HTTP round trips
+        self.calls = 0     # JSON-RPC calls sent
+        self.cache_hits = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    def _session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=RPC_MAX_CONNECTIONS, ttl_dns_cache=300)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=RPC_TIMEOUT, connect=RPC_TIMEOUT / 2),
+                headers={"Content-Type": "application/json"},
+            )
+        return self.session
+
+    # ==================== REQUESTS ====================
+
+    async def call(self, method: str, params: Optional[List] = None, cache: bool = True) -> Any:
+        """Any JSON-RPC method, batched with whatever else is pending"""
+        params = params or []
+        key = (method, json.dumps(params, sort_keys=True, separators=(",", ":")))
+        return await self._request(key, cache, lambda: self.pending_calls.append((key, method, params)))
+
+    async def get_account(self, pubkey: str) -> Optional[Dict]:
+        """Account info (data decoded), merged into getMultipleAccounts"""
+        return await self._request(("account", pubkey), True,
+                                   lambda: self.pending_accounts.append(pubkey))
+
+    async def get_accounts(self, pubkeys: List[str]) -> List[Optional[Dict]]:
+        return list(await asyncio.gather(*(self.get_account(p) for p in pubkeys)))
+
+    async def _request(self, key: tuple, cache: bool, enqueue) -> Any:
+        if cache:
+            hit = self.cache.get(key)
+            if hit is not None and hit[0] > time.monotonic():
+                self.cache_hits += 1
+                _CALL_CACHED.inc()
+                return hit[1]
+
+        future = self.inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            _CALL_COALESCED.inc()
+        else:
+            future = self.inflight[key] = asyncio.get_running_loop().create_future()
+            # Don't warn about errors nobody is left waiting for
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+            if not cache:
+                self.uncached.add(key)
+            enqueue()
+            self._schedule()
+        # Shielded: one caller giving up must not cancel the others
+        return await asyncio.shield(future)
+
+    def _schedule(self):
+        pending = len(self.pending_calls) + len(self.pending_accounts) / ACCOUNTS_PER_CALL
+        if pending >= RPC_BATCH_MAX:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                RPC_BATCH_WINDOW_MS / 1000, self._flush)
+
+    def _flush(self):
+        """Turn everything pending into JSON-RPC batches and send them"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        accounts, self.pending_accounts = self.pending_accounts, []
+        calls, self.pending_calls = self.pending_calls, []
+
+        batch = []
+        for i in range(0, len(accounts), ACCOUNTS_PER_CALL):
+            chunk = accounts[i:i + ACCOUNTS_PER_CALL]
+            params = [chunk, {"encoding": "base64", "commitment": RPC_COMMITMENT}]
+            batch.append(("getMultipleAccounts", params, chunk))
+        batch.extend((method, params, key) for key, method, params in calls)
+
+        for i in range(0, len(batch), RPC_BATCH_MAX):
+            task = asyncio.create_task(self._send(batch[i:i + RPC_BATCH_MAX]))
+            self._sending.add(task)
+            task.add_done_callback(self._sending.discard)
+
+    # ==================== TRANSPORT ====================
+
+    async def _post(self, payload) -> Any:
+        """POST with retries on connection errors, timeouts and retryable statuses"""
+        session = self._session()
+        for attempt in range(RPC_RETRIES + 1):
+            delay = RETRY_BACKOFF * 2 ** attempt
+            try:
+                start = time.perf_counter()
+                async with session.post(self.url, data=json.dumps(payload)) as resp:
+                    if resp.status in RETRY_STATUSES and attempt < RPC_RETRIES:
+                        retry_after = resp.headers.get("Retry-After", "")
+                        if retry_after.isdigit():
+                            delay = max(delay, int(retry_after))
+                        raise aiohttp.ClientResponseError(
+                            resp.request_info, resp.history, status=resp.status)
+                    resp.raise_for_status()
+                    body = await resp.json(content_type=None)
+                RPC_REQUEST_SECONDS.observe(time.perf_counter() - start)
+                self.requests += 1
+                return body
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                retryable = not isinstance(e, aiohttp.ClientResponseError) or e.status in RETRY_STATUSES
+                if attempt >= RPC_RETRIES or not retryable:
+                    raise
+                await asyncio.sleep(delay)
+
+    async def _send(self, batch: List[tuple]):
+        payload = [{"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+                   for i, (method, params, _) in enumerate(batch)]
+        await self.bucket.acquire(len(payload))
+        self.calls += len(payload)
+        _CALL_SENT.inc(len(payload))
+
+        try:
+            body = await self._post(payload[0] if len(payload) == 1 else payload)
+        except Exception as e:
+            error = RPCError(f"{type(e).__name__}: {e}" if str(e) else type(e).__name__)
+            for _, _, target in batch:
+                for key in self._keys(target):
+                    self._reject(key, error)
+            return
+
+        responses = {r.get("id"): r for r in (body if isinstance(body, list) else [body])
+                     if isinstance(r, dict)}
+        for i, (method, _, target) in enumerate(batch):
+            response = responses.get(i)
+            if response is None or "error" in response:
+                err = (response or {}).get("error") or {}
+                error = RPCError(err.get("message", "missing response"), err.get("code"))
+                for key in self._keys(target):
+                    self._reject(key, error)
+            elif method == "getMultipleAccounts" and isinstance(target, list):
+                values = (response.get("result") or {}).get("value") or []
+                for pubkey, value in zip(target, values + [None] * (len(target) - len(values))):
+                    self._resolve(("account", pubkey), parse_account(value))
+            else:
+                self._resolve(target, response.get("result"))
+
+    @staticmethod
+    def _keys(target) -> List[tuple]:
+        return [("account", p) for p in target] if isinstance(target, list) else [target]
+
+    def _resolve(self, key: tuple, result: Any):
+        future = self.inflight.pop(key, None)
+        if future is None or future.done():
+            return
+        if key in self.uncached:
+            self.uncached.discard(key)
+        else:
+            self.cache[key] = (time.monotonic() + RPC_CACHE_TTL, result)
+            self.cache.move_to_end(key)
+            if len(self.cache) > RPC_CACHE_SIZE:
+                self.cache.popitem(last=False)
+        future.set_result(result)
+
+    def _reject(self, key: tuple, error: Exception):
+        self.uncached.discard(key)
+        future = self.inflight.pop(key, None)
+        if future is None or future.done():
+            return
+        self.errors += 1
+        _CALL_ERROR.inc()
+        future.set_exception(error)
+
+    # ==================== ON-CHAIN READS ====================
+
+    async def get_balance(self, pubkey: str) -> float:
+        """SOL balance of a wallet"""
+        result = await self.call("getBalance", [pubkey, {"commitment": RPC_COMMITMENT}])
+        return result["value"] / LAMPORTS_PER_SOL
+
+    async def get_bonding_curve(self, curve: str) -> Optional[Dict]:
+        """Decoded pump.fun bonding curve, None if the account doesn't exist"""
+        account = await self.get_account(curve)
+        return parse_bonding_curve(account["data"]) if account else None
+
+    async def get_holder_stats(self, mint: str) -> Dict:
+        """
+        Share of supply held by the largest accounts (RPC returns at most 20).
+        Both calls leave in the same batch.
+        """
+        largest, supply = await asyncio.gather(
+            self.call("getTokenLargestAccounts", [mint, {"commitment": RPC_COMMITMENT}]),
+            self.call("getTokenSupply", [mint, {"commitment": RPC_COMMITMENT}]),
+        )
+        total = float(supply["value"]["amount"]) or 1.0
+        amounts = sorted((float(a["amount"]) for a in largest["value"]), reverse=True)
+        return {
+            "holders_sampled": len(amounts),
+            "top_holder_percent": amounts[0] / total * 100 if amounts else 0.0,
+            "top10_percent": sum(amounts[:10]) / total * 100,
+        }
+
+    def stats(self) -> Dict[str, int]:
+        return {"requests": self.requests, "calls": self.calls, "cache_hits": self.cache_hits,
+                "coalesced": self.coalesced, "errors": self.errors}
+
+    async def close(self):
+        """Fail pending requests and close the connection pool"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for task in list(self._sending):
+            task.cancel()
+        for key in list(self.inflight):
+            self._reject(key, RPCError("client closed"))
+        self.pending_calls, self.pending_accounts = [], []
+        if self.session and not self.session.closed:
+            await self.session.close()
+
+
+# Singleton instance
+rpc = SolanaRPC()
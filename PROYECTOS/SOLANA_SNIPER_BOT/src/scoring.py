@@ -0,0 +1,115 @@
+"""
+CIPHER Sniper Bot - Creator Scoring Model
+Scores every touched creator in one vectorized NumPy pass and writes the
+changed scores back with a single bulk UPSERT
+"""
+import asyncio
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+from config import GRADUATION_MCAP_SOL, SCORING_INTERVAL
+from database import db
+
+WATERMARK_KEY = "scoring_watermark"
+
+# Model weights (sum to 1) and shape parameters
+W_GRADUATION = 0.5
+W_PEAK = 0.3
+W_CADENCE = 0.2
+GOOD_GRADUATION_RATE = 0.2     # 20% graduation rate maxes that feature
+PRIOR_STRENGTH = 3.0           # finished tokens needed for half confidence
+CADENCE_MIN = 60.0             # launches a minute apart -> 0
+CADENCE_MAX = 86400.0          # a day or more apart -> 1
+
+RISK_LEVELS = np.array(["extreme", "high", "medium", "low", "unknown"], dtype=object)
+
+
+def score_features(features: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized scoring.
+    features columns: tokens, finished, graduated, avg_peak_mcap, max_peak_mcap, launch_span_s
+    Returns (trust_score 0-100, risk_level) arrays.
+    """
+    tokens, finished, graduated, avg_peak, _max_peak, span = features.T
+
+    # Graduation rate among finished tokens
+    grad_rate = np.divide(graduated, finished, out=np.zeros_like(finished), where=finished > 0)
+    grad_score = np.clip(grad_rate / GOOD_GRADUATION_RATE, 0, 1)
+
+    # Typical peak relative to the graduation market cap (log scale)
+    peak_score = np.clip(np.log1p(avg_peak) / np.log1p(GRADUATION_MCAP_SOL), 0, 1)
+
+    # Mean time between launches: serial launchers score low, single launch is neutral
+    gaps = np.divide(span, tokens - 1, out=np.full_like(span, np.nan), where=tokens > 1)
+    cadence = np.log(np.clip(gaps, CADENCE_MIN, CADENCE_MAX) / CADENCE_MIN) / np.log(CADENCE_MAX / CADENCE_MIN)
+    cadence_score = np.where(np.isnan(gaps), 0.5, cadence)
+
+    raw = W_GRADUATION * grad_score + W_PEAK * peak_score + W_CADENCE * cadence_score
+
+    # Shrink towards the neutral 50 until there is enough finished history
+    confidence = finished / (finished + PRIOR_STRENGTH)
+    scores = np.round(50 + (100 * raw - 50) * confidence, 2)
+
+    bucket = np.digitize(scores, [30, 50, 70])  # 0 extreme .. 3 low
+    bucket[finished == 0] = 4                    # unknown
+    return scores, RISK_LEVELS[bucket]
+
+
+def _score_rows(rows: List[tuple]) -> List[tuple]:
+    """Build the feature matrix, score it and return only changed (wallet, score, risk)"""
+    wallets, old_scores, old_risk, *columns = zip(*rows)
+    old_scores = np.array(old_scores, dtype=np.float64)  # NULL -> nan, always rewritten
+    old_risk = np.array(old_risk, dtype=object)
+    features = np.column_stack([np.array(c, dtype=np.float64) for c in columns])
+
+    scores, risk = score_features(features)
+    changed = np.flatnonzero((np.abs(scores - old_scores) >= 0.01) | (risk != old_risk))
+    return [(wallets[i], float(scores[i]), risk[i]) for i in changed]
+
+
+class CreatorScorer:
+    """
+    Re-scores creators whose aggregates changed since the last run
+    (creators.updated_at past the stored watermark)
+    """
+
+    def __init__(self):
+        self.creators_scored = 0
+        self.scores_changed = 0
+        self.running = False
+
+    async def score_once(self) -> Tuple[int, int]:
+        """One incremental pass, returns (creators scored, scores written)"""
+        after = float(await db.get_meta(WATERMARK_KEY, "0"))
+        until = time.time()
+
+        rows = await db.get_creator_features(after, until)
+        changed = await asyncio.to_thread(_score_rows, rows) if rows else []
+        await db.save_creator_scores(changed, until)
+
+        self.creators_scored += len(rows)
+        self.scores_changed += len(changed)
+        return len(rows), len(changed)
+
+    async def run(self):
+        """Score every SCORING_INTERVAL seconds until stopped"""
+        self.running = True
+        while self.running:
+            try:
+                start = time.perf_counter()
+                scored, changed = await self.score_once()
+                if scored:
+                    print(f"[SCORING] Scored {scored} creators, {changed} changed "
+                          f"({time.perf_counter() - start:.2f}s)")
+            except Exception as e:
+                print(f"[SCORING] Error: {e}")
+            await asyncio.sleep(SCORING_INTERVAL)
+
+    def stop(self):
+        self.running = False
+
+
+# Singleton instance
+creator_scorer = CreatorScorer()
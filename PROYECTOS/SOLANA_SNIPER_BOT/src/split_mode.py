@@ -0,0 +1,325 @@
+"""
+CIPHER Sniper Bot - Process-Split Mode
+Runs the WebSocket collector, the persistence writer and the trading engine
+as separate processes connected by shared memory event rings:
+
+    collector --(ring)--> writer --(ring)--> trader
+    parse JSON            SQLite writes      evaluate + paper trades
+"""
+import asyncio
+import multiprocessing
+import os
+import signal
+import time
+
+from config import (
+    RING_CAPACITY, RING_POLL_INTERVAL, SPLIT_STATS_INTERVAL, STATUS_SNAPSHOT_INTERVAL
+)
+from ipc import (
+    EVENT_NEW_TOKEN, EVENT_TRADE, MACHINE, ORDERED_STORES, EventRing, LatencyStats,
+    record_to_token_data
+)
+from collector import NEW_TOKEN_CONSOLE, PumpFunCollector
+from eventlog import event_log
+from events import NewToken, Trade
+import metrics
+from metrics import QUEUE_DEPTH
+from profiler import profiler
+from wallets import copy_signal, wallet_index
+from warm_start import WarmStart
+
+
+# Seconds all stages get to shut down after SIGINT before being terminated
+STOP_TIMEOUT = 10.0
+
+
+class RingCollector(PumpFunCollector):
+    """
+    Collector that forwards parsed events to the writer process
+    instead of touching the database
+    """
+
+    def __init__(self, ring: EventRing):
+        super().__init__()
+        self.ring = ring
+
+    async def _process_new_token(self, event: NewToken):
+        mint = event.mint
+        creator = event.creator
+
+        if not mint or not creator or mint in self.trade_subscriptions:
+            return
+
+        # The creator's initial buy rides along as sol_amount / token_amount
+        if self.ring.push(EVENT_NEW_TOKEN, mint, creator,
+                          name=event.name, symbol=event.symbol, uri=event.uri or "",
+                          sol_amount=event.sol_amount, token_amount=event.initial_buy):
+            self.tokens_collected += 1
+            await self._watch_trades(mint)
+
+    async def _process_trade(self, event: Trade):
+        if not event.mint or not (event.sol_amount and event.token_amount):
+            return
+
+        self.ring.push(EVENT_TRADE, event.mint, event.trader,
+                       sol_amount=event.sol_amount, token_amount=event.token_amount,
+                       mcap=event.mcap, is_buy=event.is_buy)
+
+
+def _print_stats(role: str, stats: LatencyStats, ring: EventRing):
+    s = stats.summary()
+    print(f"[SPLIT] {role}: {s['events']} events | {s['events_per_sec']:.0f} ev/s | "
+          f"latency p50 {s['p50_us']:.0f}us p99 {s['p99_us']:.0f}us max {s['max_us']:.0f}us | "
+          f"queue {ring.depth()} | dropped {ring.dropped} | oversize {ring.oversize}")
+
+
+# ==================== PROCESS ENTRY POINTS ====================
+
+async def _run_collector(out_name: str, capacity: int):
+    out = EventRing.attach(out_name, capacity)
+    collector = RingCollector(out)
+    warm = WarmStart("collector", collector=collector)
+    await warm.restore()
+    # Loaded here only to keep account trade subscriptions in sync
+    watcher = asyncio.create_task(wallet_index.run())
+    snapshots = asyncio.create_task(warm.run())
+    try:
+        await collector.start()
+    finally:
+        watcher.cancel()
+        snapshots.cancel()
+        await collector.stop()
+        await warm.save()
+        out.close()
+
+
+async def _run_writer(in_name: str, out_name: str, capacity: int):
+    from database import db
+    from analytics import lifecycle_worker
+    from scoring import creator_scorer
+
+    inp = EventRing.attach(in_name, capacity)
+    out = EventRing.attach(out_name, capacity)
+    stats = LatencyStats()
+    next_report = time.monotonic() + SPLIT_STATS_INTERVAL
+    depth = QUEUE_DEPTH.labels("raw_events")
+    collected = 0
+
+    await db.connect()
+    warm = WarmStart("writer", database=db)
+    await warm.restore()
+    # The writer owns the database, so lifecycle analytics and scoring run alongside it
+    lifecycle = asyncio.create_task(lifecycle_worker.run())
+    scoring = asyncio.create_task(creator_scorer.run())
+    snapshots = asyncio.create_task(warm.run())
+    maintenance = asyncio.create_task(db.run_maintenance())
+    try:
+        while True:
+            depth.set(inp.depth())
+            batch = inp.pop_batch()
+            if not batch:
+                await asyncio.sleep(RING_POLL_INTERVAL)
+            now_ns = time.monotonic_ns()
+
+            for rec in batch:
+                stats.observe(rec, now_ns)
+                kind, mint, wallet = rec[0], rec[9], rec[10]
+
+                if kind == EVENT_TRADE:
+                    price = rec[5] / rec[6] if rec[6] > 0 else 0
+                    await db.update_token_price(mint, price, rec[7])
+                    # The trader keeps the rolling trade flow
+                    out.push(EVENT_TRADE, mint, wallet, sol_amount=rec[5],
+                             token_amount=rec[6], mcap=rec[7], is_buy=bool(rec[1]),
+                             timestamp=rec[4])
+
+                elif kind == EVENT_NEW_TOKEN:
+                    if not await db.add_token(mint, rec[11], rec[12], wallet, rec[13] or None):
+                        continue
+
+                    # Enrich with creator stats so the trader never reads them back
+                    creator_info = await db.get_creator(wallet)
+                    tokens_by_creator = creator_info.get("tokens_created", 1) if creator_info else 1
+                    trust_score = creator_info.get("trust_score", 50) if creator_info else 50
+
+                    collected += 1
+                    event_log.info("new_token", NEW_TOKEN_CONSOLE, mint=mint, symbol=rec[12],
+                                   name=rec[11], creator=wallet, creator_tokens=tokens_by_creator,
+                                   creator_score=trust_score, collected=collected)
+
+                    out.push(EVENT_NEW_TOKEN, mint, wallet, name=rec[11],
+                             symbol=rec[12], uri=rec[13],
+                             creator_score=trust_score,
+                             creator_tokens=tokens_by_creator,
+                             sol_amount=rec[5], token_amount=rec[6],
+                             timestamp=rec[4])
+
+            if time.monotonic() >= next_report:
+                _print_stats("writer", stats, inp)
+                next_report = time.monotonic() + SPLIT_STATS_INTERVAL
+    finally:
+        lifecycle.cancel()
+        scoring.cancel()
+        snapshots.cancel()
+        maintenance.cancel()
+        await warm.save()
+        await db.close()
+        inp.close()
+        out.close()
+
+
+async def _run_trader(in_name: str, capacity: int):
+    from config import METADATA_FETCH
+    from database import db
+    from metadata import metadata_fetcher
+    from paper_trader import paper_trader
+    from rpc import rpc
+    from trade_flow import trade_flow
+
+    inp = EventRing.attach(in_name, capacity)
+    stats = LatencyStats()
+    next_report = time.monotonic() + SPLIT_STATS_INTERVAL
+    next_snapshot = 0.0
+    depth = QUEUE_DEPTH.labels("trader_events")
+
+    # Creator rows and ticks are written by the writer process: don't cache
+    # the former or open the tick file here
+    db.creator_cache_size = 0
+    db.attach_ticks = False
+    await db.connect()
+    await paper_trader.initialize()
+    warm = WarmStart("trader", trader=paper_trader)
+    await warm.restore()
+    watcher = asyncio.create_task(wallet_index.run())
+    snapshots = asyncio.create_task(warm.run())
+    try:
+        while True:
+            depth.set(inp.depth())
+            batch = inp.pop_batch()
+            if not batch:
+                await asyncio.sleep(RING_POLL_INTERVAL)
+            now_ns = time.monotonic_ns()
+
+            for rec in batch:
+                stats.observe(rec, now_ns)
+                # Trades and the creator's initial buy feed the rolling windows
+                if rec[5] > 0 and rec[6] > 0:
+                    trade_flow.update(rec[9], rec[10], rec[0] == EVENT_NEW_TOKEN or bool(rec[1]),
+                                      rec[5], rec[5] / rec[6], rec[4])
+                if rec[0] == EVENT_TRADE:
+                    await paper_trader.on_trade(rec[9], rec[5] / rec[6], rec[7])
+                    watched = wallet_index.match(rec[10], bool(rec[1]), rec[5])
+                    if watched:
+                        await paper_trader.on_copy_signal(
+                            copy_signal(watched, rec[9], rec[5], rec[5] / rec[6], rec[7]))
+                    continue
+
+                token_data = record_to_token_data(rec)
+                # Fetched here so the trader's filters see the results in-process
+                if METADATA_FETCH:
+                    metadata_fetcher.submit(token_data["mint"], token_data.get("uri"))
+                if await paper_trader.evaluate_token(token_data):
+                    await paper_trader.open_position(token_data)
+
+            now = time.monotonic()
+            if now >= next_snapshot:
+                await paper_trader.write_status_snapshot()
+                next_snapshot = now + STATUS_SNAPSHOT_INTERVAL
+            if now >= next_report:
+                _print_stats("trader", stats, inp)
+                next_report = now + SPLIT_STATS_INTERVAL
+    finally:
+        watcher.cancel()
+        snapshots.cancel()
+        await warm.save()
+        await paper_trader.print_status()
+        await paper_trader.write_status_snapshot()
+        await metadata_fetcher.close()
+        await rpc.close()
+        await db.close()
+        inp.close()
+
+
+async def _with_services(role: str, port_offset: int, stage):
+    """Run a stage next to its own metrics endpoint (one port per process) and profiler"""
+    from config import DATA_DIR, METRICS_PORT
+
+    port = METRICS_PORT + port_offset if METRICS_PORT else 0
+    profiler.role = role
+    event_log.role = role
+    services = [
+        asyncio.create_task(metrics.serve(port, DATA_DIR / f"metrics_{role}.json")),
+        asyncio.create_task(profiler.run()),
+    ]
+    try:
+        await stage
+    finally:
+        for task in services:
+            task.cancel()
+
+
+def _process_main(role: str, port_offset: int, coro_fn, *args):
+    """Child process entry: run one stage until interrupted"""
+    # Own process group: a terminal Ctrl-C reaches only the parent, which then
+    # sends each stage exactly one SIGINT (a second one would abort cleanup)
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+    try:
+        asyncio.run(_with_services(role, port_offset, coro_fn(*args)))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # Children leave through os._exit, which skips atexit
+        event_log.close()
+
+
+def run_split(capacity: int = RING_CAPACITY):
+    """Start the three stage processes and wait for them"""
+    if not ORDERED_STORES:
+        print(f"[SPLIT] The shared memory rings rely on x86-64 store ordering, "
+              f"{MACHINE} is not supported. Run without --split.")
+        raise SystemExit(1)
+
+    ctx = multiprocessing.get_context("spawn")
+    raw_ring = EventRing.create(capacity)      # collector -> writer
+    token_ring = EventRing.create(capacity)    # writer -> trader
+
+    processes = [
+        ctx.Process(target=_process_main, name="cipher-collector",
+                    args=("collector", 0, _run_collector, raw_ring.name, capacity)),
+        ctx.Process(target=_process_main, name="cipher-writer",
+                    args=("writer", 1, _run_writer, raw_ring.name, token_ring.name, capacity)),
+        ctx.Process(target=_process_main, name="cipher-trader",
+                    args=("trader", 2, _run_trader, token_ring.name, capacity)),
+    ]
+
+    print(f"[SPLIT] Ring capacity {capacity} records x2, starting 3 processes")
+    for p in processes:
+        p.start()
+        print(f"[SPLIT] {p.name} pid={p.pid}")
+
+    try:
+        # Any stage dying takes the pipeline down
+        while all(p.is_alive() for p in processes):
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        print("\n[SHUTDOWN] Stopping processes...")
+    finally:
+        # SIGINT, not SIGTERM: stages leave asyncio.run through their finally
+        # blocks, so the writer flushes buffered ticks and closes the database
+        for p in processes:
+            if p.is_alive():
+                try:
+                    os.kill(p.pid, signal.SIGINT)
+                except ProcessLookupError:
+                    pass
+        deadline = time.monotonic() + STOP_TIMEOUT
+        for p in processes:
+            p.join(timeout=max(0.0, deadline - time.monotonic()))
+        for p in processes:
+            if p.is_alive():
+                print(f"[SHUTDOWN] {p.name} did not stop in {STOP_TIMEOUT:.0f}s, terminating")
+                p.terminate()
+                p.join()
+        raw_ring.close()
+        token_ring.close()
@@ -0,0 +1,140 @@
+"""
+CIPHER Sniper Bot - Status Snapshot
+Small JSON snapshot written by the running bot so `--status` can print
+without starting the async stack. Only stdlib imports on purpose.
+"""
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+from config import DB_PATH, MAX_OPEN_POSITIONS, STATUS_FILE, STATUS_MAX_AGE
+
+
+def write_snapshot(status: dict, creators: list, path: Path = STATUS_FILE):
+    """Atomically write the status snapshot (called by the running bot)"""
+    snapshot = {
+        "written_at": time.time(),
+        "status": status,
+        "creators": [
+            {
+                "wallet": c["wallet"],
+                "trust_score": c["trust_score"],
+                "tokens_created": c["tokens_created"],
+            }
+            for c in creators
+        ],
+    }
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump(snapshot, f)
+    os.replace(tmp, path)
+
+
+def read_snapshot(path: Path = STATUS_FILE, max_age: float = STATUS_MAX_AGE):
+    """Return the snapshot if it exists and is fresh enough, else None"""
+    try:
+        with open(path, "r") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if time.time() - snapshot.get("written_at", 0) > max_age:
+        return None
+    return snapshot
+
+
+def read_from_db(db_path: Path = DB_PATH, limit: int = 10):
+    """
+    Read-only fallback when no fresh snapshot exists.
+    Never creates tables or takes write locks.
+    """
+    if not db_path.exists():
+        return None
+
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    conn.row_factory = sqlite3.Row
+    try:
+        row = conn.execute("SELECT * FROM paper_portfolio WHERE id = 1").fetchone()
+        portfolio = dict(row) if row else {}
+
+        open_positions = conn.execute(
+            "SELECT COUNT(*) FROM paper_trades WHERE status = 'open'"
+        ).fetchone()[0]
+        tokens = conn.execute("SELECT COUNT(*) FROM tokens").fetchone()[0]
+        creators_tracked = conn.execute(
+            "SELECT COUNT(*) FROM creators WHERE tokens_created >= 2"
+        ).fetchone()[0]
+
+        creators = conn.execute("""
+            SELECT wallet, trust_score, tokens_created FROM creators
+            WHERE is_blacklisted = FALSE AND tokens_created >= 2
+            ORDER BY trust_score DESC
+            LIMIT ?
+        """, (limit,)).fetchall()
+    except sqlite3.Error:
+        return None
+    finally:
+        conn.close()
+
+    total_trades = portfolio.get("total_trades") or 0
+    wins = portfolio.get("wins") or 0
+
+    return {
+        "written_at": None,
+        "status": {
+            "balance": portfolio.get("balance_sol") or 0,
+            "total_profit": portfolio.get("total_profit") or 0,
+            "total_trades": total_trades,
+            "wins": wins,
+            "losses": portfolio.get("losses") or 0,
+            "win_rate": (wins / max(total_trades, 1)) * 100,
+            "open_positions": open_positions,
+            "tokens_tracked": tokens,
+            "creators_tracked": creators_tracked,
+        },
+        "creators": [dict(c) for c in creators],
+    }
+
+
+def print_status(status: dict):
+    """Print formatted status"""
+    print("\n" + "=" * 50)
+    print("CIPHER PAPER TRADING STATUS")
+    print("=" * 50)
+    print(f"Balance:        {status['balance']:.4f} SOL")
+    print(f"Total Profit:   {status['total_profit']:+.4f} SOL")
+    print(f"Total Trades:   {status['total_trades']}")
+    print(f"Win Rate:       {status['win_rate']:.1f}% ({status['wins']}W/{status['losses']}L)")
+    print(f"Open Positions: {status['open_positions']}/{MAX_OPEN_POSITIONS}")
+    print(f"Tokens Tracked: {status['tokens_tracked']}")
+    print(f"Creators:       {status['creators_tracked']}")
+
+
+def print_creators(creators: list):
+    """Print the creator leaderboard"""
+    if creators:
+        print("\nTOP CREATORS:")
+        print("-" * 50)
+        for i, c in enumerate(creators, 1):
+            print(f"{i}. {c['wallet'][:20]}... | Score: {c['trust_score']:.1f} | Tokens: {c['tokens_created']}")
+
+
+def show_status():
+    """Print status from the snapshot, falling back to a read-only DB query"""
+    snapshot = read_snapshot()
+    if snapshot:
+        source = f"snapshot ({time.time() - snapshot['written_at']:.0f}s old)"
+    else:
+        snapshot = read_from_db()
+        source = "database (read-only)"
+
+    if not snapshot:
+        print("[STATUS] No snapshot or database found - has the bot run yet?")
+        return
+
+    print_status(snapshot["status"])
+    print(f"Source:         {source}")
+    print("=" * 50)
+    print_creators(snapshot["creators"])
@@ -0,0 +1,201 @@
+"""
+CIPHER Sniper Bot - Rolling Trade Flow
+Per-mint buy/sell volume, trade counts, unique traders and price velocity
+over the last 10s / 60s / 5m, updated in O(1) per trade
+"""
+import time
+from collections import OrderedDict, deque
+from typing import Dict, List, Optional
+
+from config import TRADE_FLOW_MAX_MINTS, TRADE_FLOW_MAX_EVENTS
+
+# Window label -> seconds
+WINDOWS = {"10s": 10, "60s": 60, "5m": 300}
+LONGEST_WINDOW = max(WINDOWS.values())
+LONGEST_LABEL = max(WINDOWS, key=WINDOWS.get)
+
+# Sweep idle mints every N updates
+SWEEP_EVERY = 1024
+
+
+class Window:
+    """
+    Running sums over one time window. Events are appended on the right and
+    expired from the left, each exactly once, so updates are O(1) amortized.
+    """
+    __slots__ = ("seconds", "events", "buy_sol", "sell_sol", "buys", "sells", "traders")
+
+    def __init__(self, seconds: int):
+        self.seconds = seconds
+        self.events = deque()  # (ts, trader, is_buy, sol, price)
+        self.buy_sol = 0.0
+        self.sell_sol = 0.0
+        self.buys = 0
+        self.sells = 0
+        self.traders: Dict[str, int] = {}  # trader -> trades in window
+
+    def add(self, event: tuple):
+        _, trader, is_buy, sol, _ = event
+        self.events.append(event)
+        if is_buy:
+            self.buy_sol += sol
+            self.buys += 1
+        else:
+            self.sell_sol += sol
+            self.sells += 1
+        self.traders[trader] = self.traders.get(trader, 0) + 1
+
+        if len(self.events) > TRADE_FLOW_MAX_EVENTS:
+            self._drop_oldest()
+
+    def expire(self, now: float):
+        cutoff = now - self.seconds
+        events = self.events
+        while events and events[0][0] <= cutoff:
+            self._drop_oldest()
+
+    def _drop_oldest(self):
+        _, trader, is_buy, sol, _ = self.events.popleft()
+        if is_buy:
+            self.buy_sol -= sol
+            self.buys -= 1
+        else:
+            self.sell_sol -= sol
+            self.sells -= 1
+        left = self.traders[trader] - 1
+        if left:
+            self.traders[trader] = left
+        else:
+            del self.traders[trader]
+        if not self.events:
+            self.buy_sol = self.sell_sol = 0.0  # don't let float drift accumulate
+
+    def features(self) -> Dict[str, float]:
+        events = self.events
+        trades = self.buys + self.sells
+        features = {
+            "trades": trades,
+            "buys": self.buys,
+            "sells": self.sells,
+            "buy_sol": self.buy_sol,
+            "sell_sol": self.sell_sol,
+            "net_sol": self.buy_sol - self.sell_sol,
+            "buy_ratio": self.buys / trades if trades else 0.0,
+            "unique_traders": len(self.traders),
+            "price_change_percent": 0.0,
+            "price_velocity": 0.0,  # percent per second
+        }
+        if len(events) >= 2 and events[0][4] > 0:
+            first_ts, first_price = events[0][0], events[0][4]
+            last_ts, last_price = events[-1][0], events[-1][4]
+            change = (last_price - first_price) / first_price * 100
+            features["price_change_percent"] = change
+            features["price_velocity"] = change / max(last_ts - first_ts, 1.0)
+        return features
+
+
+class MintFlow:
+    """All windows for one mint"""
+    __slots__ = ("windows", "last_ts", "last_price")
+
+    def __init__(self):
+        self.windows = {label: Window(seconds) for label, seconds in WINDOWS.items()}
+        self.last_ts = 0.0
+        self.last_price = 0.0
+
+
+class TradeFlow:
+    """
+    Rolling trade-flow aggregator for every mint with recent trades.
+    Mints are kept in least-recently-traded order: mints idle for longer than
+    the longest window are swept, and the count is capped at
+    TRADE_FLOW_MAX_MINTS by evicting the least recently traded.
+    """
+
+    def __init__(self, max_mints: int = TRADE_FLOW_MAX_MINTS):
+        self.max_mints = max_mints
+        self.mints: OrderedDict = OrderedDict()  # mint -> MintFlow
+        self.updates = 0
+        self.evicted = 0
+
+    def update(self, mint: str, trader: str, is_buy: bool, sol: float,
+               price: float, ts: Optional[float] = None):
+        """Record one trade"""
+        ts = ts or time.time()
+        flow = self.mints.get(mint)
+        if flow is None:
+            flow = self.mints[mint] = MintFlow()
+            if len(self.mints) > self.max_mints:
+                self.mints.popitem(last=False)
+                self.evicted += 1
+        else:
+            self.mints.move_to_end(mint)
+
+        event = (ts, trader, is_buy, sol, price)
+        for window in flow.windows.values():
+            window.expire(ts)
+            window.add(event)
+        flow.last_ts = ts
+        flow.last_price = price
+
+        self.updates += 1
+        if self.updates % SWEEP_EVERY == 0:
+            self.sweep(ts)
+
+    def sweep(self, now: Optional[float] = None):
+        """Drop mints with no trades inside the longest window"""
+        cutoff = (now or time.time()) - LONGEST_WINDOW
+        mints = self.mints
+        while mints:
+            mint, flow = next(iter(mints.items()))
+            if flow.last_ts > cutoff:
+                break
+            del mints[mint]
+            self.evicted += 1
+
+    def get(self, mint: str, now: Optional[float] = None) -> Optional[Dict[str, Dict[str, float]]]:
+        """Features per window label, or None if the mint has no recent trades"""
+        flow = self.mints.get(mint)
+        if flow is None:
+            return None
+        now = now or time.time()
+        result = {}
+        for label, window in flow.windows.items():
+            window.expire(now)
+            result[label] = window.features()
+        return result
+
+    def export(self) -> List[tuple]:
+        """
+        (mint, last_ts, last_price, events) per mint, least recently traded
+        first. Shorter windows hold a suffix of the longest window's events,
+        so those are all that's needed to rebuild every window.
+        """
+        return [(mint, flow.last_ts, flow.last_price, tuple(flow.windows[LONGEST_LABEL].events))
+                for mint, flow in self.mints.items()]
+
+    def restore(self, rows: List[tuple], now: Optional[float] = None):
+        """Rebuild windows from export() rows, skipping events that expired since"""
+        now = now or time.time()
+        for mint, last_ts, last_price, events in rows:
+            if last_ts <= now - LONGEST_WINDOW:
+                continue
+            flow = MintFlow()
+            for window in flow.windows.values():
+                cutoff = now - window.seconds
+                for event in events:
+                    if event[0] > cutoff:
+                        window.add(event)
+            flow.last_ts = last_ts
+            flow.last_price = last_price
+            self.mints[mint] = flow
+            self.mints.move_to_end(mint)
+        while len(self.mints) > self.max_mints:
+            self.mints.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        return {"mints": len(self.mints), "updates": self.updates, "evicted": self.evicted}
+
+
+# Singleton instance
+trade_flow = TradeFlow()
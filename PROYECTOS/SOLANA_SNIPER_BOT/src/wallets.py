@@ -0,0 +1,142 @@
+"""
+CIPHER Sniper Bot - Watched Wallet Index
+Hashed index of tracked wallets for copy trading, hot-reloaded from
+watched_wallets.json:
+
+    {
+        "<wallet>": {"label": "whale-1", "size_sol": 0.05, "min_sol": 0.5},
+        "<wallet>": {}
+    }
+
+A plain list of addresses works too. Every trade is checked with a single
+dict lookup.
+"""
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from config import WATCHED_WALLETS_FILE, WATCHED_WALLETS_POLL, COPY_MIN_SOL
+from metrics import COPY_SIGNALS
+
+
+class WatchedWallet:
+    """Per-wallet copy settings and hit counters"""
+    __slots__ = ("wallet", "label", "size_sol", "min_sol", "hits", "last_hit")
+
+    def __init__(self, wallet: str, label: str = "", size_sol: Optional[float] = None,
+                 min_sol: float = COPY_MIN_SOL):
+        self.wallet = wallet
+        self.label = label or wallet[:8]
+        self.size_sol = size_sol  # None: size by creator score like other entries
+        self.min_sol = min_sol
+        self.hits = 0
+        self.last_hit = 0.0
+
+
+def _parse(data) -> Dict[str, WatchedWallet]:
+    if isinstance(data, list):
+        return {w: WatchedWallet(w) for w in data if isinstance(w, str)}
+    if not isinstance(data, dict):
+        raise ValueError("expected a JSON object or list of wallets")
+
+    wallets = {}
+    for wallet, meta in data.items():
+        meta = meta if isinstance(meta, dict) else {}
+        size = meta.get("size_sol")
+        wallets[wallet] = WatchedWallet(
+            wallet,
+            label=meta.get("label", ""),
+            size_sol=float(size) if size is not None else None,
+            min_sol=float(meta.get("min_sol", COPY_MIN_SOL)),
+        )
+    return wallets
+
+
+class WalletIndex:
+    """
+    Wallet -> WatchedWallet dict, re-read only when the file's mtime changes.
+    Hit counters survive reloads for wallets that stay in the file.
+    """
+
+    def __init__(self, path: Path = WATCHED_WALLETS_FILE):
+        self.path = path
+        self.wallets: Dict[str, WatchedWallet] = {}
+        self.version = 0
+        self._mtime: Optional[int] = None
+        self.on_reload: List[Callable] = []  # async callbacks, run after each reload
+
+    def __len__(self) -> int:
+        return len(self.wallets)
+
+    def load(self) -> bool:
+        """Reload if the file changed, returns True if the index was replaced"""
+        try:
+            mtime = self.path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+
+        if mtime == self._mtime:
+            return False
+        self._mtime = mtime
+
+        if mtime is None:
+            wallets = {}
+        else:
+            try:
+                with open(self.path, 'r') as f:
+                    wallets = _parse(json.load(f))
+            except Exception as e:
+                print(f"[WALLETS] Error loading {self.path.name}: {e}")
+                return False
+
+        for wallet, watched in wallets.items():
+            old = self.wallets.get(wallet)
+            if old:
+                watched.hits, watched.last_hit = old.hits, old.last_hit
+
+        self.wallets = wallets
+        self.version += 1
+        print(f"[WALLETS] Watching {len(wallets)} wallets")
+        return True
+
+    def match(self, trader: str, is_buy: bool, sol_amount: float) -> Optional[WatchedWallet]:
+        """The watched wallet behind a copyable buy, or None"""
+        watched = self.wallets.get(trader)
+        if watched is None or not is_buy or sol_amount < watched.min_sol:
+            return None
+        watched.hits += 1
+        watched.last_hit = time.time()
+        COPY_SIGNALS.inc()
+        return watched
+
+    async def run(self):
+        """Poll the file for changes until cancelled (parsing runs off the event loop)"""
+        while True:
+            if await asyncio.to_thread(self.load):
+                for callback in self.on_reload:
+                    try:
+                        await callback()
+                    except Exception as e:
+                        print(f"[WALLETS] Reload callback failed: {e}")
+            await asyncio.sleep(WATCHED_WALLETS_POLL)
+
+
+def copy_signal(watched: WatchedWallet, mint: str, sol_amount: float,
+                price: float, mcap: float) -> Dict:
+    """Copy-trade signal payload for the paper trader"""
+    return {
+        "mint": mint,
+        "wallet": watched.wallet,
+        "label": watched.label,
+        "sol_amount": sol_amount,
+        "price": price,
+        "mcap": mcap,
+        "size_sol": watched.size_sol,
+        "timestamp": time.time(),
+    }
+
+
+# Singleton instance
+wallet_index = WalletIndex()
@@ -0,0 +1,218 @@
+"""
+CIPHER Sniper Bot - Warm Start Snapshots
+Periodic binary snapshots of the in-memory hot state, so a restart picks up
+where the last run stopped instead of rebuilding from full-table scans:
+
+    collector   recent mints (dedup + trade subscriptions), last event time
+    database    cached token peaks and creator rows
+    trader      open positions, rolling trade flow, metadata caches
+
+File layout: a fixed header (magic, version, written_at, length, crc32)
+followed by a pickled payload. Large collections are pickled in chunks of
+rows, yielding to the event loop in between. On load only rows changed
+since written_at are reconciled against SQLite.
+"""
+import asyncio
+import os
+import pickle
+import struct
+import time
+import zlib
+from typing import Dict, Optional
+
+from config import DATA_DIR, WARM_SNAPSHOT_INTERVAL, WARM_SNAPSHOT_MAX_AGE
+
+MAGIC = b"CIPHWARM"
+SNAPSHOT_VERSION = 1
+HEADER = struct.Struct("<8sHdII")  # magic, version, written_at, payload length, crc32
+
+# Rows per pickled chunk, bounding how long one chunk holds the event loop
+CHUNK_ROWS = 5000
+
+# Seconds subtracted from written_at when reconciling, for writes in flight
+RECONCILE_SLACK = 1.0
+
+
+def write_snapshot(path, payload: bytes, written_at: float):
+    """Atomic write: readers see the old snapshot or the new one, never half"""
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, SNAPSHOT_VERSION, written_at, len(payload), zlib.crc32(payload)))
+        f.write(payload)
+    os.replace(tmp, path)
+
+
+def read_snapshot(path) -> Optional[tuple]:
+    """(written_at, state, sections) or None if missing, from another version or corrupt"""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+            payload = f.read()
+    except FileNotFoundError:
+        return None
+
+    if len(header) < HEADER.size:
+        return None
+    magic, version, written_at, length, crc = HEADER.unpack(header)
+    if magic != MAGIC or version != SNAPSHOT_VERSION:
+        print(f"[WARM] Ignoring {path.name}: unknown format or version {version}")
+        return None
+    if len(payload) != length or zlib.crc32(payload) != crc:
+        print(f"[WARM] Ignoring {path.name}: checksum mismatch")
+        return None
+
+    state, chunks = pickle.loads(payload)
+    sections = {name: [row for chunk in parts for row in pickle.loads(chunk)]
+                for name, parts in chunks.items()}
+    return written_at, state, sections
+
+
+class WarmStart:
+    """
+    Snapshot / restore for one process role. Only the parts whose owner is
+    passed in are captured, so each split-mode process keeps its own file.
+    """
+
+    def __init__(self, role: str, collector=None, database=None, trader=None):
+        self.role = role
+        self.collector = collector
+        self.database = database
+        self.trader = trader
+        self.path = DATA_DIR / f"warm_{role}.snap"
+        self.written = 0
+
+    # ==================== CAPTURE ====================
+
+    async def _capture(self) -> tuple:
+        """Small values in state, row lists in sections (keys fixed at capture time)"""
+        state, sections = {}, {}
+        if self.collector is not None:
+            state["last_event_ts"] = self.collector.last_event_ts
+            sections["trade_subscriptions"] = list(self.collector.trade_subscriptions)
+        if self.database is not None:
+            state["scoring_watermark"] = await self.database.get_meta("scoring_watermark")
+            sections["peaks"] = list(self.database.peaks.items())
+            sections["creators"] = list(self.database.creators.items())
+        if self.trader is not None:
+            from metadata import metadata_fetcher
+            from trade_flow import trade_flow
+
+            state["positions"] = dict(self.trader.active_positions)
+            sections["trade_flow"] = trade_flow.export()
+            sections["metadata"] = list(metadata_fetcher.results.items())
+            sections["metadata_content"] = list(metadata_fetcher.content_cache.items())
+        return state, sections
+
+    async def _dumps(self) -> bytes:
+        state, sections = await self._capture()
+        chunks = {}
+        for name, rows in sections.items():
+            parts = chunks[name] = []
+            for i in range(0, len(rows), CHUNK_ROWS):
+                parts.append(pickle.dumps(rows[i:i + CHUNK_ROWS], protocol=5))
+                await asyncio.sleep(0)
+        return pickle.dumps((state, chunks), protocol=5)
+
+    async def save(self):
+        """Write a snapshot (pickled on the event loop in chunks, written off it)"""
+        start = time.perf_counter()
+        written_at = time.time()
+        try:
+            payload = await self._dumps()
+            await asyncio.to_thread(write_snapshot, self.path, payload, written_at)
+            self.written += 1
+        except Exception as e:
+            print(f"[WARM] Error writing snapshot: {e}")
+            return
+        if self.written == 1:
+            print(f"[WARM] {self.role} snapshot: {len(payload) / 1024:.0f} KB "
+                  f"in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    async def run(self):
+        """Snapshot every WARM_SNAPSHOT_INTERVAL seconds until cancelled"""
+        while True:
+            await asyncio.sleep(WARM_SNAPSHOT_INTERVAL)
+            await self.save()
+
+    # ==================== RESTORE ====================
+
+    async def restore(self) -> bool:
+        """
+        Load the latest snapshot and reconcile it against the database.
+        Call after the owners are initialized (db connected, positions loaded).
+        """
+        start = time.perf_counter()
+        try:
+            loaded = await asyncio.to_thread(read_snapshot, self.path)
+        except Exception as e:
+            print(f"[WARM] Error reading {self.path.name}: {e}")
+            return False
+        if loaded is None:
+            return False
+
+        written_at, state, sections = loaded
+        age = time.time() - written_at
+        if age > WARM_SNAPSHOT_MAX_AGE:
+            print(f"[WARM] Ignoring {self.path.name}: {age:.0f}s old")
+            return False
+        load_ms = (time.perf_counter() - start) * 1000
+
+        since = written_at - RECONCILE_SLACK
+        if self.collector is not None and "trade_subscriptions" in sections:
+            self._restore_collector(state, sections)
+        if self.database is not None and "peaks" in sections:
+            await self._restore_database(state, sections, since)
+        if self.trader is not None and "trade_flow" in sections:
+            self._restore_trader(state, sections)
+
+        gap = time.time() - (state.get("last_event_ts") or written_at)
+        print(f"[WARM] {self.role} restored in {(time.perf_counter() - start) * 1000:.0f} ms "
+              f"(load {load_ms:.0f} ms), blind for {gap:.0f}s")
+        return True
+
+    def _restore_collector(self, state: Dict, sections: Dict):
+        # Resubscribed on connect; also the recent-mint dedup set
+        subscriptions = self.collector.trade_subscriptions
+        for mint in sections["trade_subscriptions"]:
+            subscriptions.setdefault(mint, None)
+        self.collector.last_event_ts = state["last_event_ts"]
+
+    async def _restore_database(self, state: Dict, sections: Dict, since: float):
+        database = self.database
+        peaks = database.peaks
+        peaks.update(sections["peaks"])
+        # Peaks of tokens traded during the gap are re-read, not guessed
+        refreshed = 0
+        for mint, peak_price, peak_mcap in await database.get_token_peaks_since(since):
+            if mint in peaks:
+                peaks[mint] = [peak_price, peak_mcap]
+                refreshed += 1
+
+        if database.creator_cache_size > 0:
+            creators = database.creators
+            creators.update(sections["creators"])
+            if await database.get_meta("scoring_watermark") != state["scoring_watermark"]:
+                creators.clear()  # rescored since: cheaper to refill lazily than to diff
+            else:
+                for wallet in await database.get_creators_changed_since(since):
+                    creators.pop(wallet, None)
+
+        print(f"[WARM] Cache: {len(peaks)} token peaks ({refreshed} refreshed), "
+              f"{len(database.creators)} creators")
+
+    def _restore_trader(self, state: Dict, sections: Dict):
+        from metadata import metadata_fetcher
+        from trade_flow import trade_flow
+
+        # The database decides which positions are open; the snapshot only
+        # restores their in-memory form
+        positions = self.trader.active_positions
+        for mint, position in state["positions"].items():
+            if mint in positions:
+                positions[mint] = position
+
+        trade_flow.restore(sections["trade_flow"])
+        metadata_fetcher.results.update(sections["metadata"])
+        metadata_fetcher.content_cache.update(sections["metadata_content"])
+        print(f"[WARM] Trade flow for {len(trade_flow.mints)} mints, "
+              f"{len(metadata_fetcher.results)} metadata results")